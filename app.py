@@ -1,11 +1,30 @@
+import os
+
 from flask import Flask, render_template, request
 from flask_cors import CORS
 
 from routes.queues import queues_bp
+from services.instrumentation import SAMPLE_EVERY
+from services.queue_service import QueueService
 
 app = Flask(__name__)
 app.config["SECRET_KEY"] = "dev-secret-key"
 
+# Tamanho do cache de resultados (0 desativa)
+app.config["QUEUE_CACHE_SIZE"] = int(os.environ.get("QUEUE_CACHE_SIZE", 1024))
+QueueService.configure_cache(app.config["QUEUE_CACHE_SIZE"])
+
+# Armazenamento persistente de resultados (desativado sem QUEUE_STORE_PATH)
+app.config["QUEUE_STORE_PATH"] = os.environ.get("QUEUE_STORE_PATH")
+app.config["QUEUE_STORE_SIZE"] = int(os.environ.get("QUEUE_STORE_SIZE", 1_000_000))
+QueueService.configure_store(app.config["QUEUE_STORE_PATH"], app.config["QUEUE_STORE_SIZE"])
+
+# Instrumentação exposta em /metrics (QUEUE_METRICS=0 desativa); a latência de
+# uma em cada QUEUE_METRICS_SAMPLE chamadas é registrada
+app.config["QUEUE_METRICS"] = os.environ.get("QUEUE_METRICS", "1") != "0"
+app.config["QUEUE_METRICS_SAMPLE"] = int(os.environ.get("QUEUE_METRICS_SAMPLE", SAMPLE_EVERY))
+QueueService.configure_metrics(app.config["QUEUE_METRICS"], app.config["QUEUE_METRICS_SAMPLE"])
+
 # Habilitar CORS para permitir testes externos
 CORS(app)
 
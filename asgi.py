@@ -0,0 +1,338 @@
+"""
+Modo de serviço assíncrono (ASGI) para tráfego de alta concorrência.
+
+Expõe o mesmo contrato de ``/api/models`` e ``/api/calculate`` do blueprint
+Flask, mas sobre asyncio: o laço de eventos só lê requisições e escreve
+respostas, e os cálculos rodam em um executor limitado. Quando o executor
+está cheio a requisição é recusada na hora com 503 (backpressure); se o
+cliente desconecta, o cálculo ainda não iniciado é cancelado. Requisições
+idênticas simultâneas aguardam um único cálculo, sem ocupar o executor.
+
+Uso:
+    uvicorn asgi:app --host 0.0.0.0 --port 8000
+"""
+
+import asyncio
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from models.queue_factory import QueueFactory
+from models.registry import get_schema
+from services.calculation import calculation_response
+from services.instrumentation import PROMETHEUS_CONTENT_TYPE, SAMPLE_EVERY
+from services.queue_service import QueueService
+from services.result_cache import ResultCache
+from services.singleflight import SingleFlight
+
+# Tamanho máximo do corpo de uma requisição
+MAX_BODY_BYTES = 1024 * 1024
+
+Scope = Dict[str, Any]
+Receive = Callable[[], Awaitable[Dict[str, Any]]]
+Send = Callable[[Dict[str, Any]], Awaitable[None]]
+
+
+class BoundedExecutor:
+    """
+    Executor com limite de trabalhos em andamento (em execução + na fila)
+
+    O contador só é alterado no laço de eventos; a vaga é devolvida quando o
+    trabalho termina de fato, mesmo que quem o aguardava tenha desistido.
+    """
+
+    def __init__(self, max_workers: int, max_pending: int) -> None:
+        self.max_workers = max_workers
+        self.capacity = max_workers + max_pending
+        self.in_flight = 0
+        self.rejected = 0
+        self.__executor: Optional[ThreadPoolExecutor] = None
+
+    def start(self) -> None:
+        if self.__executor is None:
+            self.__executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="queue-calc"
+            )
+
+    def shutdown(self) -> None:
+        if self.__executor is not None:
+            self.__executor.shutdown(wait=False, cancel_futures=True)
+            self.__executor = None
+
+    def submit(self, function: Callable, *args) -> Optional[asyncio.Future]:
+        """Agenda a função ou devolve None se o limite foi atingido"""
+        if self.in_flight >= self.capacity:
+            self.rejected += 1
+            return None
+
+        self.start()
+        loop = asyncio.get_running_loop()
+        self.in_flight += 1
+        future = self.__executor.submit(function, *args)
+        future.add_done_callback(lambda _: loop.call_soon_threadsafe(self.__release))
+        # Cancelar o future asyncio cancela o trabalho se ele ainda não começou
+        return asyncio.wrap_future(future, loop=loop)
+
+    def __release(self) -> None:
+        self.in_flight -= 1
+
+
+class _Overloaded(Exception):
+    """Executor sem vagas para um novo cálculo"""
+
+
+class QueueASGIApp:
+    """Aplicação ASGI com as rotas de modelos e de cálculo"""
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_pending: Optional[int] = None,
+        timeout: float = 30.0,
+    ) -> None:
+        workers = max_workers or os.cpu_count() or 1
+        self.executor = BoundedExecutor(
+            workers, max_pending if max_pending is not None else 16 * workers
+        )
+        self.timeout = timeout
+        self.flights = SingleFlight()
+        self.routes: Dict[Tuple[str, str], Callable] = {
+            ("GET", "/api/models"): self.get_models,
+            ("POST", "/api/calculate"): self.calculate,
+            ("GET", "/api/coalescing"): self.coalescing_stats,
+            ("GET", "/metrics"): self.metrics,
+        }
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "lifespan":
+            await self.lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            return
+
+        method = scope["method"]
+        if method == "OPTIONS":
+            await self.respond(send, 204, None)
+            return
+
+        handler = self.routes.get((method, scope["path"]))
+        if handler is None:
+            known_path = any(path == scope["path"] for _, path in self.routes)
+            status = 405 if known_path else 404
+            await self.respond(send, status, {"error": "Rota não encontrada"})
+            return
+
+        await handler(scope, receive, send)
+
+    async def lifespan(self, receive: Receive, send: Send) -> None:
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                self.executor.start()
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                self.executor.shutdown()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def get_models(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Lista modelos disponíveis"""
+        await self.respond(send, 200, {"models": QueueFactory.get_available_models()})
+
+    async def calculate(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Calcula métricas de fila no executor, com backpressure e cancelamento"""
+        try:
+            data = await self.read_json(receive)
+        except ValueError as e:
+            await self.respond(send, 400, {"success": False, "error": str(e)})
+            return
+
+        if not data:
+            await self.respond(send, 400, {"error": "Nenhum dado fornecido"})
+            return
+        if not isinstance(data, dict):
+            await self.respond(
+                send, 400, {"success": False, "error": "Esperado um objeto JSON."}
+            )
+            return
+
+        model_type = data.get("model_type")
+        if not model_type:
+            await self.respond(send, 400, {"error": "model_type é obrigatório"})
+            return
+
+        try:
+            key = _flight_key(model_type, data)
+        except ValueError as e:
+            await self.respond(send, 400, {"success": False, "error": str(e)})
+            return
+
+        def start() -> asyncio.Future:
+            future = self.executor.submit(_calculate, model_type, data)
+            if future is None:
+                raise _Overloaded()
+            return future
+
+        computation = asyncio.ensure_future(self.flights.do_async(key, start))
+        disconnect = asyncio.ensure_future(_wait_disconnect(receive))
+        try:
+            done, _ = await asyncio.wait(
+                {computation, disconnect},
+                timeout=self.timeout,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+        finally:
+            disconnect.cancel()
+
+        if computation not in done:
+            computation.cancel()
+            if disconnect in done:
+                return  # Cliente desconectou: não há a quem responder
+            await self.respond(
+                send, 504, {"success": False, "error": "Tempo limite excedido."}
+            )
+            return
+
+        try:
+            status, body = computation.result()
+        except _Overloaded:
+            await self.respond(
+                send,
+                503,
+                {"success": False, "error": "Servidor sobrecarregado, tente novamente."},
+                headers=[(b"retry-after", b"1")],
+            )
+            return
+        await self.respond(send, status, body)
+
+    async def coalescing_stats(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Coalescência no laço de eventos e na camada de serviço"""
+        await self.respond(
+            send,
+            200,
+            {"asgi": self.flights.stats(), "service": QueueService.coalescing_stats()},
+        )
+
+    async def metrics(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Métricas do serviço no formato texto do Prometheus"""
+        payload = QueueService.metrics_text().encode()
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [
+                    (b"content-type", PROMETHEUS_CONTENT_TYPE.encode()),
+                    (b"content-length", str(len(payload)).encode()),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": payload})
+
+    async def read_json(self, receive: Receive) -> Any:
+        """
+        Lê o corpo inteiro da requisição e o decodifica
+
+        Raises:
+            ValueError: Se o corpo for grande demais ou não for JSON válido
+        """
+        chunks, size = [], 0
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                raise ValueError("Cliente desconectado.")
+            chunk = message.get("body", b"")
+            size += len(chunk)
+            if size > MAX_BODY_BYTES:
+                raise ValueError(f"Corpo excede o limite de {MAX_BODY_BYTES} bytes.")
+            chunks.append(chunk)
+            if not message.get("more_body", False):
+                break
+
+        body = b"".join(chunks)
+        if not body:
+            return None
+        try:
+            return json.loads(body)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"JSON inválido: {e.msg}") from e
+
+    async def respond(
+        self,
+        send: Send,
+        status: int,
+        body: Any,
+        headers: Optional[list] = None,
+    ) -> None:
+        """Envia uma resposta JSON completa (com CORS, como o app Flask)"""
+        payload = b"" if body is None else _dumps(body)
+        response_headers = [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(payload)).encode()),
+            (b"access-control-allow-origin", b"*"),
+            *(headers or []),
+        ]
+        if status == 204:
+            response_headers.append((b"access-control-allow-headers", b"*"))
+            response_headers.append((b"access-control-allow-methods", b"GET, POST"))
+        await send(
+            {"type": "http.response.start", "status": status, "headers": response_headers}
+        )
+        await send({"type": "http.response.body", "body": payload})
+
+
+def _calculate(model_type: str, data: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
+    """Executado no executor: mesmo tratamento de erros da rota Flask"""
+    try:
+        return 200, calculation_response(model_type, data)
+    except ValueError as e:
+        return 400, {"success": False, "error": str(e)}
+    except Exception as e:
+        return 500, {"success": False, "error": f"Erro interno: {str(e)}"}
+
+
+def _flight_key(model_type: str, data: Dict[str, Any]) -> Tuple:
+    """
+    Chave de coalescência: os parâmetros já convertidos pelo esquema (``"1"`` e
+    ``1.0`` coincidem) mais as opções que mudam o corpo da resposta
+
+    Raises:
+        ValueError: Se o modelo ou os parâmetros forem inválidos
+    """
+    params = get_schema(model_type).coerce(data)
+    if data.get("distribution"):
+        # "distribution" não é parâmetro de nenhum modelo, então não colide
+        params["distribution"] = {
+            "r": data.get("r"),
+            "percentiles": data.get("percentiles"),
+        }
+    return ResultCache.make_key(model_type, params)
+
+
+async def _wait_disconnect(receive: Receive) -> None:
+    while (await receive())["type"] != "http.disconnect":
+        pass
+
+
+def _dumps(body: Any) -> bytes:
+    # Mesmo formato do jsonify do Flask: chaves ordenadas, separadores compactos
+    # e quebra de linha final
+    return (json.dumps(body, sort_keys=True, separators=(",", ":")) + "\n").encode()
+
+
+QueueService.configure_cache(int(os.environ.get("QUEUE_CACHE_SIZE", 1024)))
+QueueService.configure_metrics(
+    os.environ.get("QUEUE_METRICS", "1") != "0",
+    int(os.environ.get("QUEUE_METRICS_SAMPLE", SAMPLE_EVERY)),
+)
+QueueService.configure_store(
+    os.environ.get("QUEUE_STORE_PATH"), int(os.environ.get("QUEUE_STORE_SIZE", 1_000_000))
+)
+
+app = QueueASGIApp(
+    max_workers=int(os.environ.get("ASGI_WORKERS", 0)) or None,
+    max_pending=(
+        int(os.environ["ASGI_MAX_PENDING"]) if "ASGI_MAX_PENDING" in os.environ else None
+    ),
+    timeout=float(os.environ.get("ASGI_TIMEOUT", 30)),
+)
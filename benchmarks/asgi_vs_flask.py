@@ -0,0 +1,170 @@
+"""
+Compara o app ASGI (``asgi.py``) com o blueprint Flask sob concorrência.
+
+Os dois são exercitados no próprio processo, sem rede: o Flask pelo cliente
+de teste em N threads (como um servidor WSGI com N workers) e o ASGI por N
+tarefas asyncio chamando a aplicação diretamente. Para cada cenário mede-se
+a vazão e a latência (p50/p99) de ``/api/calculate`` e, durante a carga, a
+latência de ``/api/models``, que mostra se requisições leves ficam presas
+atrás das pesadas.
+
+Uso:
+    python -m benchmarks.asgi_vs_flask --clients 64 --requests 2000
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+SCENARIOS: Dict[str, Callable[[random.Random], Dict[str, Any]]] = {
+    # Cálculos baratos e quase sempre distintos (cache frio)
+    "light": lambda rng: {
+        "model_type": "MMS",
+        "lamb": round(rng.uniform(1, 9), 6),
+        "mu": 1,
+        "s": 10,
+    },
+    # Somatórios grandes (população finita com milhares de clientes)
+    "heavy": lambda rng: {
+        "model_type": "MMSN",
+        "lamb": round(rng.uniform(0.001, 0.002), 8),
+        "mu": 1,
+        "s": 20,
+        "N": 5000,
+        "n": 1,
+    },
+}
+
+
+def _summary(latencies: List[float], elapsed: float) -> Dict[str, float]:
+    ordered = sorted(latencies)
+    return {
+        "requests": len(ordered),
+        "throughput": len(ordered) / elapsed if elapsed > 0 else float("inf"),
+        "p50_ms": 1000 * statistics.median(ordered),
+        "p99_ms": 1000 * ordered[min(len(ordered) - 1, int(0.99 * len(ordered)))],
+    }
+
+
+def run_flask(
+    payloads: List[Dict[str, Any]], clients: int, probes: int
+) -> Tuple[Dict[str, float], Dict[str, float]]:
+    from app import app
+
+    def call(payload: Optional[Dict[str, Any]]) -> float:
+        client = app.test_client()
+        start = time.perf_counter()
+        if payload is None:
+            client.get("/api/models")
+        else:
+            client.post("/api/calculate", json=payload)
+        return time.perf_counter() - start
+
+    with ThreadPoolExecutor(max_workers=clients + 1) as pool:
+        start = time.perf_counter()
+        futures = [pool.submit(call, payload) for payload in payloads]
+        probe_latencies = [call(None) for _ in range(probes)]
+        latencies = [future.result() for future in futures]
+        elapsed = time.perf_counter() - start
+
+    return _summary(latencies, elapsed), _summary(probe_latencies, elapsed)
+
+
+async def _asgi_call(app, method: str, path: str, body: Any) -> int:
+    payload = b"" if body is None else json.dumps(body).encode()
+    messages = [{"type": "http.request", "body": payload, "more_body": False}]
+    disconnected = asyncio.Event()
+    status = 0
+
+    async def receive() -> Dict[str, Any]:
+        if messages:
+            return messages.pop()
+        await disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: Dict[str, Any]) -> None:
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    scope = {"type": "http", "method": method, "path": path, "headers": []}
+    await app(scope, receive, send)
+    disconnected.set()
+    return status
+
+
+async def _run_asgi(
+    payloads: List[Dict[str, Any]], clients: int, probes: int
+) -> Tuple[Dict[str, float], Dict[str, float]]:
+    from asgi import QueueASGIApp
+
+    app = QueueASGIApp(max_pending=len(payloads))
+    app.executor.start()
+    queue: asyncio.Queue = asyncio.Queue()
+    for payload in payloads:
+        queue.put_nowait(payload)
+    latencies: List[float] = []
+    probe_latencies: List[float] = []
+
+    async def client() -> None:
+        while not queue.empty():
+            payload = queue.get_nowait()
+            start = time.perf_counter()
+            await _asgi_call(app, "POST", "/api/calculate", payload)
+            latencies.append(time.perf_counter() - start)
+
+    async def probe() -> None:
+        for _ in range(probes):
+            start = time.perf_counter()
+            await _asgi_call(app, "GET", "/api/models", None)
+            probe_latencies.append(time.perf_counter() - start)
+            await asyncio.sleep(0)
+
+    start = time.perf_counter()
+    await asyncio.gather(probe(), *(client() for _ in range(clients)))
+    elapsed = time.perf_counter() - start
+    app.executor.shutdown()
+    return _summary(latencies, elapsed), _summary(probe_latencies, elapsed)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark ASGI x Flask")
+    parser.add_argument("--clients", type=int, default=64)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--probes", type=int, default=50)
+    parser.add_argument(
+        "--scenario", choices=sorted(SCENARIOS), action="append", default=None
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    from services.queue_service import QueueService
+
+    for scenario in args.scenario or sorted(SCENARIOS):
+        rng = random.Random(args.seed)
+        count = args.requests if scenario == "light" else max(args.requests // 20, 1)
+        payloads = [SCENARIOS[scenario](rng) for _ in range(count)]
+
+        for name, runner in (
+            ("flask", lambda: run_flask(payloads, args.clients, args.probes)),
+            ("asgi", lambda: asyncio.run(_run_asgi(payloads, args.clients, args.probes))),
+        ):
+            QueueService.clear_cache()
+            calculate, models = runner()
+            print(
+                f"{scenario:6} {name:6} "
+                f"{calculate['throughput']:9.1f} req/s  "
+                f"calculate p50 {calculate['p50_ms']:8.2f} ms  "
+                f"p99 {calculate['p99_ms']:8.2f} ms  "
+                f"| models p50 {models['p50_ms']:7.2f} ms  "
+                f"p99 {models['p99_ms']:7.2f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,417 @@
+"""
+Micro-benchmarks de ``calculate_metrics`` de todos os modelos e da rota
+``/api/calculate``, com baseline em JSON para detectar regressões.
+
+Cada modelo registrado na ``QueueFactory`` tem casos representativos e
+extremos (s, K e N grandes), que é onde aparecem custos quadráticos e
+fatoriais. Os modelos são construídos a cada chamada, de modo que caches
+internos das instâncias não mascaram o custo; a rota é medida pelo cliente
+de teste do Flask com o cache de resultados desligado.
+
+O simulador é medido em tempo por evento e tem uma meta de vazão
+(``MIN_EVENTS_PER_SECOND``), avaliada na melhor rodada; ``run`` e
+``compare`` terminam com código 1 quando alguma meta não é cumprida. A outra
+meta é o custo da instrumentação no cálculo do M/M/1
+(``MAX_INSTRUMENTATION_OVERHEAD``), comparando rodadas alternadas com ela
+ligada e desligada.
+
+Uso:
+    python -m benchmarks.suite run --output benchmarks/baseline.json
+    python -m benchmarks.suite compare benchmarks/baseline.json --threshold 1.5
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import timeit
+from datetime import datetime, timezone
+from math import inf
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from models.queue_factory import QueueFactory
+from simulation.engine import simulate
+
+# Nome do caso -> (modelo, parâmetros brutos como chegariam na API)
+MODEL_CASES: Dict[str, Tuple[str, Dict[str, Any]]] = {
+    "MM1/typical": ("MM1", {"lamb": 0.8, "mu": 1, "n": 3, "r": 2, "t": 1}),
+    "MMS/typical": ("MMS", {"lamb": 3, "mu": 1, "s": 5, "n": 3, "r": 2, "t": 0.5}),
+    "MMS/large_s": (
+        "MMS",
+        {"lamb": 450, "mu": 1, "s": 500, "n": 480, "r": 480, "t": 0.1},
+    ),
+    "MM1K/typical": ("MM1K", {"lamb": 0.8, "mu": 1, "k": 20, "n": 3}),
+    "MM1K/large_k": ("MM1K", {"lamb": 0.99, "mu": 1, "k": 100_000, "n": 10}),
+    "MM1N/typical": ("MM1N", {"lamb": 0.01, "mu": 1, "N": 20, "n": 3}),
+    "MM1N/large_n": ("MM1N", {"lamb": 0.0001, "mu": 1, "N": 10_000, "n": 3}),
+    "MMSK/typical": ("MMSK", {"lamb": 3, "mu": 1, "s": 4, "k": 20, "n": 3}),
+    "MMSK/large_s_k": (
+        "MMSK",
+        {"lamb": 900, "mu": 1, "s": 1000, "k": 100_000, "n": 10},
+    ),
+    "MMSN/typical": ("MMSN", {"lamb": 0.1, "mu": 1, "s": 3, "N": 20, "n": 3}),
+    "MMSN/large_s_n": (
+        "MMSN",
+        {"lamb": 0.001, "mu": 1, "s": 50, "N": 10_000, "n": 3},
+    ),
+    "MG1/typical": ("MG1", {"lamb": 0.8, "mu": 1, "var": 0.5}),
+    "GGS/typical": ("GGS", {"lamb": 3, "mu": 1, "s": 4, "ca2": 0.5, "cs2": 2}),
+    "GGS/large_s": ("GGS", {"lamb": 900, "mu": 1, "s": 1000, "ca2": 1.5, "cs2": 0.3}),
+    "MCPCI/typical": ("MCPCI", {"mu": 5, "lamb_list": [0.5, 1, 1.5]}),
+    "MCPCI/many_classes": ("MCPCI", {"mu": 1000, "lamb_list": [1.0] * 500}),
+    "MCPSI/typical": ("MCPSI", {"mu": 1, "s": 3, "lamb_list": [0.5, 0.8, 1]}),
+    "MCPSI/large_s": ("MCPSI", {"mu": 1, "s": 500, "lamb_list": [0.9] * 500}),
+    "MCPCIS/typical": ("MCPCIS", {"mu": 1, "s": 3, "lamb_list": [0.5, 0.8, 1]}),
+    "MCPCIS/large_s": ("MCPCIS", {"mu": 1, "s": 500, "lamb_list": [0.9] * 500}),
+}
+
+# Casos medidos de ponta a ponta em /api/calculate
+ROUTE_CASES: Dict[str, Dict[str, Any]] = {
+    "route/MMS/typical": {"model_type": "MMS", "lamb": 3, "mu": 1, "s": 5},
+    "route/MMSK/distribution": {
+        "model_type": "MMSK",
+        "lamb": 30,
+        "mu": 1,
+        "s": 40,
+        "k": 2000,
+        "distribution": True,
+        "r": 50,
+        "percentiles": [0.5, 0.9, 0.99],
+    },
+    "route/MMSN/large_s_n": {
+        "model_type": "MMSN",
+        "lamb": 0.001,
+        "mu": 1,
+        "s": 50,
+        "N": 10_000,
+        "n": 3,
+    },
+}
+
+# Casos do simulador: (modelo, parâmetros, horizonte), com ρ alto para que
+# as filas não fiquem vazias
+SIMULATION_CASES: Dict[str, Tuple[str, Dict[str, Any], float]] = {
+    "sim/MM1": ("MM1", {"lamb": 0.9, "mu": 1}, 100_000),
+    "sim/MMS": ("MMS", {"lamb": 3.6, "mu": 1, "s": 4}, 25_000),
+    "sim/MMSK": ("MMSK", {"lamb": 3.6, "mu": 1, "s": 4, "k": 20}, 25_000),
+    "sim/MMSN": ("MMSN", {"lamb": 0.1, "mu": 1, "s": 3, "N": 40}, 30_000),
+    "sim/MG1": ("MG1", {"lamb": 0.8, "mu": 1, "var": 0.5}, 100_000),
+    "sim/MCPCI": ("MCPCI", {"mu": 1, "lamb_list": [0.3, 0.3, 0.3]}, 100_000),
+    "sim/MCPSI": ("MCPSI", {"mu": 1, "s": 2, "lamb_list": [0.5, 0.5, 0.6]}, 50_000),
+}
+
+# Vazão mínima do simulador em um núcleo
+MIN_EVENTS_PER_SECOND = 1_000_000
+
+# Casos com e sem instrumentação: (modelo, parâmetros brutos)
+OVERHEAD_CASES: Dict[str, Tuple[str, Dict[str, Any]]] = {
+    "overhead/MM1": ("MM1", {"lamb": 0.8, "mu": 1}),
+}
+
+# Custo relativo máximo da instrumentação no caminho de cálculo
+MAX_INSTRUMENTATION_OVERHEAD = 0.01
+
+
+def measure(function: Callable[[], Any], repeat: int = 5) -> Dict[str, float]:
+    """
+    Tempo por chamada em microssegundos (mediana e mínimo de ``repeat``
+    rodadas, cada uma com ao menos 0,2 s)
+    """
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+    per_call = [elapsed / number for elapsed in timer.repeat(repeat, number)]
+    return {
+        "median_us": 1e6 * statistics.median(per_call),
+        "min_us": 1e6 * min(per_call),
+        "number": number,
+    }
+
+
+def model_benchmarks(
+    selected: Optional[str] = None, repeat: int = 5
+) -> Dict[str, Dict[str, float]]:
+    """
+    Mede ``calculate_metrics`` (incluindo a construção do modelo) de cada caso
+
+    Raises:
+        ValueError: Se algum modelo registrado não tiver caso de benchmark
+    """
+    covered = {model_type for model_type, _ in MODEL_CASES.values()}
+    missing = set(QueueFactory.get_available_models()) - covered
+    if missing:
+        raise ValueError(
+            f"Modelos sem caso de benchmark: {', '.join(sorted(missing))}"
+        )
+
+    results = {}
+    for name, (model_type, data) in MODEL_CASES.items():
+        if selected and selected not in name:
+            continue
+        params = QueueFactory.build_params(model_type, data)
+        results[name] = measure(
+            lambda: QueueFactory.create_queue(model_type, **params).calculate_metrics(),
+            repeat,
+        )
+    return results
+
+
+def route_benchmarks(
+    selected: Optional[str] = None, repeat: int = 5
+) -> Dict[str, Dict[str, float]]:
+    """Mede ``/api/calculate`` pelo cliente de teste, sem cache de resultados"""
+    from app import app
+    from services.queue_service import QueueService
+
+    client = app.test_client()
+    size = QueueService.cache_stats()["max_size"]
+    QueueService.configure_cache(0)
+    try:
+        results = {}
+        for name, payload in ROUTE_CASES.items():
+            if selected and selected not in name:
+                continue
+            response = client.post("/api/calculate", json=payload)
+            if response.status_code != 200:
+                raise ValueError(f"{name}: {response.get_json().get('error')}")
+            results[name] = measure(
+                lambda: client.post("/api/calculate", json=payload), repeat
+            )
+        return results
+    finally:
+        QueueService.configure_cache(size)
+
+
+def simulation_benchmarks(
+    selected: Optional[str] = None, repeat: int = 5
+) -> Dict[str, Dict[str, float]]:
+    """
+    Mede o tempo por evento do simulador; ``events_per_s`` vem da melhor
+    rodada, menos sujeita a interferência de outros processos
+    """
+    results = {}
+    for name, (model_type, params, horizon) in SIMULATION_CASES.items():
+        if selected and selected not in name:
+            continue
+        per_event = []
+        for seed in range(repeat):
+            start = timeit.default_timer()
+            events = simulate(model_type, horizon, seed=seed, **params)["events"]
+            per_event.append((timeit.default_timer() - start) / events)
+        results[name] = {
+            "median_us": 1e6 * statistics.median(per_event),
+            "min_us": 1e6 * min(per_event),
+            "number": events,
+            "events_per_s": 1 / min(per_event),
+        }
+    return results
+
+
+def overhead_benchmarks(
+    selected: Optional[str] = None, repeat: int = 5
+) -> Dict[str, Dict[str, float]]:
+    """
+    Mede ``QueueService._compute`` com a instrumentação ligada e desligada
+
+    Fora da amostra, a chamada executa o mesmo código com a instrumentação
+    ligada ou desligada; o custo está só nas chamadas cronometradas. Como uma
+    diferença de 1% fica abaixo do ruído da medição, o lado ligado cronometra
+    todas as chamadas (``timed_overhead``) e ``overhead`` divide esse custo
+    pelo intervalo de amostragem. Blocos curtos dos dois lados se alternam,
+    em ordem trocada a cada par, e vale a mediana das razões.
+    """
+    from services.queue_service import QueueService
+
+    enabled = QueueService._metrics.enabled
+    sample_every = QueueService._metrics.sample_every
+    results = {}
+    try:
+        for name, (model_type, data) in OVERHEAD_CASES.items():
+            if selected and selected not in name:
+                continue
+            params = QueueFactory.build_params(model_type, data)
+            timer = timeit.Timer(lambda: QueueService._compute(model_type, params))
+            number, _ = timer.autorange()
+            # Blocos de ~10 ms
+            number = max(number // 20, 100)
+            ratios, per_call = [], []
+            for index in range(20 * repeat):
+                elapsed = {}
+                for state in (True, False) if index % 2 else (False, True):
+                    QueueService.configure_metrics(state, 1 if state else sample_every)
+                    elapsed[state] = timer.timeit(number)
+                ratios.append(elapsed[True] / elapsed[False])
+                per_call.append(elapsed[True] / number)
+            timed_overhead = statistics.median(ratios) - 1
+            results[name] = {
+                "median_us": 1e6 * statistics.median(per_call),
+                "min_us": 1e6 * min(per_call),
+                "number": number,
+                "timed_overhead": timed_overhead,
+                "overhead": timed_overhead / sample_every,
+            }
+    finally:
+        QueueService.configure_metrics(enabled, sample_every)
+    return results
+
+
+def missed_targets(results: Dict[str, Dict[str, float]]) -> List[str]:
+    """Casos que não cumprem a meta de vazão do simulador ou de instrumentação"""
+    missed = [
+        f"{name}: {result['events_per_s'] / 1e6:.2f}M eventos/s "
+        f"(meta {MIN_EVENTS_PER_SECOND / 1e6:g}M)"
+        for name, result in results.items()
+        if result.get("events_per_s", inf) < MIN_EVENTS_PER_SECOND
+    ]
+    missed += [
+        f"{name}: instrumentação custa {100 * result['overhead']:.1f}% "
+        f"(meta {100 * MAX_INSTRUMENTATION_OVERHEAD:g}%)"
+        for name, result in results.items()
+        if result.get("overhead", -inf) > MAX_INSTRUMENTATION_OVERHEAD
+    ]
+    return missed
+
+
+def environment() -> Dict[str, str]:
+    return {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "processor": platform.processor() or platform.machine(),
+        "system": platform.system(),
+    }
+
+
+def run(selected: Optional[str] = None, repeat: int = 5) -> Dict[str, Any]:
+    """Executa a suíte e devolve o documento no formato da baseline"""
+    results = model_benchmarks(selected, repeat)
+    results.update(route_benchmarks(selected, repeat))
+    results.update(simulation_benchmarks(selected, repeat))
+    results.update(overhead_benchmarks(selected, repeat))
+    return {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "environment": environment(),
+        "results": results,
+    }
+
+
+def compare(
+    baseline: Dict[str, Any], current: Dict[str, Any], threshold: float = 1.5
+) -> List[Dict[str, Any]]:
+    """
+    Compara as medianas de cada caso com a baseline
+
+    Um caso é regressão quando fica mais de ``threshold`` vezes mais lento
+    e melhora quando fica mais de ``threshold`` vezes mais rápido.
+    """
+    rows = []
+    names = list(baseline["results"]) + [
+        name for name in current["results"] if name not in baseline["results"]
+    ]
+    for name in names:
+        before = baseline["results"].get(name)
+        after = current["results"].get(name)
+        row = {
+            "name": name,
+            "baseline_us": before["median_us"] if before else None,
+            "current_us": after["median_us"] if after else None,
+            "ratio": None,
+        }
+        if before is None:
+            row["status"] = "novo"
+        elif after is None:
+            row["status"] = "ausente"
+        else:
+            row["ratio"] = after["median_us"] / before["median_us"]
+            if row["ratio"] > threshold:
+                row["status"] = "regressão"
+            elif row["ratio"] < 1 / threshold:
+                row["status"] = "melhora"
+            else:
+                row["status"] = "ok"
+        rows.append(row)
+    return rows
+
+
+def _format_us(value: Optional[float]) -> str:
+    if value is None:
+        return "-"
+    if value >= 1000:
+        return f"{value / 1000:.2f} ms"
+    if value < 10:
+        return f"{value:.2f} µs"
+    return f"{value:.1f} µs"
+
+
+def _print_results(results: Dict[str, Dict[str, float]]) -> None:
+    for name, result in results.items():
+        print(
+            f"{name:28} {_format_us(result['median_us']):>12}  "
+            f"(mín {_format_us(result['min_us'])})"
+        )
+
+
+def _print_comparison(rows: List[Dict[str, Any]]) -> None:
+    for row in rows:
+        ratio = f"{row['ratio']:.2f}x" if row["ratio"] is not None else "-"
+        print(
+            f"{row['name']:28} {_format_us(row['baseline_us']):>12} "
+            f"{_format_us(row['current_us']):>12} {ratio:>8}  {row['status']}"
+        )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmarks dos modelos de fila")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Executa a suíte")
+    run_parser.add_argument("--output", help="Arquivo JSON para gravar a baseline")
+
+    compare_parser = commands.add_parser("compare", help="Compara com uma baseline")
+    compare_parser.add_argument("baseline", help="Arquivo JSON da baseline")
+    compare_parser.add_argument("--threshold", type=float, default=1.5)
+    compare_parser.add_argument("--output", help="Arquivo JSON para gravar a medição")
+
+    for command in (run_parser, compare_parser):
+        command.add_argument("--filter", help="Executa apenas casos com este trecho")
+        command.add_argument("--repeat", type=int, default=5)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        document = run(args.filter, args.repeat)
+        _print_results(document["results"])
+    else:
+        with open(args.baseline, encoding="utf-8") as file:
+            baseline = json.load(file)
+        document = run(args.filter, args.repeat)
+        if baseline.get("environment") != document["environment"]:
+            print(
+                "Aviso: a baseline foi gerada em outro ambiente "
+                f"({baseline.get('environment')}).",
+                file=sys.stderr,
+            )
+        rows = compare(baseline, document, args.threshold)
+        if args.filter:
+            rows = [row for row in rows if args.filter in row["name"]]
+        _print_comparison(rows)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(document, file, indent=2, ensure_ascii=False)
+            file.write("\n")
+
+    missed = missed_targets(document["results"])
+    for line in missed:
+        print(f"Meta não cumprida: {line}", file=sys.stderr)
+    if missed:
+        return 1
+    if args.command == "compare":
+        return 1 if any(row["status"] == "regressão" for row in rows) else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
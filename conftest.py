@@ -0,0 +1,2 @@
+# Mantém a raiz do projeto no sys.path para que os testes importem
+# ``models``, ``services`` e ``routes`` como a aplicação
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Dict
+from typing import Dict, List
 
 
 class BaseQueueModel(ABC):
@@ -16,3 +16,9 @@ class BaseQueueModel(ABC):
     @abstractmethod
     def calculate_metrics(self) -> Dict:
         pass
+
+    def calculate_distribution(self) -> List[float]:
+        """Distribuição estacionária P0..Pmax (apenas modelos com estados finitos)"""
+        raise ValueError(
+            f"Distribuição de estados não disponível para o modelo {type(self).__name__}."
+        )
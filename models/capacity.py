@@ -0,0 +1,252 @@
+"""
+Capacidade máxima: maior λ que uma configuração suporta sob uma meta.
+
+W, Wq e Pk crescem com λ, então o λ máximo é a raiz de ``métrica(λ) - meta``,
+encontrada pelo método de Brent sobre um intervalo que a contém. Nos modelos
+com s servidores, log(Pn / P0) = n·log(a) + base[n], em que ``base`` só
+depende de s e K; ela é calculada uma vez por configuração (e reaproveitada
+entre as linhas de um lote), de modo que cada iteração custa uma única
+operação vetorizada.
+"""
+
+from math import inf, log
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+from models.erlang import mms_log_offsets
+from models.optimizer import MIN_SERVERS
+
+# Métricas que podem ser usadas como meta em cada modelo
+CAPACITY_METRICS = {
+    "MM1": ("W", "Wq"),
+    "MMS": ("W", "Wq"),
+    "MMSK": ("W", "Wq", "Pk"),
+    "MG1": ("W", "Wq"),
+}
+
+def max_arrival_rate(
+    model_type: str,
+    mu: float,
+    metric: str,
+    target: float,
+    s: int = 1,
+    k: Optional[int] = None,
+    var: Optional[float] = None,
+    tol: float = 1e-9,
+) -> Dict[str, float]:
+    """
+    Maior taxa de chegada que mantém a métrica dentro da meta
+
+    Args:
+        model_type: 'MM1', 'MMS', 'MMSK' ou 'MG1'
+        mu: Taxa de atendimento por servidor
+        metric: 'W', 'Wq' ou 'Pk' (apenas MMSK)
+        target: Valor máximo aceito para a métrica
+        s: Número de servidores (MMS e MMSK, ao menos ``MIN_SERVERS``)
+        k: Capacidade do sistema (MMSK)
+        var: Variância do tempo de serviço (MG1)
+        tol: Tolerância relativa em λ
+
+    Returns:
+        Dicionário com ``lamb`` (``inf`` se a meta nunca é violada), o valor
+        da métrica nesse ponto e a utilização ``Rho``
+
+    Raises:
+        ValueError: Se os parâmetros forem inválidos ou a meta for inatingível
+    """
+    evaluate, upper, supremum = _metric_function(model_type, mu, metric, s, k, var)
+    if target <= 0:
+        raise ValueError("A meta deve ser positiva.")
+    if target >= supremum:
+        return {"lamb": inf, metric: supremum, "Rho": inf}
+
+    low = 0.0
+    if evaluate(low) > target:
+        raise ValueError(
+            f"Meta inatingível: {metric} excede {target} mesmo com λ → 0."
+        )
+
+    if upper is not None:
+        # Modelos sem bloqueio: a métrica diverge quando λ → sμ
+        high = upper * (1 - 1e-12)
+        if evaluate(high) <= target:
+            return _result(model_type, evaluate, metric, high, mu, s)
+    else:
+        high = s * mu
+        # A meta está abaixo do supremo, logo algum λ finito a excede
+        while evaluate(high) <= target:
+            low, high = high, 2 * high
+
+    lamb = _brent(lambda x: evaluate(x) - target, low, high, tol)
+    return _result(model_type, evaluate, metric, lamb, mu, s)
+
+
+def max_arrival_rates(configs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Resolve várias configurações de uma vez (envelope de capacidade)
+
+    Cada item recebe os argumentos de ``max_arrival_rate`` mais
+    ``model_type``; erros são reportados por item em ``error``.
+    """
+    results = []
+    for config in configs:
+        try:
+            results.append(max_arrival_rate(**config))
+        except ValueError as e:
+            results.append({"error": str(e)})
+        except TypeError as e:
+            results.append({"error": f"Parâmetros inválidos: {str(e)}"})
+    return results
+
+
+def _result(model_type, evaluate, metric, lamb, mu, s) -> Dict[str, float]:
+    servers = s if model_type in ("MMS", "MMSK") else 1
+    return {"lamb": lamb, metric: evaluate(lamb), "Rho": lamb / (servers * mu)}
+
+
+def _metric_function(
+    model_type: str,
+    mu: float,
+    metric: str,
+    s: int,
+    k: Optional[int],
+    var: Optional[float],
+) -> tuple:
+    """
+    Função λ → métrica, o limite de estabilidade de λ (None se não houver) e
+    o supremo da métrica quando λ → ∞ (inf se ela diverge)
+    """
+    if model_type not in CAPACITY_METRICS:
+        raise ValueError(
+            f"Modelo '{model_type}' não suportado pelo cálculo de capacidade. "
+            f"Modelos disponíveis: {', '.join(CAPACITY_METRICS)}"
+        )
+    if metric not in CAPACITY_METRICS[model_type]:
+        raise ValueError(
+            f"Métrica '{metric}' não suportada para {model_type}. "
+            f"Métricas disponíveis: {', '.join(CAPACITY_METRICS[model_type])}"
+        )
+    if mu <= 0:
+        raise ValueError("Parâmetros inválidos: requer μ > 0.")
+
+    if model_type == "MM1":
+        if metric == "W":
+            return (lambda lamb: 1 / (mu - lamb)), mu, inf
+        # Mesma convenção do MM1 escalar (Wq reportado em minutos)
+        return (lambda lamb: 60 * lamb / (mu * (mu - lamb))), mu, inf
+
+    if model_type == "MG1":
+        second_moment = (var if var is not None else (1 / mu) ** 2) + (1 / mu) ** 2
+
+        def mg1(lamb: float) -> float:
+            # Pollaczek-Khinchine: Wq = λ·E[S²] / (2(1 - ρ))
+            wq = lamb * second_moment / (2 * (1 - lamb / mu))
+            return wq + 1 / mu if metric == "W" else wq
+
+        return mg1, mu, inf
+
+    # Mesmo limite dos modelos M/M/s e M/M/s/K
+    if s < MIN_SERVERS:
+        raise ValueError(f"Número de servidores deve ser ao menos {MIN_SERVERS}.")
+
+    if model_type == "MMS":
+        base = mms_log_offsets(s, s)
+        states = np.arange(s + 1)
+
+        def mms(lamb: float) -> float:
+            if lamb <= 0:
+                return 1 / mu if metric == "W" else 0.0
+            a = lamb / mu
+            terms = states * log(a) + base
+            log_b = terms[-1] - np.logaddexp.reduce(terms)
+            b = float(np.exp(log_b))
+            c = s * b / (s - a * (1 - b))  # Erlang C
+            wq = c / (s * mu - lamb)
+            return wq + 1 / mu if metric == "W" else wq
+
+        return mms, s * mu, inf
+
+    if k is None or k < 1:
+        raise ValueError("MMSK requer k ≥ 1.")
+    base = mms_log_offsets(s, k)
+    states = np.arange(k + 1)
+    queued = np.maximum(states - s, 0)
+    # Com λ → ∞ o sistema fica sempre cheio e a vazão tende a min(s, K)·μ
+    supremum = {
+        "W": k / (min(s, k) * mu),
+        "Wq": max(k - s, 0) / (s * mu),
+        "Pk": 1.0,
+    }[metric]
+
+    def mmsk(lamb: float) -> float:
+        if lamb <= 0:
+            return {"W": 1 / mu, "Wq": 0.0, "Pk": 0.0}[metric]
+        terms = states * log(lamb / mu) + base
+        probabilities = np.exp(terms - np.logaddexp.reduce(terms))
+        pk = float(probabilities[-1])
+        if metric == "Pk":
+            return pk
+        if pk >= 1:
+            return supremum
+        customers = queued if metric == "Wq" else states
+        return float(customers @ probabilities) / (lamb * (1 - pk))
+
+    return mmsk, None, supremum
+
+
+def _brent(
+    f: Callable[[float], float], low: float, high: float, tol: float
+) -> float:
+    """
+    Raiz de f em [low, high] pelo método de Brent, com f(low) ≤ 0 < f(high).
+
+    Devolve o maior ponto avaliado com f ≤ 0, para que a meta seja respeitada.
+    """
+    a, b = low, high
+    fa, fb = f(a), f(b)
+    c, fc = a, fa
+    d = e = b - a
+    feasible = a
+
+    for _ in range(200):
+        if (fb > 0) == (fc > 0):
+            c, fc = a, fa
+            d = e = b - a
+        if abs(fc) < abs(fb):
+            a, b, c = b, c, b
+            fa, fb, fc = fb, fc, fb
+
+        xtol = 2 * tol * max(abs(b), 1e-300)
+        half = (c - b) / 2
+        if abs(half) <= xtol or fb == 0:
+            break
+
+        if abs(e) >= xtol and abs(fa) > abs(fb):
+            # Interpolação inversa (secante ou quadrática)
+            ratio = fb / fa
+            if a == c:
+                p, q = 2 * half * ratio, 1 - ratio
+            else:
+                qa, rb = fa / fc, fb / fc
+                p = ratio * (2 * half * qa * (qa - rb) - (b - a) * (rb - 1))
+                q = (qa - 1) * (rb - 1) * (ratio - 1)
+            if p > 0:
+                q = -q
+            p = abs(p)
+            if 2 * p < min(3 * half * q - abs(xtol * q), abs(e * q)):
+                e, d = d, p / q
+            else:
+                d = e = half
+        else:
+            d = e = half
+
+        a, fa = b, fb
+        b += d if abs(d) > xtol else (xtol if half > 0 else -xtol)
+        fb = f(b)
+        if fb <= 0:
+            feasible = max(feasible, b)
+
+    if fb <= 0:
+        feasible = max(feasible, b)
+    return feasible
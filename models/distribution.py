@@ -0,0 +1,42 @@
+"""
+Métricas derivadas da distribuição estacionária P0..Pmax de um modelo.
+
+Todas as funções recebem a lista completa de probabilidades, obtida uma única
+vez por ``calculate_distribution``, e não recalculam nenhum Pn.
+"""
+
+from typing import Dict, Iterable, List
+
+
+def mean_customers_system(probabilities: List[float]) -> float:
+    """L = Σ n·Pn"""
+    return sum(n * p for n, p in enumerate(probabilities))
+
+
+def mean_customers_queue(probabilities: List[float], s: int) -> float:
+    """Lq = Σ (n - s)·Pn para n > s"""
+    return sum((n - s) * p for n, p in enumerate(probabilities) if n > s)
+
+
+def probability_exceeding(probabilities: List[float], r: int) -> float:
+    """Pr = P(N > r), probabilidade de haver mais de r clientes no sistema"""
+    if r < 0:
+        return 1.0
+    return max(0.0, 1 - sum(probabilities[: r + 1]))
+
+
+def percentile(probabilities: List[float], q: float) -> int:
+    """Menor n tal que P(N ≤ n) ≥ q"""
+    if not 0 <= q <= 1:
+        raise ValueError("Percentil deve estar entre 0 e 1.")
+    cumulative = 0.0
+    for n, p in enumerate(probabilities):
+        cumulative += p
+        if cumulative >= q - 1e-12:
+            return n
+    return len(probabilities) - 1
+
+
+def percentiles(probabilities: List[float], qs: Iterable[float]) -> Dict[str, int]:
+    """Calcula vários percentis de ocupação de uma só vez"""
+    return {str(q): percentile(probabilities, q) for q in qs}
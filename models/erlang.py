@@ -0,0 +1,156 @@
+"""
+Núcleo numérico compartilhado pelos modelos com múltiplos servidores.
+
+Em vez de calcular ``a**n / factorial(n)`` diretamente, os termos são obtidos
+por recorrência (Erlang B) ou acumulados em escala logarítmica, o que mantém
+o custo linear em s (ou N) e evita ``OverflowError`` para milhares de
+servidores.
+"""
+
+from functools import lru_cache
+from math import exp, inf, lgamma, log
+from typing import Iterable, List
+
+import numpy as np
+
+
+def erlang_b(s: int, a: float) -> float:
+    """
+    Probabilidade de bloqueio de Erlang B pela recorrência
+    B(0) = 1, B(n) = a·B(n-1) / (n + a·B(n-1)).
+
+    Args:
+        s: Número de servidores
+        a: Carga oferecida (λ / μ)
+    """
+    b = 1.0
+    for n in range(1, s + 1):
+        b = a * b / (n + a * b)
+    return b
+
+
+def erlang_c(s: int, a: float) -> float:
+    """
+    Probabilidade de espera de Erlang C, obtida a partir de Erlang B.
+
+    Args:
+        s: Número de servidores
+        a: Carga oferecida (λ / μ), com a < s
+    """
+    if a >= s:
+        raise ValueError("Sistema instável: a carga oferecida deve ser menor que s.")
+    b = erlang_b(s, a)
+    return s * b / (s - a * (1 - b))
+
+
+def erlang_b_array(s, a) -> np.ndarray:
+    """
+    Erlang B elemento a elemento (ver ``erlang_b``)
+
+    Os pontos são ordenados por s, de modo que o passo n da recorrência só
+    percorre o trecho final com s ≥ n: o custo é a soma dos s, e não o maior
+    s vezes o número de pontos.
+
+    Args:
+        s: Array de números de servidores
+        a: Array de cargas oferecidas (λ / μ)
+    """
+    s, a = np.broadcast_arrays(np.asarray(s, dtype=np.int64), np.asarray(a, dtype=float))
+    order = np.argsort(s, axis=None, kind="stable")
+    sorted_s = s.ravel()[order]
+    sorted_a = a.ravel()[order]
+    sorted_b = np.ones(sorted_a.shape)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for n in range(1, int(np.max(s, initial=0)) + 1):
+            start = np.searchsorted(sorted_s, n)
+            load = sorted_a[start:] * sorted_b[start:]
+            np.divide(load, n + load, out=sorted_b[start:])
+    b = np.empty(a.size)
+    b[order] = sorted_b
+    return b.reshape(a.shape)
+
+
+def erlang_c_array(s, a) -> np.ndarray:
+    """
+    Erlang C elemento a elemento (ver ``erlang_c``), a partir de
+    ``erlang_b_array``; pontos com a ≥ s resultam em ``nan``
+
+    Args:
+        s: Array de números de servidores
+        a: Array de cargas oferecidas (λ / μ)
+    """
+    s, a = np.broadcast_arrays(np.asarray(s, dtype=np.int64), np.asarray(a, dtype=float))
+    b = erlang_b_array(s, a)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        c = s * b / (s - a * (1 - b))
+    return np.where(a < s, c, np.nan)
+
+
+def safe_log(x: float) -> float:
+    """Logaritmo natural que devolve -inf para zero"""
+    return log(x) if x > 0 else -inf
+
+
+def log_sum_exp(values: Iterable[float]) -> float:
+    """Calcula log(Σ exp(v)) sem overflow"""
+    values = list(values)
+    peak = max(values, default=-inf)
+    if peak == -inf:
+        return -inf
+    return peak + log(sum(exp(v - peak) for v in values))
+
+
+def birth_death_log_terms(ratios: Iterable[float]) -> List[float]:
+    """
+    Log dos termos não normalizados π(n) / π(0) de um processo de
+    nascimento e morte, dado ratio[n - 1] = λ(n - 1) / μ(n).
+    """
+    terms = [0.0]
+    for ratio in ratios:
+        terms.append(terms[-1] + safe_log(ratio))
+    return terms
+
+
+def birth_death_distribution(ratios: Iterable[float]) -> List[float]:
+    """
+    Distribuição estacionária P0..Pmax de um processo de nascimento e morte
+    finito, normalizada em escala logarítmica.
+    """
+    terms = birth_death_log_terms(ratios)
+    total = log_sum_exp(terms)
+    return [exp(term - total) for term in terms]
+
+
+def mms_log_term(n: int, s: int, a: float) -> float:
+    """Log de Pn / P0 no M/M/s: a^n / n! para n < s e a^n / (s!·s^(n-s)) caso contrário"""
+    if n == 0:
+        return 0.0
+    if n <= s:
+        return n * safe_log(a) - lgamma(n + 1)
+    return n * safe_log(a) - lgamma(s + 1) - (n - s) * log(s)
+
+
+def mms_log_probability_system_empty(s: int, a: float) -> float:
+    """Log de P0 no M/M/s, com a < s"""
+    rho = a / s
+    terms = birth_death_log_terms(a / n for n in range(1, s + 1))
+    tail = terms[s] - log(1 - rho)
+    return -log_sum_exp(terms[:s] + [tail])
+
+
+@lru_cache(maxsize=256)
+def mms_log_offsets(s: int, k: int) -> np.ndarray:
+    """
+    log(Pn / P0) - n·log(a) no M/M/s para n = 0..K, que só depende de s e K:
+    -log(n!) se n ≤ s e -log(s!) - (n - s)·log(s) caso contrário.
+
+    Somado a n·log(a), dá todos os termos de uma vez para qualquer carga a.
+    O array devolvido é compartilhado (somente leitura).
+    """
+    n = np.arange(k + 1)
+    log_factorials = np.array([lgamma(i + 1) for i in range(min(s, k) + 1)])
+    offsets = -log_factorials[np.minimum(n, s)]
+    if k > s:
+        offsets = offsets - np.maximum(n - s, 0) * log(s)
+    offsets.setflags(write=False)
+    return offsets
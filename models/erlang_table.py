@@ -0,0 +1,194 @@
+"""
+Tabela pré-calculada de Erlang C sobre (s, ρ = a/s) com interpolação.
+
+A tabela é um único arquivo ``.npy`` carregado com ``mmap_mode="r"``: os
+processos que a abrem compartilham as mesmas páginas do sistema operacional,
+sem cópia. A linha s guarda C(s, ρ·s) em uma grade uniforme de ρ em
+[0, ρ_max]; a linha 0 (s = 0 não é um sistema válido) guarda os metadados
+da grade e o maior erro medido da interpolação linear, avaliado no ponto
+médio de cada célula durante a construção.
+
+Consultas fora da tabela (s > s_max ou ρ > ρ_max) usam ``erlang_c`` exato.
+
+Construção pela linha de comando:
+
+    python -m models.erlang_table build --output erlang_c.npy --s-max 500
+
+O uso é opcional: com ``ERLANG_C_TABLE=erlang_c.npy`` no ambiente, o modelo
+``GGS`` consulta a tabela por ``table_erlang_c``; sem a variável, ou para
+os demais chamadores, o cálculo continua exato.
+"""
+
+import argparse
+import os
+import sys
+from functools import lru_cache
+from typing import Any, List, Optional
+
+import numpy as np
+
+from models.erlang import erlang_c
+
+TABLE_VERSION = 1
+DEFAULT_S_MAX = 500
+DEFAULT_POINTS = 2049
+DEFAULT_RHO_MAX = 0.999
+
+# Variável de ambiente com o caminho da tabela usada por ``table_erlang_c``
+TABLE_ENV = "ERLANG_C_TABLE"
+
+# Posições dos metadados na linha 0
+_VERSION, _RHO_MAX, _MAX_ERROR = 0, 1, 2
+
+
+def build_table(
+    s_max: int = DEFAULT_S_MAX,
+    points: int = DEFAULT_POINTS,
+    rho_max: float = DEFAULT_RHO_MAX,
+) -> np.ndarray:
+    """
+    Monta a tabela (s_max + 1) × points com os metadados na linha 0
+
+    Raises:
+        ValueError: Se a grade for inválida
+    """
+    if s_max < 1 or points < 2 or not 0 < rho_max < 1:
+        raise ValueError("Requer s_max ≥ 1, points ≥ 2 e 0 < rho_max < 1.")
+
+    rho = np.linspace(0.0, rho_max, points)
+    table = np.empty((s_max + 1, points))
+    table[1:] = _erlang_c_grid(s_max, rho)
+
+    midpoints = (rho[:-1] + rho[1:]) / 2
+    interpolated = (table[1:, :-1] + table[1:, 1:]) / 2
+    max_error = float(np.max(np.abs(_erlang_c_grid(s_max, midpoints) - interpolated)))
+
+    table[0] = 0.0
+    table[0, _VERSION] = TABLE_VERSION
+    table[0, _RHO_MAX] = rho_max
+    table[0, _MAX_ERROR] = max_error
+    return table
+
+
+class ErlangCTable:
+    """Consulta de Erlang C sobre uma tabela mapeada em memória"""
+
+    def __init__(self, table: np.ndarray) -> None:
+        if table.ndim != 2 or table.shape[0] < 2 or table.shape[1] < 3:
+            raise ValueError("Tabela de Erlang C com formato inválido.")
+        if int(table[0, _VERSION]) != TABLE_VERSION:
+            raise ValueError(
+                f"Versão da tabela de Erlang C incompatível: {table[0, _VERSION]:g}."
+            )
+        # ndarray comum sobre as mesmas páginas: indexar um memmap cria um
+        # memmap a cada acesso
+        self.table = np.asarray(table)
+        self.s_max = table.shape[0] - 1
+        self.points = table.shape[1]
+        self.rho_max = float(table[0, _RHO_MAX])
+        self.max_error = float(table[0, _MAX_ERROR])
+        self._scale = float((self.points - 1) / self.rho_max)
+        self._last = float(self.points - 1)
+        # Consultas escalares por memoryview devolvem float do Python, sem
+        # criar escalares do NumPy
+        self._cells = memoryview(np.ascontiguousarray(self.table))
+
+    @classmethod
+    def load(cls, path: str) -> "ErlangCTable":
+        """Abre a tabela sem copiá-la para a memória do processo"""
+        return cls(np.load(path, mmap_mode="r"))
+
+    def erlang_c(self, s: int, a: float) -> float:
+        """
+        Probabilidade de espera C(s, a), interpolada quando (s, a/s) está na
+        tabela (erro até ``max_error``) e exata caso contrário
+
+        Raises:
+            ValueError: Se a ≥ s
+        """
+        if 1 <= s <= self.s_max:
+            position = a / s * self._scale
+            if 0 <= position < self._last:
+                index = int(position)
+                cells = self._cells
+                low = cells[s, index]
+                return low + (position - index) * (cells[s, index + 1] - low)
+        return erlang_c(s, a)
+
+    def lookup(self, s: Any, a: Any) -> np.ndarray:
+        """
+        ``erlang_c`` elemento a elemento sobre arrays; pontos fora da tabela
+        são calculados exatamente e pontos com a ≥ s resultam em ``nan``
+        """
+        s, a = np.broadcast_arrays(np.asarray(s, dtype=np.int64), np.asarray(a, dtype=float))
+        result = np.full(s.shape, np.nan)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            position = np.where(s >= 1, a / s, np.inf) * self._scale
+        inside = (s >= 1) & (s <= self.s_max) & (a >= 0) & (position < self._last)
+
+        index = position[inside].astype(np.int64)
+        rows = s[inside]
+        low = self.table[rows, index]
+        high = self.table[rows, index + 1]
+        result[inside] = low + (position[inside] - index) * (high - low)
+
+        for i in np.flatnonzero(~inside & (a < s) & (s >= 1) & (a >= 0)):
+            result.flat[i] = erlang_c(int(s.flat[i]), float(a.flat[i]))
+        return result
+
+
+@lru_cache(maxsize=None)
+def configured_table() -> Optional[ErlangCTable]:
+    """Tabela indicada em ``ERLANG_C_TABLE``, aberta uma vez por processo"""
+    path = os.environ.get(TABLE_ENV)
+    return ErlangCTable.load(path) if path else None
+
+
+def table_erlang_c(s: int, a: float) -> float:
+    """``erlang_c`` pela tabela configurada, ou exato se não houver tabela"""
+    table = configured_table()
+    if table is None:
+        return erlang_c(s, a)
+    return table.erlang_c(s, a)
+
+
+def _erlang_c_grid(s_max: int, rho: np.ndarray) -> np.ndarray:
+    """
+    C(s, ρ·s) para s = 1..s_max e cada ρ: a recorrência de Erlang B avança
+    todas as linhas com s ≥ n de uma vez
+    """
+    servers = np.arange(1, s_max + 1)[:, None]
+    a = servers * rho[None, :]
+    b = np.ones_like(a)
+    for n in range(1, s_max + 1):
+        rows = slice(n - 1, None)
+        b[rows] = a[rows] * b[rows] / (n + a[rows] * b[rows])
+    return servers * b / (servers - a * (1 - b))
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    build_parser = commands.add_parser("build", help="Gera a tabela em um arquivo .npy")
+    build_parser.add_argument("--output", required=True, help="Arquivo .npy de saída")
+    build_parser.add_argument("--s-max", type=int, default=DEFAULT_S_MAX)
+    build_parser.add_argument("--points", type=int, default=DEFAULT_POINTS)
+    build_parser.add_argument("--rho-max", type=float, default=DEFAULT_RHO_MAX)
+    args = parser.parse_args(argv)
+
+    try:
+        table = build_table(args.s_max, args.points, args.rho_max)
+    except ValueError as e:
+        print(f"Erro: {e}", file=sys.stderr)
+        return 2
+    np.save(args.output, table)
+    print(
+        f"{args.output}: s = 1..{args.s_max}, {args.points} pontos em "
+        f"ρ ∈ [0, {args.rho_max:g}], erro máximo da interpolação "
+        f"{table[0, _MAX_ERROR]:.2e}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,66 @@
+from typing import Dict
+
+from models.base_queue import BaseQueueModel
+from models.erlang_table import table_erlang_c
+
+
+class GGS(BaseQueueModel):
+    """
+    Aproximação G/G/s a partir dos coeficientes de variação ao quadrado (SCV)
+    dos intervalos entre chegadas (ca2) e dos tempos de atendimento (cs2)
+
+    Allen-Cunneen: Wq ≈ C(s, a)/(sμ - λ)·(ca² + cs²)/2, em que C é a
+    probabilidade de espera de Erlang C; com s = 1 reduz-se à fórmula de
+    Kingman. Com ca2 = cs2 = 1 é exata (M/M/s), e com ca2 = 1 e s = 1
+    coincide com Pollaczek-Khinchine (M/G/1). A fila é ilimitada, por isso o
+    modelo não recebe capacidade k.
+    """
+
+    def __init__(
+        self,
+        lamb: float,
+        mu: float,
+        s: int,
+        ca2: float = 1.0,
+        cs2: float = 1.0,
+    ) -> None:
+        super().__init__(lamb, mu, 0, s)
+        self.rho = lamb / (s * mu)  # Taxa de utilização do sistema
+        self.a = lamb / mu  # Carga oferecida
+        self.ca2 = ca2  # SCV dos intervalos entre chegadas
+        self.cs2 = cs2  # SCV dos tempos de atendimento
+
+        if ca2 < 0 or cs2 < 0:
+            raise ValueError("ca2 e cs2 devem ser não negativos.")
+        if self.rho >= 1:
+            raise ValueError("Sistema instável: λ deve ser menor que s*μ.")
+
+    def calculate_metrics(self) -> Dict[str, float]:
+        c = table_erlang_c(self.s, self.a)  # Probabilidade de espera (Erlang C)
+        wq = self.__calculate_avg_time_queue(c)
+        lq = self.__calculate_avg_customers_queue(wq)
+        w = self.__calculate_avg_time_system(wq)
+        l = self.__calculate_avg_customers_system(lq)
+
+        return {
+            "Rho": round(self.rho, 4),
+            "Pw": round(c, 4),
+            "Lq": round(lq, 4),
+            "L": round(l, 4),
+            "Wq": round(wq, 4),
+            "W": round(w, 4),
+        }
+
+    def __calculate_avg_time_queue(self, c: float) -> float:
+        if self.lamb == 0:
+            return 0.0
+        return c / (self.s * self.mu - self.lamb) * (self.ca2 + self.cs2) / 2
+
+    def __calculate_avg_customers_queue(self, wq: float) -> float:
+        return self.lamb * wq
+
+    def __calculate_avg_time_system(self, wq: float) -> float:
+        return wq + 1 / self.mu
+
+    def __calculate_avg_customers_system(self, lq: float) -> float:
+        return lq + self.a
@@ -1,7 +1,9 @@
-from math import factorial
-from typing import Dict
+from math import inf
+from typing import Dict, List, Optional
 
 from models.base_queue import BaseQueueModel
+from models.erlang import erlang_b
+from models.priority import build_priority_metrics, prefix_sums, resolve_lamb_list
 
 
 class MCPSI(BaseQueueModel):
@@ -11,21 +13,21 @@ class MCPSI(BaseQueueModel):
         mu: float,
         k: int,
         s: int,
-        lamb1: float,
-        lamb2: float,
-        lamb3: float,
-        lamb4: float,
+        lamb1: float = 0.0,
+        lamb2: float = 0.0,
+        lamb3: float = 0.0,
+        lamb4: float = 0.0,
+        lamb_list: Optional[List[float]] = None,
     ) -> None:
-        super().__init__(lamb, mu, k, s)
+        # lamb_list aceita qualquer número de classes; lamb1..lamb4 são mantidos
+        # por compatibilidade
+        self.lamb_list = resolve_lamb_list(lamb_list, [lamb1, lamb2, lamb3, lamb4])
+        super().__init__(lamb or sum(self.lamb_list), mu, k, s)
 
-        self.rho = lamb / (s * mu)
+        self.rho = self.lamb / (s * mu)
         if self.rho >= 1:
             raise ValueError("Sistema instável: requer ρ < 1.")
-        self.lamb1 = lamb1
-        self.lamb2 = lamb2
-        self.lamb3 = lamb3
-        self.lamb4 = lamb4
-        self.r = lamb / mu
+        self.r = self.lamb / mu
 
         if self.lamb < 0 or self.mu <= 0 or self.s < 1:
             raise ValueError(
@@ -33,137 +35,40 @@ class MCPSI(BaseQueueModel):
             )
 
     def calculate_metrics(self) -> Dict[str, float]:
-        # classe 1
-        # Esses números serão usados em uma função de somar lambdas mais abaixo
-        w1 = self.__calculate_avg_time_system(0, 1)
-        wq1 = self.__calculate_avg_time_queue(w1)
-        l1 = self.__calculate_avg_customers_system(w1, self.lamb1)
-        lq1 = self.__calculate_avg_customers_queue(l1, self.lamb1)
-
-        # classe 2
-        w2 = self.__calculate_avg_time_system(1, 2)
-        wq2 = self.__calculate_avg_time_queue(w2)
-        l2 = self.__calculate_avg_customers_system(w2, self.lamb2)
-        lq2 = self.__calculate_avg_customers_queue(l2, self.lamb2)
-
-        # classe 3
-        if self.lamb3 == 0:
-            w3 = 0
-            wq3 = 0
-            l3 = 0
-            lq3 = 0
-        else:
-            w3 = self.__calculate_avg_time_system(2, 3)
-            wq3 = self.__calculate_avg_time_queue(w3)
-            l3 = self.__calculate_avg_customers_system(w3, self.lamb3)
-            lq3 = self.__calculate_avg_customers_queue(l3, self.lamb3)
-        # classe 4
-        if self.lamb4 == 0:
-            w4 = 0
-            wq4 = 0
-            l4 = 0
-            lq4 = 0
-        else:
-            w4 = self.__calculate_avg_time_system(3, 4)
-            wq4 = self.__calculate_avg_time_queue(w4)
-            l4 = self.__calculate_avg_customers_system(w4, self.lamb4)
-            lq4 = self.__calculate_avg_customers_queue(l4, self.lamb4)
-        # Sistema
-        w = (
-            w1 * self.lamb1 + w2 * self.lamb2 + w3 * self.lamb3 + w4 * self.lamb4
-        ) / self.lamb
-        wq = (
-            wq1 * self.lamb1 + wq2 * self.lamb2 + wq3 * self.lamb3 + wq4 * self.lamb4
-        ) / self.lamb
-        l = l1 + l2 + l3 + l4
-        lq = lq1 + lq2 + lq3 + lq4
-
-        data = {
-            "Class 1": {
-                "W1": round(w1, 6),
-                "Wq1": round(wq1, 6),
-                "L1": round(l1, 6),
-                "Lq1": round(lq1, 6),
-            },
-            "Class 2": {
-                "W2": round(w2, 6),
-                "Wq2": round(wq2, 6),
-                "L2": round(l2, 6),
-                "Lq2": round(lq2, 6),
-            },
-            "Class 3": {
-                "W3": round(w3, 6),
-                "Wq3": round(wq3, 6),
-                "L3": round(l3, 6),
-                "Lq3": round(lq3, 6),
-            },
-            "Class 4": {
-                "W4": round(w4, 6),
-                "Wq4": round(wq4, 6),
-                "L4": round(l4, 6),
-                "Lq4": round(lq4, 6),
-            },
-            "System": {
-                "Rho": round(self.rho, 6),
-                "W": round(w, 6),
-                "Wq": round(wq, 6),
-                "L": round(l, 6),
-                "Lq": round(lq, 6),
-            },
-        }
-
-        if self.lamb3 == 0:
-            del data["Class 3"]
-        if self.lamb4 == 0:
-            del data["Class 4"]
-
-        return data
-
-    def __calculate_lambda_sum(self, threshold: int) -> float:
-        """
-        Calcula a soma das taxas de chegada λ até a classe 'threshold'.
-        """
-        if threshold <= 0:
-            return 0.0
-        soma = 0.0
-        if threshold >= 1:
-            soma += self.lamb1
-        if threshold >= 2:
-            soma += self.lamb2
-        if threshold >= 3:
-            soma += self.lamb3
-        if threshold >= 4:
-            soma += self.lamb4
-        return soma
-
-    def __calculate_sum_s(self) -> float:
-        somatorio = sum((self.r**num) / factorial(num) for num in range(self.s))
-        return somatorio
+        # σ_i = λ1 + ... + λi, calculadas uma única vez para todas as classes
+        lambda_sums = prefix_sums(self.lamb_list)
+        # O termo de Erlang não depende da classe: uma recorrência O(s) no total
+        first_term = self.__calculate_first_term()
+        w = [
+            self.__calculate_avg_time_system(
+                first_term, lambda_sums[i - 1], lambda_sums[i]
+            )
+            for i in range(1, len(lambda_sums))
+        ]
+
+        # L_i usa a taxa da própria classe
+        return build_priority_metrics(
+            self.lamb_list, w, self.lamb_list, self.mu, self.lamb, self.rho
+        )
+
+    def __calculate_scaled_sum_s(self) -> float:
+        # s!/r^s · Σ r^n/n! (n < s) = 1/B(s, r) - 1, com B a fórmula de Erlang B
+        b = erlang_b(self.s, self.r)
+        return (1 - b) / b if b > 0 else inf
+
+    def __calculate_first_term(self) -> float:
+        return (
+            ((self.s * self.mu) - self.lamb) * self.__calculate_scaled_sum_s()
+        ) + (self.s * self.mu)
 
-    def __calculate_avg_time_system(self, x: int, y: int) -> float:
+    def __calculate_avg_time_system(
+        self, first_term: float, higher_sum: float, lambda_sum: float
+    ) -> float:
         if self.r == 0:
             return 1 / self.mu
 
-        first_term = (
-            factorial(self.s)
-            * (((self.s * self.mu) - self.lamb) / (self.r**self.s))
-            * (self.__calculate_sum_s())
-        ) + (self.s * self.mu)
-
-        second_term = 1 - (self.__calculate_lambda_sum(x) / (self.s * self.mu))
-        third_term = 1 - (self.__calculate_lambda_sum(y) / (self.s * self.mu))
+        second_term = 1 - (higher_sum / (self.s * self.mu))
+        third_term = 1 - (lambda_sum / (self.s * self.mu))
 
         w = (1 / (first_term * second_term * third_term)) + (1 / self.mu)
         return w
-
-    def __calculate_avg_time_queue(self, w: float) -> float:
-        wq = w - (1 / self.mu)
-        return wq
-
-    def __calculate_avg_customers_system(self, w: float, arrival_rate: float) -> float:
-        l = arrival_rate * w
-        return l
-
-    def __calculate_avg_customers_queue(self, l: float, arrival_rate: float) -> float:
-        lq = l - (arrival_rate / self.mu)
-        return lq
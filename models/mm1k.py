@@ -1,6 +1,7 @@
-from typing import Dict
+from typing import Dict, List
 
 from models.base_queue import BaseQueueModel
+from models.erlang import birth_death_distribution
 
 
 class MM1K(BaseQueueModel):
@@ -35,6 +36,11 @@ class MM1K(BaseQueueModel):
             "Wq": round(wq, 4),
         }
 
+    def calculate_distribution(self) -> List[float]:
+        """Distribuição estacionária P0..PK construída incrementalmente"""
+        # Pn / Pn-1 = ρ
+        return birth_death_distribution(self.rho for _ in range(self.k))
+
     def __calculate_probability_system_empty(self) -> float:
         if self.rho == 1:
             return 1 / (self.k + 1)
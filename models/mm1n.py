@@ -1,7 +1,7 @@
-from math import factorial
-from typing import Dict
+from typing import Dict, List
 
 from models.base_queue import BaseQueueModel
+from models.erlang import birth_death_distribution
 
 
 class MM1N(BaseQueueModel):
@@ -13,6 +13,7 @@ class MM1N(BaseQueueModel):
         self.N = N
         self.a = lamb / mu
         self.rho = (self.N * self.a)
+        self.__distribution = None
 
         if self.s != 1 or self.n <= 0 or self.N <= 0 or self.mu <= 0 or self.lamb < 0:
             raise ValueError(
@@ -20,8 +21,9 @@ class MM1N(BaseQueueModel):
             )
         
     def calculate_metrics(self) -> Dict[str, float]:
-        p0 = self.__calculate_probability_system_empty()
-        pn = self.__calculate_probability_n_customers_system(p0, self.n)
+        probabilities = self.calculate_distribution()
+        p0 = probabilities[0]
+        pn = self.__calculate_probability_n_customers_system(probabilities, self.n)
         lq = self.__calculate_avg_customers_queue(p0)
         l = self.__calculate_avg_customers_system(p0)
         wq = self.__calculate_avg_time_queue(lq, l)
@@ -36,12 +38,19 @@ class MM1N(BaseQueueModel):
             "W": round(w, 4)
         }
     
-    def __calculate_probability_system_empty(self) -> float:
-        sum_part = sum((factorial(self.N) / factorial(self.N - n)) * (self.a**n) for n in range(self.N + 1))
-        return 1 / sum_part
+    def calculate_distribution(self) -> List[float]:
+        """Distribuição estacionária P0..PN construída incrementalmente"""
+        if self.__distribution is None:
+            # Pn / Pn-1 = (N - n + 1)·a
+            self.__distribution = birth_death_distribution(
+                (self.N - n + 1) * self.a for n in range(1, self.N + 1)
+            )
+        return list(self.__distribution)
     
-    def __calculate_probability_n_customers_system(self, p0: float, n: int) -> float:
-        return (factorial(self.N) / factorial(self.N - n)) * (self.a**n) * p0
+    def __calculate_probability_n_customers_system(self, probabilities: List[float], n: int) -> float:
+        if n <= self.N:
+            return probabilities[n]
+        return 0.0
     
     def __calculate_avg_customers_queue(self, p0: float) -> float:
         return self.N - ((self.lamb + self.mu) / (self.lamb)) * (1 - p0)
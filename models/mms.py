@@ -1,9 +1,9 @@
 from math import exp
-from math import factorial
 from typing import Dict
 
 
 from models.base_queue import BaseQueueModel
+from models.erlang import erlang_c, mms_log_probability_system_empty, mms_log_term
 
 class MMS(BaseQueueModel):
     def __init__(
@@ -26,12 +26,14 @@ class MMS(BaseQueueModel):
             raise ValueError("n e t devem ser valores não negativos.")
 
     def calculate_metrics(self) -> Dict:
-        p0 = self.__calculate_probability_system_empty()
-        pn = self.__calculate_probability_n_customers_system(self.n, p0)
-        pr = self.__calculate_probability_n_customers_exceeding_r_system(self.n, p0)
-        pw = self.__calculate_waiting_time_system_exceeding_t(p0)
-        pwq = self.__calculate_waiting_time_queue_exceeding_t(p0)
-        lq = self.__calculate_avg_customers_queue(p0)
+        log_p0 = self.__calculate_log_probability_system_empty()
+        p0 = exp(log_p0)
+        c = erlang_c(self.s, self.a)  # Probabilidade de espera (Erlang C)
+        pn = self.__calculate_probability_n_customers_system(self.n, log_p0)
+        pr = self.__calculate_probability_n_customers_exceeding_r_system(self.r, log_p0)
+        pw = self.__calculate_waiting_time_system_exceeding_t(c)
+        pwq = self.__calculate_waiting_time_queue_exceeding_t(c)
+        lq = self.__calculate_avg_customers_queue(c)
         wq = self.__calculate_avg_time_queue(lq)
         l = self.__calculate_avg_customers_system(lq)
         w = self.__calculate_avg_time_system(wq)
@@ -49,40 +51,32 @@ class MMS(BaseQueueModel):
             "W": round(w, 2)
         }
     
-    def __calculate_probability_system_empty(self) -> float:
-        sum_terms = sum((self.a)**n / factorial(n) for n in range(self.s))
-        last_term = ((self.a)**self.s) / (factorial(self.s) * (1 - self.rho))
-        p0 = 1 / (sum_terms + last_term)
-        return p0
+    def __calculate_log_probability_system_empty(self) -> float:
+        return mms_log_probability_system_empty(self.s, self.a)
 
-    def __calculate_probability_n_customers_system(self, n:int, p0:float) -> float:
-        if n < self.s:
-            pn =(p0 * (self.a**n)) / factorial(n)
-        else:
-            pn = (p0 * (self.a**n)) / (factorial(self.s) * (self.s**(n - self.s)))
-        return pn
+    def __calculate_probability_n_customers_system(self, n:int, log_p0:float) -> float:
+        return exp(log_p0 + mms_log_term(n, self.s, self.a))
     
-    def __calculate_probability_n_customers_exceeding_r_system(self, r:int, p0:float) -> float:
-        pr = 1 - sum(self.__calculate_probability_n_customers_system(n, p0) for n in range(r + 1))
+    def __calculate_probability_n_customers_exceeding_r_system(self, r:int, log_p0:float) -> float:
+        pr = 1 - sum(self.__calculate_probability_n_customers_system(n, log_p0) for n in range(r + 1))
         return pr
     
-    def __calculate_waiting_time_system_exceeding_t(self, p0:float) -> float:
-        first_term = (p0 * (self.a**self.s)) / (factorial(self.s) * (1 - self.rho))
-        second_term = (1 - exp(-1 * (self.mu * (self.s - 1 - self.a) * self.t)))/(self.s - 1 - self.a)
-        pw = exp(-1 * (self.mu * self.t))*(1 + first_term * second_term)
+    def __calculate_waiting_time_system_exceeding_t(self, c:float) -> float:
+        # c = P0·a^s / (s!·(1 - ρ))
+        gap = self.s - 1 - self.a
+        # Limite de (1 - e^(-μ·gap·t)) / gap quando gap -> 0
+        second_term = self.mu * self.t if gap == 0 else (1 - exp(-1 * (self.mu * gap * self.t)))/gap
+        pw = exp(-1 * (self.mu * self.t))*(1 + c * second_term)
         return pw
     
-    def __calculate_waiting_time_queue_exceeding_t(self, p0:float) -> float:
-        pwq0 = sum(self.__calculate_probability_n_customers_system(n, p0) for n in range(self.s))
-        first_term = (1 - pwq0)
+    def __calculate_waiting_time_queue_exceeding_t(self, c:float) -> float:
+        # 1 - Σ Pn (n < s) é a probabilidade de espera de Erlang C
         second_term = exp(-1 * (self.s * self.mu * (1 - self.rho) * self.t))
-        pwq  = first_term * second_term
+        pwq  = c * second_term
         return pwq
     
-    def __calculate_avg_customers_queue(self, p0:float) -> float:
-        numerator = (p0 * (self.a**(self.s)) * self.rho)
-        denominator = factorial(self.s) * ((1 - self.rho)**2)
-        lq = numerator / denominator
+    def __calculate_avg_customers_queue(self, c:float) -> float:
+        lq = c * self.rho / (1 - self.rho)
         return lq
     
     def __calculate_avg_time_queue(self, lq:float) -> float:
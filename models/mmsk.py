@@ -1,7 +1,8 @@
-from math import factorial
-from typing import Dict
+from typing import Dict, List
 
 from models.base_queue import BaseQueueModel
+from models.distribution import mean_customers_queue, mean_customers_system
+from models.erlang import birth_death_distribution
 
 class MMsK(BaseQueueModel):
     def __init__(
@@ -12,6 +13,7 @@ class MMsK(BaseQueueModel):
         self.rho = self.lamb / (self.s * self.mu)
         self.k = k
         self.n = n
+        self.__distribution = None
 
         if s <= 1:
             raise ValueError("Número de servidores deve ser maior que 1.")
@@ -19,11 +21,12 @@ class MMsK(BaseQueueModel):
             raise ValueError("n e k devem ser valores não negativos.")
 
     def calculate_metrics(self) -> Dict[str, float]:
-        p0 = self.__calculate_probability_system_empty()
-        pn = self.__calculate_probability_n_customers_system(p0, self.n)
-        pk = self.__calculate_probability_k_customers_system(p0)
-        lq = self.__calculate_avg_customers_queue(p0)
-        l = self.__calculate_avg_customers_system(p0, lq)
+        probabilities = self.calculate_distribution()
+        p0 = probabilities[0]
+        pn = self.__calculate_probability_n_customers_system(probabilities, self.n)
+        pk = self.__calculate_probability_n_customers_system(probabilities, self.k)
+        lq = mean_customers_queue(probabilities, self.s)
+        l = mean_customers_system(probabilities)
         wq = self.__calculate_avg_time_queue(lq, pk)
         w = self.__calculate_avg_time_system(l, pk)
 
@@ -36,35 +39,20 @@ class MMsK(BaseQueueModel):
             "W": round(w, 4)
         }
 
-    def __calculate_probability_system_empty(self) -> float:
-        sum_part1 = sum(self.a**n / factorial(n) for n in range(self.s + 1))
-        middle_part = (self.a**self.s) / (factorial(self.s))
-        sum_part2 = sum(self.rho**(n - self.s) for n in range(self.s + 1, self.k + 1))
-        return 1 / (sum_part1 + middle_part * sum_part2)
-    
-    def __calculate_probability_n_customers_system(self, p0: float, n: int) -> float:
-        if n <= self.s:
-            return (self.a**n / factorial(n)) * p0
-        elif n <= self.k:
-            return (self.a**n) / (factorial(self.s) * self.s**(n - self.s)) * p0
-        else:
-            return 0.0
-        
-    def __calculate_probability_k_customers_system(self, p0: float) -> float:
-        if self.k <= self.s:
-            return (self.a**self.k / factorial(self.k)) * p0
-        else:
-            return (self.a**self.k) / (factorial(self.s) * self.s**(self.k - self.s)) * p0
-        
-    def __calculate_avg_customers_queue(self, p0: float) -> float:
-        first_part = (p0*(self.a**self.s) * self.rho) / (factorial(self.s) * (1 - self.rho)**2)
-        second_part = (1 - self.rho**(self.k - self.s) - (1 - self.rho)*(self.k - self.s)*self.rho**(self.k - self.s))
-        return first_part * second_part
-
-    def __calculate_avg_customers_system(self, p0: float, lq: float) -> float:
-        first_part = sum(n * self.__calculate_probability_n_customers_system(p0, n) for n in range(self.s)) + lq
-        second_part = self.s * (1 - sum(self.__calculate_probability_n_customers_system(p0, n) for n in range(self.s)))
-        return first_part + second_part
+    def calculate_distribution(self) -> List[float]:
+        """Distribuição estacionária P0..PK construída incrementalmente"""
+        if self.__distribution is None:
+            # Pn / Pn-1 = a / min(n, s); os estados vão até max(s, K) como na soma original de P0
+            last_state = max(self.s, self.k)
+            self.__distribution = birth_death_distribution(
+                self.a / min(n, self.s) for n in range(1, last_state + 1)
+            )
+        return list(self.__distribution)
+
+    def __calculate_probability_n_customers_system(self, probabilities: List[float], n: int) -> float:
+        if n < len(probabilities):
+            return probabilities[n]
+        return 0.0
 
     def __calculate_avg_time_queue(self, lq: float, pk: float) -> float:
         return lq / (self.lamb * (1 - pk))
@@ -1,7 +1,8 @@
-from math import factorial
-from typing import Dict
+from typing import Dict, List
 
 from models.base_queue import BaseQueueModel
+from models.distribution import mean_customers_system
+from models.erlang import birth_death_distribution
 
 
 class MMSN(BaseQueueModel):
@@ -13,6 +14,7 @@ class MMSN(BaseQueueModel):
         self.N = N
         self.a = lamb / mu
         self.rho = (self.N * self.lamb) / (self.s * self.mu)
+        self.__distribution = None
 
         if self.s <= 1 or self.n <= 0 or self.N <= 0 or self.mu <= 0 or self.lamb < 0:
             raise ValueError(
@@ -20,9 +22,10 @@ class MMSN(BaseQueueModel):
             )
         
     def calculate_metrics(self) -> Dict[str, float]:
-        p0 = self.__calculate_probability_system_empty()
-        pn = self.__calculate_probability_n_customers_system(p0, self.n)
-        l = self.__calculate_avg_customers_system(p0, self.n)
+        probabilities = self.calculate_distribution()
+        p0 = probabilities[0]
+        pn = self.__calculate_probability_n_customers_system(probabilities, self.n)
+        l = mean_customers_system(probabilities)
         lq = self.__calculate_avg_customers_queue(l)
         w = self.__calculate_avg_time_system(l)
         wq = self.__calculate_avg_time_queue(lq, l)
@@ -36,40 +39,20 @@ class MMSN(BaseQueueModel):
             "Wq": round(wq, 4)
         }
     
-    def __calculate_probability_system_empty(self) -> float:
-        first_part = sum(((factorial(self.N)
-                           / (factorial(self.N - n)
-                              * factorial(n)))
-                              * self.a**n)
-                              for n in range(self.s))
-        second_part = sum(((factorial(self.N)
-                           / (factorial(self.N - n)
-                              * factorial(self.s)
-                              * self.s**(n - self.s)))
-                              * self.a**n)
-                              for n in range(self.s, self.N + 1))
-        return 1 / (first_part + second_part)
+    def calculate_distribution(self) -> List[float]:
+        """Distribuição estacionária P0..PN construída incrementalmente"""
+        if self.__distribution is None:
+            # Pn / Pn-1 = (N - n + 1)·a / min(n, s)
+            self.__distribution = birth_death_distribution(
+                (self.N - n + 1) * self.a / min(n, self.s) for n in range(1, self.N + 1)
+            )
+        return list(self.__distribution)
     
-    def __calculate_probability_n_customers_system(self, p0: float, n: int) -> float:
-        if n <= self.s:
-            return (factorial(self.N)
-                    / (factorial(self.N - n)
-                       * factorial(n))) * self.a**n * p0
-        
-        elif n <= self.N:
-            return (factorial(self.N)
-                    / (factorial(self.N - n)
-                       * factorial(self.s)
-                       * self.s**(n - self.s))) * self.a**n * p0
+    def __calculate_probability_n_customers_system(self, probabilities: List[float], n: int) -> float:
+        if n <= self.N:
+            return probabilities[n]
+        return 0.0
         
-        else:
-            return 0.0
-        
-    def __calculate_avg_customers_system(self, p0: float, n: int) -> float:
-        return sum(n
-                   * self.__calculate_probability_n_customers_system(p0, n)
-                   for n in range(1, self.N + 1))
-    
     def __calculate_avg_customers_queue(self, l: float) -> float:
         return l - (self.a) * (self.N - l)
     
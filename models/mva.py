@@ -0,0 +1,405 @@
+"""
+Análise de Valor Médio (MVA) para redes fechadas com várias estações e
+várias classes de clientes.
+
+Generaliza ``MM1N`` e ``MMSN``: uma população finita de N clientes que
+alterna entre um tempo de "pensamento" (1/λ por cliente) e uma estação com
+s servidores é a rede fechada de uma estação de atraso e uma estação de
+fila. Em vez das somas sobre N estados, a recursão avança a população um
+cliente por vez reaproveitando os comprimentos de fila da população
+anterior, em O(N·M) (O(2^m·N·M·s) com m estações de múltiplos servidores).
+
+Tipos de estação, pelo número de servidores s:
+    s = 0: atraso (servidores infinitos), o tempo de resposta é a demanda
+    s = 1: fila com um servidor
+    s > 1: fila com s servidores (exata para uma classe com até
+           ``MAX_EXACT_MULTI_SERVER_STATIONS`` dessas estações e
+           N·2^m ≤ ``MAX_EXACT_MULTI_SERVER_WORK``; nas demais situações usa
+           a aproximação de Seidmann)
+"""
+
+import math
+from typing import Any, Dict, List
+
+import numpy as np
+
+MVA_METHODS = ("exact", "schweitzer")
+
+# Maior número de vetores de população da MVA exata com várias classes
+MAX_LATTICE_SIZE = 200_000
+
+# Maior número de estações de múltiplos servidores tratadas exatamente com
+# uma classe: a recursão avança 2^m sub-redes
+MAX_EXACT_MULTI_SERVER_STATIONS = 6
+
+# Maior N·2^m (clientes × sub-redes) da recursão exata com estações de
+# múltiplos servidores; cada passo custa alguns µs em NumPy, e acima disso
+# uma chamada passaria de ~0,5 s (quatro estações com N = 20000 levavam 1,2 s)
+MAX_EXACT_MULTI_SERVER_WORK = 100_000
+
+# Redes cujas sub-redes somam até este número de estações mais servidores
+# usam a recursão exata em Python puro, que evita o custo fixo das operações
+# NumPy a cada cliente adicionado
+SMALL_NETWORK_SIZE = 64
+
+# Convergência da aproximação de Schweitzer
+SCHWEITZER_TOLERANCE = 1e-10
+SCHWEITZER_MAX_ITERATIONS = 100_000
+
+
+def mva(
+    populations: Any,
+    demands: Any,
+    servers: Any = 1,
+    think_time: Any = 0.0,
+    method: str = "exact",
+    curve: bool = False,
+) -> Dict[str, Any]:
+    """
+    Métricas de uma rede fechada por MVA exata ou aproximada (Schweitzer)
+
+    Args:
+        populations: Número de clientes de cada classe (ou um inteiro)
+        demands: Demanda de serviço (visitas × tempo de atendimento) de cada
+            classe em cada estação, como matriz classes × estações (ou uma
+            lista por estação para uma única classe)
+        servers: Servidores de cada estação (0 = atraso) ou um valor único
+        think_time: Tempo de pensamento de cada classe fora das estações
+        method: 'exact' ou 'schweitzer'
+        curve: Inclui a vazão e o tempo de resposta para n = 1..N (apenas
+            MVA exata com uma classe)
+
+    Com m estações de múltiplos servidores, a MVA exata com uma classe só é
+    usada se m ≤ ``MAX_EXACT_MULTI_SERVER_STATIONS`` e N·2^m ≤
+    ``MAX_EXACT_MULTI_SERVER_WORK``; acima disso o resultado vem da
+    aproximação de Seidmann, com ``approximate`` verdadeiro.
+
+    Returns:
+        Dicionário com ``throughput``, ``response_time`` e ``cycle_time`` por
+        classe e, em ``stations``, tempo de resposta e clientes por classe e
+        estação, clientes e utilização por estação
+
+    Raises:
+        ValueError: Se os parâmetros forem inválidos ou a população for
+            grande demais para a MVA exata com várias classes
+    """
+    if method not in MVA_METHODS:
+        raise ValueError(
+            f"Método '{method}' desconhecido. Métodos disponíveis: {', '.join(MVA_METHODS)}"
+        )
+    populations, demands, servers, think_time = _validate(
+        populations, demands, servers, think_time
+    )
+    classes, stations = demands.shape
+    multi_servers = int(np.count_nonzero(servers > 1))
+    too_large = multi_servers > MAX_EXACT_MULTI_SERVER_STATIONS or (
+        int(populations.sum()) << multi_servers > MAX_EXACT_MULTI_SERVER_WORK
+    )
+    seidmann = multi_servers > 0 and (classes > 1 or too_large)
+    if curve and (method != "exact" or classes != 1):
+        raise ValueError("A curva por população só está disponível na MVA exata com uma classe.")
+    if curve and seidmann:
+        raise ValueError(
+            "A curva por população exige a MVA exata, que com estações de múltiplos "
+            f"servidores se limita a {MAX_EXACT_MULTI_SERVER_STATIONS} dessas estações e "
+            f"a N·2^m ≤ {MAX_EXACT_MULTI_SERVER_WORK} (m = {multi_servers}); reduza N "
+            "ou o número de estações com s > 1."
+        )
+
+    approximate = method == "schweitzer" or seidmann
+    history = None
+    if method == "exact" and classes == 1 and not seidmann:
+        throughput, response, history = _exact_single_class(
+            int(populations[0]), demands[0], servers, float(think_time[0])
+        )
+        throughput, response = np.array([throughput]), response[None, :]
+    else:
+        # Seidmann: s servidores com demanda D ≈ uma fila com D/s seguida
+        # de um atraso de D·(s - 1)/s
+        multi = servers > 1
+        queue_demands = np.where(multi, demands / np.maximum(servers, 1), demands)
+        delay_demands = np.where(multi, demands - queue_demands, 0.0)
+        queueing = servers >= 1
+        if method == "exact":
+            throughput, response = _exact_multi_class(
+                populations, queue_demands, queueing, think_time
+            )
+        else:
+            throughput, response = _schweitzer(
+                populations, queue_demands, queueing, think_time
+            )
+        response = response + delay_demands * (populations > 0)[:, None]
+
+    class_customers = throughput[:, None] * response
+    busy = throughput[:, None] * demands
+    utilization = np.where(
+        servers > 0, busy.sum(axis=0) / np.maximum(servers, 1), busy.sum(axis=0)
+    )
+    response_time = response.sum(axis=1)
+
+    result = {
+        "method": method,
+        "approximate": bool(approximate),
+        "throughput": throughput.tolist(),
+        "response_time": response_time.tolist(),
+        "cycle_time": (response_time + think_time).tolist(),
+        "stations": {
+            "servers": servers.tolist(),
+            "R": response.tolist(),
+            "Q": class_customers.tolist(),
+            "L": class_customers.sum(axis=0).tolist(),
+            "U": utilization.tolist(),
+        },
+    }
+    if curve:
+        result["curve"] = {
+            "throughput": history[0].tolist(),
+            "response_time": history[1].tolist(),
+        }
+    return result
+
+
+def _validate(populations, demands, servers, think_time):
+    populations = np.atleast_1d(np.asarray(populations, dtype=float))
+    demands = np.asarray(demands, dtype=float)
+    if demands.ndim == 1:
+        demands = demands[None, :]
+    if demands.ndim != 2 or demands.size == 0:
+        raise ValueError("demands deve ser uma matriz classes × estações.")
+    classes, stations = demands.shape
+
+    if populations.shape != (classes,):
+        raise ValueError(f"Informe a população de cada uma das {classes} classes.")
+    if np.any(populations < 0) or np.any(populations != np.floor(populations)):
+        raise ValueError("As populações devem ser inteiros não negativos.")
+    if populations.sum() <= 0:
+        raise ValueError("A rede precisa de ao menos um cliente.")
+    if np.any(demands < 0) or not np.all(np.isfinite(demands)):
+        raise ValueError("As demandas de serviço devem ser não negativas.")
+
+    try:
+        servers = np.broadcast_to(np.asarray(servers, dtype=float), (stations,))
+        think_time = np.broadcast_to(np.asarray(think_time, dtype=float), (classes,))
+    except ValueError as e:
+        raise ValueError(
+            "servers deve ter um valor por estação e think_time um valor por classe."
+        ) from e
+    if np.any(servers < 0) or np.any(servers != np.floor(servers)):
+        raise ValueError("O número de servidores deve ser um inteiro não negativo.")
+    if np.any(think_time < 0) or not np.all(np.isfinite(think_time)):
+        raise ValueError("think_time deve ser não negativo.")
+
+    idle = (populations > 0) & (demands.sum(axis=1) + think_time == 0)
+    if np.any(idle):
+        raise ValueError(
+            "Toda classe com clientes precisa de demanda ou tempo de pensamento positivo."
+        )
+    return populations.astype(np.int64), demands, servers.astype(np.int64), think_time
+
+
+def _exact_single_class(population: int, demands: np.ndarray, servers: np.ndarray, think: float):
+    """
+    MVA exata com uma classe, incluindo estações de múltiplos servidores
+
+    Nas estações com s > 1 guarda as probabilidades marginais p(j) para
+    j < s e usa R = D/s·(1 + Q + Σ (s - 1 - j)·p(j)). Para j ≥ 1,
+    p(j | n) = X(n)·D/j·p(j - 1 | n - 1); p(0) não vem da normalização, cuja
+    subtração perde precisão e diverge a cada cliente, e sim de
+    p(0 | n) = p(0 | n - 1)·X(n)/X₋ₖ(n), em que X₋ₖ é a vazão da rede sem a
+    estação k. Por isso a recursão avança junto todas as sub-redes obtidas
+    removendo estações de múltiplos servidores (2^m para m estações).
+    """
+    multi = np.flatnonzero(servers > 1)
+    subsets = 1 << multi.size
+    if subsets * (demands.size + int(servers[multi].sum())) <= SMALL_NETWORK_SIZE:
+        return _exact_single_class_small(population, demands, servers, think)
+
+    stations = demands.size
+    history = (np.empty(population), np.empty(population))
+
+    # Sub-rede b contém a k-ésima estação de múltiplos servidores se o bit k
+    # de b está ligado; a última sub-rede é a rede completa
+    bits = 1 << np.arange(multi.size)
+    subset_ids = np.arange(subsets)[:, None]
+    contains = (subset_ids & bits) > 0
+    without = subset_ids & ~bits
+    present = np.ones((subsets, stations), dtype=bool)
+    present[:, multi] = contains
+
+    s_multi = servers[multi]
+    d_multi = demands[multi]
+    width = int(s_multi.max(initial=1))
+    j = np.arange(width)
+    below = j[None, :] < s_multi[:, None]
+    response_weights = np.where(below, s_multi[:, None] - 1 - j, 0)
+    inverse_j = np.where(below & (j > 0), 1.0 / np.maximum(j, 1), 0.0)
+    marginals = np.zeros((subsets, multi.size, width))
+    marginals[:, :, 0] = 1.0
+
+    single = servers == 1
+    queue_length = np.zeros((subsets, stations))
+    for n in range(1, population + 1):
+        response = np.where(single, demands * (1 + queue_length), demands)
+        if multi.size:
+            correction = (response_weights * marginals).sum(axis=2)
+            response[:, multi] = d_multi / s_multi * (1 + queue_length[:, multi] + correction)
+        response = np.where(present, response, 0.0)
+
+        cycle = think + response.sum(axis=1)
+        # Uma sub-rede vazia sem tempo de pensamento tem vazão infinita
+        throughput = np.divide(n, cycle, out=np.full(subsets, np.inf), where=cycle > 0)
+        queue_length = np.where(response > 0, throughput[:, None] * response, 0.0)
+        history[0][n - 1] = throughput[-1]
+        history[1][n - 1] = cycle[-1] - think
+
+        if multi.size:
+            reduced = throughput[without]
+            with np.errstate(invalid="ignore"):
+                ratio = np.where(
+                    reduced == throughput[:, None], 1.0, throughput[:, None] / reduced
+                )
+            shifted = np.empty_like(marginals)
+            shifted[..., 1:] = marginals[..., :-1]
+            shifted[..., 0] = 0.0
+            p0 = marginals[..., 0] * ratio
+            marginals = (throughput[:, None] * d_multi)[..., None] * inverse_j * shifted
+            marginals[..., 0] = p0
+
+    return throughput[-1], response[-1], history
+
+
+def _exact_single_class_small(
+    population: int, demands: np.ndarray, servers: np.ndarray, think: float
+):
+    """Mesma recursão de ``_exact_single_class`` com listas e escalares"""
+    demand_list: List[float] = demands.tolist()
+    server_list: List[int] = servers.tolist()
+    multi = [i for i, s in enumerate(server_list) if s > 1]
+    subsets = range(1 << len(multi))
+    # Estações de cada sub-rede, na mesma ordenação da rede completa
+    members = [
+        [
+            i
+            for i in range(len(demand_list))
+            if i not in multi or b >> multi.index(i) & 1
+        ]
+        for b in subsets
+    ]
+    queue_length = [[0.0] * len(demand_list) for _ in subsets]
+    marginals = [
+        {i: [1.0] + [0.0] * (server_list[i] - 1) for i in multi} for _ in subsets
+    ]
+    throughputs = [0.0] * population
+    responses = [0.0] * population
+
+    response: List[float] = []
+    throughput = [0.0] * len(subsets)
+    for n in range(1, population + 1):
+        for b in subsets:
+            queue, response = queue_length[b], [0.0] * len(demand_list)
+            for i in members[b]:
+                demand, s = demand_list[i], server_list[i]
+                if s == 0:
+                    response[i] = demand
+                elif s == 1:
+                    response[i] = demand * (1 + queue[i])
+                else:
+                    p = marginals[b][i]
+                    correction = 0.0
+                    for j in range(s - 1):
+                        correction += (s - 1 - j) * p[j]
+                    response[i] = demand / s * (1 + queue[i] + correction)
+            cycle = think + sum(response)
+            # Uma sub-rede vazia sem tempo de pensamento tem vazão infinita
+            throughput[b] = n / cycle if cycle > 0 else math.inf
+            queue_length[b] = [throughput[b] * r if r > 0 else 0.0 for r in response]
+
+        throughputs[n - 1] = throughput[-1]
+        responses[n - 1] = sum(response)
+
+        for b in subsets:
+            for k, i in enumerate(multi):
+                if not b >> k & 1:
+                    continue
+                s, p = server_list[i], marginals[b][i]
+                reduced = throughput[b & ~(1 << k)]
+                busy = throughput[b] * demand_list[i]
+                updated = [0.0] * s
+                updated[0] = p[0] if reduced == throughput[b] else p[0] * throughput[b] / reduced
+                for j in range(1, s):
+                    updated[j] = busy / j * p[j - 1]
+                marginals[b][i] = updated
+
+    history = (np.array(throughputs), np.array(responses))
+    return throughput[-1], np.array(response), history
+
+
+def _exact_multi_class(
+    populations: np.ndarray, demands: np.ndarray, queueing: np.ndarray, think: np.ndarray
+):
+    """
+    MVA exata com várias classes sobre o reticulado de populações
+
+    Os vetores de população são percorridos em ordem lexicográfica, em que
+    n - e_c sempre vem antes de n, e os comprimentos de fila ficam em uma
+    tabela indexada em base mista.
+    """
+    sizes = populations + 1
+    lattice = int(np.prod(sizes))
+    if lattice > MAX_LATTICE_SIZE:
+        raise ValueError(
+            f"A MVA exata percorreria {lattice} vetores de população (limite "
+            f"{MAX_LATTICE_SIZE}); use o método 'schweitzer'."
+        )
+    classes, stations = demands.shape
+    strides = np.ones(classes, dtype=np.int64)
+    for c in range(classes - 2, -1, -1):
+        strides[c] = strides[c + 1] * sizes[c + 1]
+
+    queue_table = np.zeros((lattice, stations))
+    throughput = np.zeros(classes)
+    response = np.zeros((classes, stations))
+    for index in range(1, lattice):
+        vector = (index // strides) % sizes
+        active = np.flatnonzero(vector)
+        previous = queue_table[index - strides[active]]
+        r = np.where(queueing, demands[active] * (1 + previous), demands[active])
+        x = vector[active] / (think[active] + r.sum(axis=1))
+        queue_table[index] = x @ r
+
+    # A última entrada é a população completa
+    vector = populations
+    active = np.flatnonzero(vector)
+    previous = queue_table[lattice - 1 - strides[active]]
+    response[active] = np.where(queueing, demands[active] * (1 + previous), demands[active])
+    throughput[active] = vector[active] / (think[active] + response[active].sum(axis=1))
+    return throughput, response
+
+
+def _schweitzer(
+    populations: np.ndarray, demands: np.ndarray, queueing: np.ndarray, think: np.ndarray
+):
+    """
+    Aproximação de Schweitzer: Q_c(N - e_c) ≈ Q_c(N)·(N_c - 1)/N_c, iterada
+    até o ponto fixo, com custo independente do tamanho da população
+    """
+    active = populations > 0
+    counts = np.maximum(populations, 1).astype(float)
+    stations = demands.shape[1]
+    customers = np.where(active[:, None], populations[:, None] / stations, 0.0)
+
+    for _ in range(SCHWEITZER_MAX_ITERATIONS):
+        total = customers.sum(axis=0)
+        response = np.where(
+            queueing, demands * (1 + total - customers / counts[:, None]), demands
+        )
+        response = np.where(active[:, None], response, 0.0)
+        cycle = np.where(active, think + response.sum(axis=1), 1.0)
+        throughput = np.where(active, populations / cycle, 0.0)
+        updated = throughput[:, None] * response
+        if np.max(np.abs(updated - customers)) <= SCHWEITZER_TOLERANCE * max(
+            populations.max(), 1
+        ):
+            return throughput, response
+        customers = updated
+    raise ValueError("A aproximação de Schweitzer não convergiu.")
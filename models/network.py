@@ -0,0 +1,320 @@
+"""
+Redes de Jackson abertas: estações M/M/1 e M/M/s ligadas por uma matriz de
+roteamento.
+
+As equações de tráfego λ = γ + Rᵀ·λ são resolvidas uma única vez para toda a
+rede e cada estação é avaliada pelas fórmulas vetorizadas de ``M/M/1`` e
+``M/M/s`` (ver ``models.vectorized``), de modo que o custo cresce com o
+número de rotas e não com o quadrado do número de estações.
+"""
+
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+from models.vectorized import mm1_metrics, mms_metrics
+
+# Até este número de estações as equações de tráfego usam solução direta
+DENSE_SOLVE_LIMIT = 1000
+
+# Resíduo relativo e limite de iterações do BiCGSTAB nas redes maiores
+SOLVE_TOLERANCE = 1e-12
+MAX_ITERATIONS = 100_000
+
+# Tolerância na soma de cada linha da matriz de roteamento
+ROUTING_TOLERANCE = 1e-9
+
+
+def jackson_network(
+    external_rates: Sequence[float],
+    mu: Any,
+    s: Any = 1,
+    routing: Optional[Sequence[Sequence[float]]] = None,
+    routes: Optional[Sequence[Sequence[float]]] = None,
+) -> Dict[str, Any]:
+    """
+    Métricas de uma rede de Jackson aberta
+
+    Args:
+        external_rates: Taxa de chegada externa γ de cada estação
+        mu: Taxa de atendimento por servidor (uma por estação ou escalar)
+        s: Número de servidores (um por estação ou escalar)
+        routing: Matriz densa em que routing[i][j] é a probabilidade de ir
+            de i para j ao terminar o atendimento
+        routes: Alternativa esparsa: lista de rotas (i, j, probabilidade)
+
+    Returns:
+        Dicionário com as métricas por estação (``lamb``, ``visits``, ``Rho``,
+        ``L``, ``Lq``, ``W``, ``Wq``), as métricas de ponta a ponta
+        (``throughput``, ``L``, ``W``, ``Wq``) e o ``bottleneck``
+
+    Raises:
+        ValueError: Se os parâmetros forem inválidos, a rede não for aberta
+            ou alguma estação ficar instável
+    """
+    gamma = np.asarray(external_rates, dtype=float)
+    if gamma.ndim != 1 or gamma.size == 0:
+        raise ValueError("Informe a taxa de chegada externa de ao menos uma estação.")
+    size = gamma.size
+    try:
+        mu, s = (np.broadcast_to(np.asarray(v, dtype=float), (size,)) for v in (mu, s))
+    except ValueError as e:
+        raise ValueError("mu e s devem ter um valor por estação ou um único valor.") from e
+
+    if np.any(gamma < 0) or not np.all(np.isfinite(gamma)):
+        raise ValueError("As taxas de chegada externas devem ser não negativas.")
+    if np.any(mu <= 0) or not np.all(np.isfinite(mu)):
+        raise ValueError("mu deve ser positivo em todas as estações.")
+    if np.any(s < 1) or np.any(s != np.floor(s)):
+        raise ValueError("s deve ser um inteiro maior ou igual a 1 em todas as estações.")
+    if gamma.sum() <= 0:
+        raise ValueError("Ao menos uma estação deve receber chegadas externas.")
+    s = s.astype(np.int64)
+
+    source, target, probability = _routing_edges(size, routing, routes)
+    lamb = _solve_traffic(gamma, source, target, probability)
+
+    stations = _station_metrics(lamb, mu, s)
+    unstable = np.flatnonzero(stations["Rho"] >= 1)
+    if unstable.size:
+        raise ValueError(
+            "Rede instável: λ ≥ s·μ nas estações "
+            f"{', '.join(str(i) for i in unstable[:20])}"
+        )
+
+    throughput = float(gamma.sum())
+    total_l = float(stations["L"].sum())
+    total_lq = float(stations["Lq"].sum())
+    bottleneck = int(np.argmax(stations["Rho"]))
+    max_rho = float(stations["Rho"][bottleneck])
+
+    return {
+        "stations": {
+            "lamb": lamb.tolist(),
+            "visits": (lamb / throughput).tolist(),
+            **{key: value.tolist() for key, value in stations.items()},
+        },
+        "throughput": throughput,
+        "L": total_l,
+        "Lq": total_lq,
+        # Lei de Little sobre a rede inteira
+        "W": total_l / throughput,
+        "Wq": total_lq / throughput,
+        "bottleneck": {
+            "station": bottleneck,
+            "Rho": max_rho,
+            # Fator pelo qual todas as chegadas externas podem crescer até a
+            # estação gargalo saturar
+            "capacity_factor": 1 / max_rho if max_rho > 0 else None,
+        },
+    }
+
+
+def _routing_edges(
+    size: int,
+    routing: Optional[Sequence[Sequence[float]]],
+    routes: Optional[Sequence[Sequence[float]]],
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Rotas (origem, destino, probabilidade) com probabilidade positiva"""
+    if routing is not None and routes is not None:
+        raise ValueError("Informe routing ou routes, não ambos.")
+
+    if routing is not None:
+        matrix = np.asarray(routing, dtype=float)
+        if matrix.shape != (size, size):
+            raise ValueError(
+                f"routing deve ser uma matriz {size}x{size} (uma linha por estação)."
+            )
+        source, target = np.nonzero(matrix)
+        probability = matrix[source, target]
+    elif routes:
+        edges = np.asarray(routes, dtype=float)
+        if edges.ndim != 2 or edges.shape[1] != 3:
+            raise ValueError("Cada rota deve ser [origem, destino, probabilidade].")
+        source, target, probability = edges.T
+        if np.any(source != np.floor(source)) or np.any(target != np.floor(target)):
+            raise ValueError("Origem e destino das rotas devem ser índices inteiros.")
+        source = source.astype(np.int64)
+        target = target.astype(np.int64)
+        if np.any((source < 0) | (source >= size) | (target < 0) | (target >= size)):
+            raise ValueError(f"Índices de estação devem estar entre 0 e {size - 1}.")
+    else:
+        empty = np.array([], dtype=np.int64)
+        return empty, empty, np.array([], dtype=float)
+
+    if np.any(probability < 0) or not np.all(np.isfinite(probability)):
+        raise ValueError("As probabilidades de roteamento devem estar entre 0 e 1.")
+    leaving = np.bincount(source, weights=probability, minlength=size)
+    overflow = np.flatnonzero(leaving > 1 + ROUTING_TOLERANCE)
+    if overflow.size:
+        raise ValueError(
+            "A soma das probabilidades de saída excede 1 nas estações "
+            f"{', '.join(str(i) for i in overflow[:20])}"
+        )
+    return source, target, probability
+
+
+def _solve_traffic(
+    gamma: np.ndarray, source: np.ndarray, target: np.ndarray, probability: np.ndarray
+) -> np.ndarray:
+    """
+    Resolve (I - Rᵀ)·λ = γ
+
+    A rede precisa ser aberta, o que é verificado pela estrutura das rotas
+    (``_check_open``) antes de resolver. Redes pequenas usam solução direta;
+    nas maiores, o sistema é resolvido por BiCGSTAB com precondicionador
+    diagonal, em que cada produto por I - Rᵀ percorre a lista de rotas.
+    """
+    size = gamma.size
+    _check_open(size, source, target, probability)
+
+    if size <= DENSE_SOLVE_LIMIT:
+        system = np.eye(size)
+        np.subtract.at(system, (target, source), probability)
+        lamb = np.linalg.solve(system, gamma)
+    else:
+        loops = source == target
+        diagonal = 1 - np.bincount(
+            source[loops], weights=probability[loops], minlength=size
+        )
+        lamb = _bicgstab(
+            lambda x: _apply_traffic(x, source, target, probability), gamma, diagonal
+        )
+
+    # O resíduo atualizado pelo BiCGSTAB pode se afastar um pouco do verdadeiro
+    residual = np.linalg.norm(gamma - _apply_traffic(lamb, source, target, probability))
+    relative = residual / np.linalg.norm(gamma)
+    if not relative <= 10 * SOLVE_TOLERANCE:
+        raise ValueError(
+            f"As equações de tráfego não convergiram em {MAX_ITERATIONS} iterações "
+            f"(resíduo relativo {relative:.1e})."
+        )
+    return np.maximum(lamb, 0.0)
+
+
+def _apply_traffic(
+    lamb: np.ndarray, source: np.ndarray, target: np.ndarray, probability: np.ndarray
+) -> np.ndarray:
+    """(I - Rᵀ)·λ sobre a lista de rotas"""
+    return lamb - np.bincount(
+        target, weights=probability * lamb[source], minlength=lamb.size
+    )
+
+
+def _check_open(
+    size: int, source: np.ndarray, target: np.ndarray, probability: np.ndarray
+) -> None:
+    """
+    Confere que de toda estação há um caminho até uma estação pela qual o
+    cliente deixa a rede (soma das probabilidades de saída menor que 1)
+
+    Raises:
+        ValueError: Com as estações de onde não se sai, se houver
+    """
+    positive = probability > 0
+    source, target = source[positive], target[positive]
+    leaving = np.bincount(source, weights=probability[positive], minlength=size)
+
+    # Busca reversa a partir das saídas, com as rotas agrupadas por destino
+    order = np.argsort(target, kind="stable")
+    predecessors = source[order].tolist()
+    starts = np.searchsorted(target[order], np.arange(size + 1)).tolist()
+    reaches = (leaving < 1 - ROUTING_TOLERANCE).tolist()
+    pending = [station for station in range(size) if reaches[station]]
+    while pending:
+        station = pending.pop()
+        for previous in predecessors[starts[station] : starts[station + 1]]:
+            if not reaches[previous]:
+                reaches[previous] = True
+                pending.append(previous)
+
+    trapped = [station for station in range(size) if not reaches[station]]
+    if trapped:
+        raise ValueError(
+            f"{_CLOSED_NETWORK_MESSAGE} Estações sem caminho até a saída: "
+            f"{', '.join(str(i) for i in trapped[:20])}"
+        )
+
+
+def _bicgstab(
+    apply: Callable[[np.ndarray], np.ndarray], b: np.ndarray, diagonal: np.ndarray
+) -> np.ndarray:
+    """
+    BiCGSTAB com precondicionador diagonal, reiniciado em caso de ruptura;
+    devolve a melhor aproximação após MAX_ITERATIONS produtos
+    """
+    x = b / diagonal
+    target_norm = SOLVE_TOLERANCE * np.linalg.norm(b)
+    iterations = 0
+    while iterations < MAX_ITERATIONS:
+        r = b - apply(x)
+        if np.linalg.norm(r) <= target_norm:
+            return x
+        r_hat = r.copy()
+        rho_old = alpha = omega = 1.0
+        v = p = np.zeros_like(b)
+        while iterations < MAX_ITERATIONS:
+            iterations += 1
+            rho = r_hat @ r
+            if rho == 0:
+                break
+            p = r + (rho / rho_old) * (alpha / omega) * (p - omega * v)
+            y = p / diagonal
+            v = apply(y)
+            denominator = r_hat @ v
+            if denominator == 0:
+                break
+            alpha = rho / denominator
+            x = x + alpha * y
+            r = r - alpha * v
+            if np.linalg.norm(r) <= target_norm:
+                return x
+            z = r / diagonal
+            t = apply(z)
+            t_norm = t @ t
+            if t_norm == 0:
+                break
+            omega = (t @ r) / t_norm
+            x = x + omega * z
+            r = r - omega * t
+            if np.linalg.norm(r) <= target_norm or omega == 0:
+                break
+            rho_old = rho
+    return x
+
+
+def _station_metrics(
+    lamb: np.ndarray, mu: np.ndarray, s: np.ndarray
+) -> Dict[str, np.ndarray]:
+    """Rho, L, Lq, W e Wq de cada estação isolada (M/M/1 se s = 1, senão M/M/s)"""
+    single = s == 1
+    metrics = {
+        key: np.full(lamb.size, np.nan) for key in ("Rho", "L", "Lq", "W", "Wq")
+    }
+    metrics["Rho"] = lamb / (s * mu)
+
+    stable = metrics["Rho"] < 1
+    for mask, evaluate in (
+        (single & stable, lambda i: mm1_metrics(lamb[i], mu[i])),
+        (~single & stable, lambda i: mms_metrics(lamb[i], mu[i], s[i])),
+    ):
+        if not mask.any():
+            continue
+        result = evaluate(mask)
+        for key in ("L", "Lq", "W"):
+            metrics[key][mask] = result[key]
+
+    # Wq = W - 1/μ em vez do Wq do M/M/1, que é reportado em minutos; uma
+    # estação sem tráfego devolve o tempo que um cliente passaria nela
+    idle = stable & (lamb == 0)
+    metrics["W"][idle] = 1 / mu[idle]
+    metrics["L"][idle] = 0.0
+    metrics["Lq"][idle] = 0.0
+    metrics["Wq"] = metrics["W"] - 1 / mu
+    return metrics
+
+
+_CLOSED_NETWORK_MESSAGE = (
+    "As equações de tráfego não têm solução: a rede precisa ser aberta "
+    "(todo cliente deve deixar a rede com probabilidade 1)."
+)
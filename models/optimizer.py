@@ -0,0 +1,250 @@
+"""
+Dimensionamento do número de servidores.
+
+Encontra o menor s que atende a uma meta de Wq e/ou P(Wq > t). No M/M/s a
+recorrência de Erlang B é estendida de s para s + 1 a cada candidato, sem
+recalcular P0; no M/M/s/K e no M/M/s/N, em que cada avaliação custa O(K) ou
+O(N), usa-se busca binária, já que Wq e P(Wq > t) decrescem com s.
+"""
+
+from math import exp, inf, lgamma, log
+from typing import Any, Dict, List, Optional
+
+from models.erlang import birth_death_distribution
+
+OPTIMIZABLE_MODELS = ("MMS", "MMSK", "MMSN")
+
+# Os três modelos exigem mais de um servidor
+MIN_SERVERS = 2
+
+# No M/M/s/K e no M/M/s/N a curva cobre até este número de servidores de
+# cada lado do escolhido
+CURVE_RADIUS = 5
+
+
+def minimum_servers(
+    model_type: str,
+    lamb: float,
+    mu: float,
+    target_wq: Optional[float] = None,
+    target_pwq: Optional[float] = None,
+    t: float = 0.0,
+    k: Optional[int] = None,
+    N: Optional[int] = None,
+    s_max: Optional[int] = None,
+    server_cost: Optional[float] = None,
+    waiting_cost: Optional[float] = None,
+) -> Dict[str, Any]:
+    """
+    Menor número de servidores que atende às metas de espera
+
+    Args:
+        model_type: 'MMS', 'MMSK' ou 'MMSN'
+        lamb: Taxa de chegada (por cliente ocioso no MMSN)
+        mu: Taxa de atendimento por servidor
+        target_wq: Tempo médio máximo na fila
+        target_pwq: Probabilidade máxima de esperar mais que t na fila
+        t: Tempo usado em P(Wq > t)
+        k: Capacidade do sistema (MMSK)
+        N: Tamanho da população (MMSN)
+        s_max: Maior número de servidores considerado
+        server_cost: Custo por servidor (opcional, para a curva de custo)
+        waiting_cost: Custo por cliente em fila (opcional, para a curva de custo)
+
+    Returns:
+        Dicionário com ``s``, as métricas nesse ponto e ``curve``, pontos
+        (s, Wq, pwq e, se houver custos, cost) em valores contíguos de s: no
+        M/M/s, do menor s estável até o escolhido (mais um, com custos); no
+        M/M/s/K e no M/M/s/N, até ``CURVE_RADIUS`` de cada lado do escolhido,
+        dentro de [MIN_SERVERS, s_max]. Com custos, ``s`` é o candidato
+        viável de menor custo total.
+
+    Raises:
+        ValueError: Se os parâmetros forem inválidos ou nenhuma meta for atingida
+    """
+    if model_type not in OPTIMIZABLE_MODELS:
+        raise ValueError(
+            f"Modelo '{model_type}' não suportado pelo otimizador. "
+            f"Modelos disponíveis: {', '.join(OPTIMIZABLE_MODELS)}"
+        )
+    if lamb <= 0 or mu <= 0:
+        raise ValueError("Parâmetros inválidos: requer λ > 0 e μ > 0.")
+    if target_wq is None and target_pwq is None:
+        raise ValueError("Informe target_wq e/ou target_pwq.")
+    if t < 0:
+        raise ValueError("t deve ser não negativo.")
+
+    costs = (server_cost or 0.0, waiting_cost or 0.0)
+    with_cost = server_cost is not None or waiting_cost is not None
+
+    if model_type == "MMS":
+        curve = _search_mms(
+            lamb, mu, target_wq, target_pwq, t, s_max, costs, with_cost
+        )
+    else:
+        if model_type == "MMSK" and (k is None or k < 1):
+            raise ValueError("MMSK requer k ≥ 1.")
+        if model_type == "MMSN" and (N is None or N < 1):
+            raise ValueError("MMSN requer N ≥ 1.")
+        limit = k if model_type == "MMSK" else N
+        s_max = min(s_max or limit, limit)
+        evaluate = lambda s: _finite_point(model_type, lamb, mu, s, k, N, t, costs)
+        curve = _binary_search(evaluate, target_wq, target_pwq, s_max)
+        if with_cost:
+            curve = _descend_cost(evaluate, curve, target_wq, target_pwq, s_max)
+
+    feasible = [point for point in curve if _meets(point, target_wq, target_pwq)]
+    if not feasible:
+        raise ValueError("Nenhum número de servidores até s_max atende às metas.")
+
+    best = min(feasible, key=lambda point: point["s"])
+    if with_cost:
+        best = min(feasible, key=lambda point: (point["cost"], point["s"]))
+    if model_type != "MMS":
+        # A busca binária só avalia pontos esparsos; a curva devolvida é a
+        # vizinhança contígua do escolhido, reaproveitando o que já foi avaliado
+        evaluated = {point["s"]: point for point in curve}
+        window = range(
+            max(MIN_SERVERS, best["s"] - CURVE_RADIUS), min(s_max, best["s"] + CURVE_RADIUS) + 1
+        )
+        curve = [evaluated.get(s) or evaluate(s) for s in window]
+    if not with_cost:
+        for point in curve:
+            point.pop("cost", None)
+
+    return {**best, "curve": sorted(curve, key=lambda point: point["s"])}
+
+
+def _meets(point: Dict[str, float], target_wq, target_pwq) -> bool:
+    if target_wq is not None and not point["Wq"] <= target_wq:
+        return False
+    if target_pwq is not None and not point["pwq"] <= target_pwq:
+        return False
+    return True
+
+
+def _search_mms(
+    lamb, mu, target_wq, target_pwq, t, s_max, costs, with_cost
+) -> List[Dict[str, float]]:
+    """
+    Percorre s = 2, 3, ... estendendo a recorrência de Erlang B, que começa
+    em s = 1
+    """
+    a = lamb / mu
+    s_max = s_max or int(a + 10 * (a**0.5) + 100)
+    server_cost, waiting_cost = costs
+
+    curve = []
+    b = 1.0
+    found = False
+    for s in range(1, s_max + 1):
+        b = a * b / (s + a * b)
+        if s < MIN_SERVERS or s <= a:
+            continue
+        c = s * b / (s - a * (1 - b))  # Erlang C
+        wq = c / (s * mu - lamb)
+        point = {
+            "s": s,
+            "Wq": wq,
+            "pwq": c * exp(-(s * mu - lamb) * t),
+            "cost": server_cost * s + waiting_cost * lamb * wq,
+        }
+        curve.append(point)
+
+        if not found:
+            found = _meets(point, target_wq, target_pwq)
+        # Com custos, segue enquanto o custo total ainda cair (é convexo em s)
+        if found and (
+            not with_cost
+            or (len(curve) > 1 and point["cost"] > curve[-2]["cost"])
+        ):
+            break
+
+    return curve
+
+
+def _finite_point(model_type, lamb, mu, s, k, N, t, costs) -> Dict[str, float]:
+    """Wq e P(Wq > t) do M/M/s/K ou M/M/s/N a partir da distribuição completa"""
+    a = lamb / mu
+    if model_type == "MMSK":
+        probabilities = birth_death_distribution(
+            a / min(n, s) for n in range(1, k + 1)
+        )
+        # Clientes que chegam e encontram n < K (PASTA)
+        arrival_weights = probabilities[:-1]
+        throughput = lamb * (1 - probabilities[-1])
+    else:
+        probabilities = birth_death_distribution(
+            (N - n + 1) * a / min(n, s) for n in range(1, N + 1)
+        )
+        # Clientes da população finita chegam com taxa proporcional a (N - n)
+        arrival_weights = [(N - n) * p for n, p in enumerate(probabilities)]
+        throughput = lamb * sum(arrival_weights)
+
+    lq = sum((n - s) * p for n, p in enumerate(probabilities) if n > s)
+    wq = lq / throughput if throughput > 0 else inf
+
+    total = sum(arrival_weights)
+    x = s * mu * t
+    log_x = log(x) if x > 0 else -inf
+    tail = 0.0
+    # Quem chega com n ≥ s espera n - s + 1 términos de serviço à taxa sμ:
+    # P(Erlang(m, sμ) > t) = Σ_{i<m} e^(-x)·x^i / i!, acumulado em m
+    poisson_cdf = 0.0
+    for n in range(s, len(arrival_weights)):
+        i = n - s
+        log_term = -x - lgamma(i + 1) + (i * log_x if i > 0 else 0.0)
+        poisson_cdf += exp(log_term)
+        tail += arrival_weights[n] * min(poisson_cdf, 1.0)
+    pwq = tail / total if total > 0 else 0.0
+
+    server_cost, waiting_cost = costs
+    return {
+        "s": s,
+        "Wq": wq,
+        "pwq": pwq,
+        "cost": server_cost * s + waiting_cost * lq,
+    }
+
+
+def _descend_cost(
+    evaluate, curve, target_wq, target_pwq, s_max
+) -> List[Dict[str, float]]:
+    """A partir do menor s viável, avança enquanto o custo total cair (convexo)"""
+    feasible = [point for point in curve if _meets(point, target_wq, target_pwq)]
+    if not feasible:
+        return curve
+
+    evaluated = {point["s"]: point for point in curve}
+    current = min(feasible, key=lambda point: point["s"])
+    while current["s"] < s_max:
+        following = evaluated.get(current["s"] + 1) or evaluate(current["s"] + 1)
+        evaluated[following["s"]] = following
+        if following["cost"] >= current["cost"]:
+            break
+        current = following
+    return list(evaluated.values())
+
+
+def _binary_search(evaluate, target_wq, target_pwq, s_max) -> List[Dict[str, float]]:
+    """Menor s em [2, s_max] que atende às metas (métricas monótonas em s)"""
+    evaluated: Dict[int, Dict[str, float]] = {}
+    if s_max < MIN_SERVERS:
+        return []
+
+    def point(s: int) -> Dict[str, float]:
+        if s not in evaluated:
+            evaluated[s] = evaluate(s)
+        return evaluated[s]
+
+    low, high = MIN_SERVERS, s_max
+    if not _meets(point(high), target_wq, target_pwq):
+        return list(evaluated.values())
+    while low < high:
+        middle = (low + high) // 2
+        if _meets(point(middle), target_wq, target_pwq):
+            high = middle
+        else:
+            low = middle + 1
+    point(low)
+    return list(evaluated.values())
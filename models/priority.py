@@ -0,0 +1,92 @@
+"""
+Núcleo compartilhado pelos modelos com classes de prioridade.
+
+As classes são numeradas a partir de 1 (maior prioridade). As somas
+acumuladas σ_i = λ1 + ... + λi são calculadas uma única vez e cada modelo
+obtém o tempo no sistema de todas as classes em uma só passada, sem
+recursão; a montagem das métricas por classe e do sistema fica aqui.
+"""
+
+from itertools import accumulate
+from typing import Dict, List, Optional, Sequence
+
+
+def resolve_lamb_list(
+    lamb_list: Optional[Sequence[float]], legacy: Sequence[float]
+) -> List[float]:
+    """
+    Taxas de chegada por classe, vindas de ``lamb_list`` ou, se ausente,
+    dos parâmetros legados lamb1..lamb4
+
+    Raises:
+        ValueError: Se alguma taxa for negativa, não houver classes ou todas
+            as taxas forem nulas
+    """
+    rates = [float(rate) for rate in (lamb_list if lamb_list else legacy)]
+    if not rates:
+        raise ValueError("Informe ao menos uma classe de prioridade.")
+    if any(rate < 0 for rate in rates):
+        raise ValueError("Parâmetros inválidos: requer λi ≥ 0 em todas as classes.")
+    if not any(rates):
+        raise ValueError("Parâmetros inválidos: requer λi > 0 em ao menos uma classe.")
+    return rates
+
+
+def prefix_sums(rates: Sequence[float]) -> List[float]:
+    """Somas acumuladas [0, σ1, σ2, ..., σC]"""
+    return [0.0, *accumulate(rates)]
+
+
+def build_priority_metrics(
+    rates: Sequence[float],
+    times: Sequence[float],
+    population_rates: Sequence[float],
+    mu: float,
+    lamb: float,
+    rho: float,
+) -> Dict[str, Dict[str, float]]:
+    """
+    Monta as métricas por classe e do sistema
+
+    Classes com taxa nula não recebem clientes e são omitidas do resultado.
+
+    Args:
+        rates: Taxa de chegada de cada classe
+        times: Tempo médio no sistema W_i de cada classe
+        population_rates: Taxa usada em L_i = taxa·W_i (a própria λi ou a
+            soma acumulada σi, conforme a convenção do modelo)
+        mu: Taxa de atendimento
+        lamb: Taxa de chegada total
+        rho: Utilização reportada para o sistema
+    """
+    data = {}
+    w = wq = l = lq = 0.0
+    for index, (rate, w_i, population_rate) in enumerate(
+        zip(rates, times, population_rates), start=1
+    ):
+        if rate == 0:
+            continue
+        wq_i = w_i - 1 / mu
+        l_i = population_rate * w_i
+        lq_i = l_i - population_rate / mu
+
+        w += rate * w_i
+        wq += rate * wq_i
+        l += l_i
+        lq += lq_i
+
+        data[f"Class {index}"] = {
+            f"W{index}": round(w_i, 6),
+            f"Wq{index}": round(wq_i, 6),
+            f"L{index}": round(l_i, 6),
+            f"Lq{index}": round(lq_i, 6),
+        }
+
+    data["System"] = {
+        "Rho": round(rho, 6),
+        "W": round(w / lamb, 6),
+        "Wq": round(wq / lamb, 6),
+        "L": round(l, 6),
+        "Lq": round(lq, 6),
+    }
+    return data
@@ -1,30 +1,14 @@
 from typing import Any, Dict, Type
 
 from models.base_queue import BaseQueueModel
-from models.mcpci import MCPCI
-from models.mcpsi import MCPSI
-from models.mg1 import MG1
-from models.mm1 import MM1
-from models.mm1k import MM1K
-from models.mm1n import MM1N
-from models.mms import MMS
-from models.mmsk import MMsK
-from models.mmsn import MMSN
+from models.registry import MODEL_REGISTRY, get_schema, parse_lamb_list
 
 
 class QueueFactory:
     """Factory para criar instâncias de modelos de fila"""
 
     _models: Dict[str, Type[BaseQueueModel]] = {
-        "MM1": MM1,
-        "MMS": MMS,
-        "MM1K": MM1K,
-        "MM1N": MM1N,
-        "MMSK": MMsK,
-        "MMSN": MMSN,
-        "MG1": MG1,
-        "MCPCI": MCPCI,
-        "MCPSI": MCPSI,
+        key: schema.model_class for key, schema in MODEL_REGISTRY.items()
     }
 
     @classmethod
@@ -57,73 +41,31 @@ class QueueFactory:
                 f"Parâmetros inválidos para o modelo {model_type}: {str(e)}"
             ) from e
 
+    @classmethod
+    def build_params(cls, model_type: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Converte dados brutos (ex: JSON) nos parâmetros aceitos pelo modelo
+
+        Args:
+            model_type: Tipo do modelo (ex: 'MM1', 'MM1K', etc)
+            data: Valores recebidos, possivelmente como texto
+
+        Returns:
+            Parâmetros convertidos, com os valores padrão preenchidos
+
+        Raises:
+            ValueError: Se o modelo não for suportado, faltar um parâmetro
+                obrigatório ou algum valor for inválido
+        """
+        return get_schema(model_type).coerce(data)
+
+    parse_lamb_list = staticmethod(parse_lamb_list)
+
     @classmethod
     def get_available_models(cls) -> list:
         return list(cls._models.keys())
 
     @classmethod
     def get_model_info(cls, model_type: str) -> Dict[str, Any]:
-        model_info = {
-            "MM1": {
-                "name": "M/M/1",
-                "description": "Fila com chegadas Poisson, atendimento exponencial, 1 servidor",
-                "params": ["lamb", "mu", "k", "s", "n", "r", "t"],
-                "required": ["lamb", "mu"],
-            },
-            "MMS": {
-                "name": "M/M/s",
-                "description": "Fila com s servidores (s > 1)",
-                "params": ["lamb", "mu", "s", "k", "n", "r", "t"],
-                "required": ["lamb", "mu", "s"],
-            },
-            "MM1K": {
-                "name": "M/M/1/K",
-                "description": "Fila M/M/1 com capacidade finita K",
-                "params": ["lamb", "mu", "k", "s", "n"],
-                "required": ["lamb", "mu", "k"],
-            },
-            "MM1N": {
-                "name": "M/M/1/N",
-                "description": "Fila M/M/1 com população finita N",
-                "params": ["lamb", "mu", "N", "s", "k", "n"],
-                "required": ["lamb", "mu", "N"],
-            },
-            "MMSK": {
-                "name": "M/M/s/K",
-                "description": "Fila com s servidores e capacidade finita K",
-                "params": ["lamb", "mu", "s", "k", "n"],
-                "required": ["lamb", "mu", "s", "k"],
-            },
-            "MMSN": {
-                "name": "M/M/s/N",
-                "description": "Fila com s servidores e população finita N",
-                "params": ["lamb", "mu", "s", "N", "k", "n"],
-                "required": ["lamb", "mu", "s", "N"],
-            },
-            "MG1": {
-                "name": "M/G/1",
-                "description": "Fila com chegadas Poisson e tempo de serviço geral",
-                "params": ["lamb", "mu", "k", "s"],
-                "required": ["lamb", "mu"],
-            },
-            "MCPCI": {
-                "name": "Modelo com Prioridades (Classes Independentes)",
-                "description": "Modelo de prioridades com classes independentes",
-                "params": ["lamb", "mu", "s", "k", "lamb_list"],
-                "required": ["lamb", "mu", "s", "k", "lamb_list"],
-            },
-            "MCPSI": {
-                "name": "Modelo com Prioridades (Sistema Integrado)",
-                "description": "Modelo de prioridades com sistema integrado",
-                "params": ["lamb", "mu", "s", "k", "lamb_list"],
-                "required": ["lamb", "mu", "s", "k", "lamb_list"],
-            },
-            "MCPCIS": {
-                "name": "Modelo com Prioridades (Classes Independentes e Sistema Integrado)",
-                "description": "Modelo de prioridades com classes independentes e sistema integrado",
-                "params": ["lamb", "mu", "s", "k", "lamb_list"],
-                "required": ["lamb", "mu", "s", "k", "lamb_list"],
-            },
-        }
-
-        return model_info.get(model_type, {})
+        schema = MODEL_REGISTRY.get(model_type)
+        return schema.info() if schema is not None else {}
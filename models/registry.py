@@ -0,0 +1,274 @@
+"""
+Registro dos modelos de fila e dos esquemas de parâmetros.
+
+Construído uma única vez na importação: cada modelo tem seu esquema tipado
+(parâmetros aceitos, conversores, valores padrão e restrições), e a
+conversão de uma requisição percorre o esquema em uma só passada, tanto
+para requisições avulsas quanto para cada linha de um lote.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, FrozenSet, List, Mapping, Optional, Tuple, Type
+
+from models.base_queue import BaseQueueModel
+from models.mcpci import MCPCI
+from models.mcpcis import MCPCIS
+from models.mcpsi import MCPSI
+from models.ggs import GGS
+from models.mg1 import MG1
+from models.mm1 import MM1
+from models.mm1k import MM1K
+from models.mm1n import MM1N
+from models.mms import MMS
+from models.mmsk import MMsK
+from models.mmsn import MMSN
+
+
+def parse_lamb_list(lamb_list) -> List[float]:
+    """Lista de taxas por classe, aceitando também texto: "1,2,3" -> [1.0, 2.0, 3.0]"""
+    if isinstance(lamb_list, str):
+        return [float(x.strip()) for x in lamb_list.split(",") if x.strip()]
+    return [float(x) for x in lamb_list]
+
+
+def to_int(value: Any) -> int:
+    """Inteiro a partir de int, float inteiro ou texto ("3", "3.0")"""
+    if isinstance(value, int):
+        return value
+    number = float(value)
+    if not number.is_integer():
+        raise ValueError(f"esperado um número inteiro, recebido {value!r}")
+    return int(number)
+
+
+@dataclass(frozen=True)
+class ParamSpec:
+    """Parâmetro de um modelo: conversor, valor padrão e limite inferior"""
+
+    name: str
+    converter: Callable[[Any], Any]
+    default: Any = None
+    minimum: Optional[float] = None
+    exclusive: bool = False  # Se True, exige valor > minimum
+
+    def coerce(self, value: Any) -> Any:
+        """
+        Converte e valida um valor recebido
+
+        Raises:
+            ValueError: Se o valor não puder ser convertido ou violar o limite
+        """
+        try:
+            value = self.converter(value)
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Parâmetro '{self.name}' inválido: {e}") from e
+
+        if self.minimum is not None:
+            values = value if isinstance(value, list) else [value]
+            if self.exclusive and any(v <= self.minimum for v in values):
+                raise ValueError(
+                    f"Parâmetro '{self.name}' deve ser maior que {self.minimum:g}."
+                )
+            if not self.exclusive and any(v < self.minimum for v in values):
+                raise ValueError(
+                    f"Parâmetro '{self.name}' deve ser maior ou igual a {self.minimum:g}."
+                )
+        return value
+
+
+@dataclass(frozen=True)
+class ModelSchema:
+    """Metadados, classe e esquema de parâmetros de um modelo"""
+
+    key: str
+    name: str
+    description: str
+    model_class: Type[BaseQueueModel]
+    params: Tuple[ParamSpec, ...]
+    required: FrozenSet[str]
+    names: FrozenSet[str] = field(init=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "names", frozenset(p.name for p in self.params))
+
+    def coerce(self, data: Mapping[str, Any]) -> Dict[str, Any]:
+        """
+        Converte dados brutos (ex: JSON) nos parâmetros aceitos pelo modelo
+
+        Parâmetros ausentes recebem o valor padrão; chaves que o modelo não
+        aceita são ignoradas.
+
+        Raises:
+            ValueError: Se faltar um parâmetro obrigatório ou algum valor for
+                inválido
+        """
+        params = {}
+        missing = []
+        for spec in self.params:
+            value = data.get(spec.name)
+            if value is None or value == "":
+                if spec.name in self.required:
+                    missing.append(spec.name)
+                elif spec.default is not None:
+                    params[spec.name] = spec.default
+            else:
+                params[spec.name] = spec.coerce(value)
+
+        if missing:
+            raise ValueError(
+                f"Parâmetros obrigatórios ausentes para o modelo {self.key}: "
+                f"{', '.join(missing)}"
+            )
+        return params
+
+    def info(self) -> Dict[str, Any]:
+        """Metadados no formato de ``QueueFactory.get_model_info``"""
+        return {
+            "name": self.name,
+            "description": self.description,
+            "params": [p.name for p in self.params],
+            "required": [p.name for p in self.params if p.name in self.required],
+        }
+
+
+LAMB = ParamSpec("lamb", float, 0.0, minimum=0)
+MU = ParamSpec("mu", float, minimum=0, exclusive=True)
+S = ParamSpec("s", to_int, 1, minimum=1)
+K = ParamSpec("k", to_int, 0, minimum=0)
+CUSTOMERS = ParamSpec("n", to_int, 0, minimum=0)
+POPULATION = ParamSpec("N", to_int, 0, minimum=0)
+R = ParamSpec("r", to_int, 0, minimum=0)
+T = ParamSpec("t", float, 0.0, minimum=0)
+VAR = ParamSpec("var", float, minimum=0)
+CA2 = ParamSpec("ca2", float, 1.0, minimum=0)
+CS2 = ParamSpec("cs2", float, 1.0, minimum=0)
+LAMB_LIST = ParamSpec("lamb_list", parse_lamb_list, minimum=0)
+LEGACY_CLASSES = tuple(
+    ParamSpec(f"lamb{i}", float, 0.0, minimum=0) for i in range(1, 5)
+)
+
+
+def _schema(
+    key: str,
+    name: str,
+    description: str,
+    model_class: Type[BaseQueueModel],
+    params: Tuple[ParamSpec, ...],
+    required: Tuple[str, ...],
+) -> ModelSchema:
+    return ModelSchema(
+        key, name, description, model_class, params, frozenset(required)
+    )
+
+
+_PRIORITY_PARAMS = (LAMB, MU, S, K, LAMB_LIST, *LEGACY_CLASSES)
+
+MODEL_REGISTRY: Dict[str, ModelSchema] = {
+    schema.key: schema
+    for schema in (
+        _schema(
+            "MM1",
+            "M/M/1",
+            "Fila com chegadas Poisson, atendimento exponencial, 1 servidor",
+            MM1,
+            (LAMB, MU, K, S, CUSTOMERS, R, T),
+            ("lamb", "mu"),
+        ),
+        _schema(
+            "MMS",
+            "M/M/s",
+            "Fila com s servidores (s > 1)",
+            MMS,
+            (LAMB, MU, S, K, CUSTOMERS, R, T),
+            ("lamb", "mu", "s"),
+        ),
+        _schema(
+            "MM1K",
+            "M/M/1/K",
+            "Fila M/M/1 com capacidade finita K",
+            MM1K,
+            (LAMB, MU, K, S, CUSTOMERS),
+            ("lamb", "mu", "k"),
+        ),
+        _schema(
+            "MM1N",
+            "M/M/1/N",
+            "Fila M/M/1 com população finita N",
+            MM1N,
+            (LAMB, MU, POPULATION, S, K, CUSTOMERS),
+            ("lamb", "mu", "N"),
+        ),
+        _schema(
+            "MMSK",
+            "M/M/s/K",
+            "Fila com s servidores e capacidade finita K",
+            MMsK,
+            (LAMB, MU, S, K, CUSTOMERS),
+            ("lamb", "mu", "s", "k"),
+        ),
+        _schema(
+            "MMSN",
+            "M/M/s/N",
+            "Fila com s servidores e população finita N",
+            MMSN,
+            (LAMB, MU, S, POPULATION, K, CUSTOMERS),
+            ("lamb", "mu", "s", "N"),
+        ),
+        _schema(
+            "MG1",
+            "M/G/1",
+            "Fila com chegadas Poisson e tempo de serviço geral",
+            MG1,
+            (LAMB, MU, K, S, VAR),
+            ("lamb", "mu"),
+        ),
+        _schema(
+            "GGS",
+            "G/G/s",
+            "Aproximação para chegadas e atendimento gerais (Allen-Cunneen/Kingman)",
+            GGS,
+            (LAMB, MU, S, CA2, CS2),
+            ("lamb", "mu"),
+        ),
+        _schema(
+            "MCPCI",
+            "Modelo com Prioridades (Classes Independentes)",
+            "Modelo de prioridades com classes independentes",
+            MCPCI,
+            _PRIORITY_PARAMS,
+            ("mu",),
+        ),
+        _schema(
+            "MCPSI",
+            "Modelo com Prioridades (Sistema Integrado)",
+            "Modelo de prioridades com sistema integrado",
+            MCPSI,
+            _PRIORITY_PARAMS,
+            ("mu",),
+        ),
+        _schema(
+            "MCPCIS",
+            "Modelo com Prioridades (Classes Independentes e Sistema Integrado)",
+            "Modelo de prioridades com classes independentes e sistema integrado",
+            MCPCIS,
+            _PRIORITY_PARAMS,
+            ("mu",),
+        ),
+    )
+}
+
+
+def get_schema(model_type: str) -> ModelSchema:
+    """
+    Esquema registrado de um modelo
+
+    Raises:
+        ValueError: Se o modelo não for suportado
+    """
+    schema = MODEL_REGISTRY.get(model_type)
+    if schema is None:
+        raise ValueError(
+            f"Modelo '{model_type}' não suportado. "
+            f"Modelos disponíveis: {', '.join(MODEL_REGISTRY)}"
+        )
+    return schema
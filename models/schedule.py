@@ -0,0 +1,109 @@
+"""
+Análise de filas com capacidade finita sob uma escala de λ(t) por intervalos.
+
+Em cada intervalo λ e s são constantes; a distribuição de estados ao fim de
+um intervalo é o ponto de partida do seguinte, propagada por uniformização
+(``models.transient``). Operadores com o mesmo par (λ, s) são reaproveitados,
+e as métricas de cada intervalo são médias no tempo, obtidas na mesma
+passada que a distribuição final.
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+import numpy as np
+
+from models.transient import UniformizedChain, birth_death_rates, initial_distribution
+
+SCHEDULE_MODELS = ("MM1K", "MMSK")
+
+
+def schedule_metrics(
+    model_type: str,
+    lamb_schedule: Sequence[float],
+    mu: float,
+    k: int,
+    s_schedule: Union[int, Sequence[int]] = 1,
+    interval: float = 1.0,
+    initial: Union[int, Sequence[float]] = 0,
+    epsilon: float = 1e-10,
+) -> Dict[str, Any]:
+    """
+    Série de métricas médias por intervalo para uma escala de λ e s
+
+    Args:
+        model_type: 'MM1K' ou 'MMSK'
+        lamb_schedule: Taxa de chegada de cada intervalo
+        mu: Taxa de atendimento por servidor
+        k: Capacidade do sistema
+        s_schedule: Servidores de cada intervalo (ou um valor para todos)
+        interval: Duração de cada intervalo
+        initial: Número inicial de clientes ou distribuição inicial completa
+        epsilon: Massa de Poisson desprezada a cada intervalo
+
+    Returns:
+        Dicionário com uma lista por métrica (L, Lq, P0, Pk, utilização e
+        vazão médias em cada intervalo) e ``final_distribution``, que pode
+        ser usada como ``initial`` da escala seguinte
+    """
+    if model_type not in SCHEDULE_MODELS:
+        raise ValueError(
+            f"Modelo '{model_type}' não suportado pela análise por intervalos. "
+            f"Modelos disponíveis: {', '.join(SCHEDULE_MODELS)}"
+        )
+    lambs = [float(lamb) for lamb in lamb_schedule]
+    if not lambs:
+        raise ValueError("Informe a taxa de chegada de ao menos um intervalo.")
+    servers = _servers_schedule(model_type, s_schedule, len(lambs))
+    if interval <= 0:
+        raise ValueError("A duração do intervalo deve ser positiva.")
+
+    chains: Dict[tuple, UniformizedChain] = {}
+    states: Optional[np.ndarray] = None
+    p: Optional[np.ndarray] = None
+    series: Dict[str, List[float]] = {
+        "L": [],
+        "Lq": [],
+        "P0": [],
+        "Pk": [],
+        "utilization": [],
+        "throughput": [],
+    }
+
+    for lamb, s in zip(lambs, servers):
+        key = (lamb, s)
+        if key not in chains:
+            birth, death = birth_death_rates(model_type, lamb, mu, s, k)
+            chains[key] = UniformizedChain(birth, death)
+        if p is None:
+            states = np.arange(k + 1)
+            p = initial_distribution(initial, k + 1)
+
+        p, mean = chains[key].propagate(p, interval, epsilon)
+
+        busy = float(np.minimum(states, s) @ mean)
+        series["L"].append(float(states @ mean))
+        series["Lq"].append(float(np.maximum(states - s, 0) @ mean))
+        series["P0"].append(float(mean[0]))
+        series["Pk"].append(float(mean[-1]))
+        series["utilization"].append(busy / s)
+        series["throughput"].append(lamb * (1 - float(mean[-1])))
+
+    return {**series, "final_distribution": p.tolist()}
+
+
+def _servers_schedule(
+    model_type: str, s_schedule: Union[int, Sequence[int]], size: int
+) -> List[int]:
+    if isinstance(s_schedule, (int, np.integer)):
+        servers = [int(s_schedule)] * size
+    else:
+        servers = [int(s) for s in s_schedule]
+        if len(servers) != size:
+            raise ValueError(
+                "A escala de servidores deve ter o mesmo tamanho da escala de λ."
+            )
+    if any(s < 1 for s in servers):
+        raise ValueError("Número de servidores deve ser positivo.")
+    if model_type == "MM1K" and any(s != 1 for s in servers):
+        raise ValueError("MM1K requer s = 1.")
+    return servers
@@ -0,0 +1,182 @@
+"""
+Escala de servidores por intervalo para uma previsão de demanda.
+
+Cada intervalo é tratado como estacionário (aproximação pontual). Em vez de
+construir um ``MMS`` por intervalo e por s, a recorrência de Erlang B avança
+s = 1, 2, ... para todos os intervalos de uma vez, como operações sobre
+arrays; no M/M/s/K a distribuição de todos os intervalos é obtida por s com
+um único produto em escala logarítmica. Como no otimizador de um único
+intervalo, as escalas começam em ``MIN_SERVERS``.
+"""
+
+from math import lgamma
+from typing import Any, Dict, Optional, Sequence
+
+import numpy as np
+
+from models.erlang import mms_log_offsets
+from models.optimizer import MIN_SERVERS
+
+STAFFING_MODELS = ("MMS", "MMSK")
+
+
+def staffing_schedule(
+    model_type: str,
+    lamb_schedule: Sequence[float],
+    mu: float,
+    target_wq: Optional[float] = None,
+    target_pwq: Optional[float] = None,
+    t: float = 0.0,
+    k: Optional[int] = None,
+    interval: float = 1.0,
+    server_cost: float = 1.0,
+    waiting_cost: float = 0.0,
+    s_max: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Escala de menor custo que atende à meta em todos os intervalos
+
+    Args:
+        model_type: 'MMS' ou 'MMSK'
+        lamb_schedule: Previsão da taxa de chegada de cada intervalo
+        mu: Taxa de atendimento por servidor
+        target_wq: Tempo médio máximo na fila
+        target_pwq: Probabilidade máxima de esperar mais que t na fila
+        t: Tempo usado em P(Wq > t)
+        k: Capacidade do sistema (MMSK)
+        interval: Duração de cada intervalo
+        server_cost: Custo por servidor por unidade de tempo
+        waiting_cost: Custo por cliente em fila por unidade de tempo
+        s_max: Maior número de servidores considerado
+
+    Returns:
+        Dicionário com ``s``, ``Wq``, ``pwq`` e ``cost`` por intervalo e
+        ``total_cost`` da escala
+
+    Raises:
+        ValueError: Se os parâmetros forem inválidos ou algum intervalo não
+            puder ser atendido com até s_max servidores
+    """
+    if model_type not in STAFFING_MODELS:
+        raise ValueError(
+            f"Modelo '{model_type}' não suportado pelo otimizador de escala. "
+            f"Modelos disponíveis: {', '.join(STAFFING_MODELS)}"
+        )
+    lamb = np.asarray(lamb_schedule, dtype=float)
+    if lamb.ndim != 1 or lamb.size == 0:
+        raise ValueError("Informe a taxa de chegada de ao menos um intervalo.")
+    if np.any(lamb < 0) or mu <= 0:
+        raise ValueError("Parâmetros inválidos: requer λ ≥ 0 e μ > 0.")
+    if target_wq is None and target_pwq is None:
+        raise ValueError("Informe target_wq e/ou target_pwq.")
+    if t < 0 or interval <= 0:
+        raise ValueError("t deve ser não negativo e o intervalo positivo.")
+
+    if model_type == "MMS":
+        a = lamb / mu
+        s_max = s_max or int(np.max(a + 10 * np.sqrt(a)) + 100)
+        candidates = _mms_candidates(lamb, mu, t, s_max)
+    else:
+        if k is None or k < 1:
+            raise ValueError("MMSK requer k ≥ 1.")
+        s_max = min(s_max or k, k)
+        candidates = _mmsk_candidates(lamb, mu, t, k, s_max)
+
+    best_s = np.zeros(lamb.size, dtype=int)
+    best = {
+        "Wq": np.full(lamb.size, np.nan),
+        "pwq": np.full(lamb.size, np.nan),
+        "cost": np.full(lamb.size, np.inf),
+    }
+    for s, wq, pwq, lq in candidates:
+        meets = np.ones(lamb.size, dtype=bool)
+        if target_wq is not None:
+            meets &= wq <= target_wq
+        if target_pwq is not None:
+            meets &= pwq <= target_pwq
+        cost = (server_cost * s + waiting_cost * lq) * interval
+
+        # O custo é convexo em s: depois da primeira escala viável, o intervalo
+        # está resolvido assim que o custo volta a subir
+        found = best_s > 0
+        improve = meets & (cost < best["cost"])
+        best_s = np.where(improve, s, best_s)
+        best["Wq"] = np.where(improve, wq, best["Wq"])
+        best["pwq"] = np.where(improve, pwq, best["pwq"])
+        best["cost"] = np.where(improve, cost, best["cost"])
+        if np.all(found & ~improve):
+            break
+
+    unmet = np.flatnonzero(best_s == 0)
+    if unmet.size:
+        raise ValueError(
+            f"Nenhum número de servidores até {s_max} atende à meta nos "
+            f"intervalos: {', '.join(str(i) for i in unmet[:20])}"
+        )
+
+    return {
+        "s": best_s.tolist(),
+        "Wq": best["Wq"].tolist(),
+        "pwq": best["pwq"].tolist(),
+        "cost": best["cost"].tolist(),
+        "total_cost": float(best["cost"].sum()),
+    }
+
+
+def _mms_candidates(lamb: np.ndarray, mu: float, t: float, s_max: int):
+    """
+    Gera (s, Wq, P(Wq > t), Lq) de todos os intervalos para
+    s = MIN_SERVERS..s_max; a recorrência de Erlang B parte de s = 1
+    """
+    a = lamb / mu
+    b = np.ones_like(a)
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        for s in range(1, s_max + 1):
+            b = a * b / (s + a * b)
+            if s < MIN_SERVERS:
+                continue
+            stable = s > a
+            c = np.where(stable, s * b / (s - a * (1 - b)), 1.0)  # Erlang C
+            wq = np.where(stable, c / (s * mu - lamb), np.inf)
+            pwq = np.where(stable, c * np.exp(-(s * mu - lamb) * t), 1.0)
+            yield s, wq, pwq, lamb * wq
+
+
+def _mmsk_candidates(lamb: np.ndarray, mu: float, t: float, k: int, s_max: int):
+    """Gera (s, Wq, P(Wq > t), Lq) de todos os intervalos para s = MIN_SERVERS..s_max"""
+    states = np.arange(k + 1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        log_a = np.log(lamb / mu)[:, None]
+        for s in range(MIN_SERVERS, s_max + 1):
+            # Uma linha por intervalo: log(Pn / P0) = n·log(a) + base[n]
+            terms = np.where(states == 0, 0.0, states * log_a)
+            terms = terms + mms_log_offsets(s, k)
+            log_total = np.logaddexp.reduce(terms, axis=1)[:, None]
+            probabilities = np.exp(terms - log_total)
+            pk = probabilities[:, -1]
+            lq = probabilities @ np.maximum(states - s, 0)
+            throughput = lamb * (1 - pk)
+            wq = np.where(throughput > 0, lq / throughput, 0.0)
+
+            # Quem chega com n ≥ s espera n - s + 1 términos à taxa sμ
+            arrivals = probabilities[:, :-1]
+            tail = _erlang_tail(states[:-1] - s + 1, s * mu * t)
+            pwq = np.where(
+                1 - pk > 0, (arrivals @ tail) / np.maximum(1 - pk, 1e-300), 0.0
+            )
+            yield s, wq, pwq, lq
+
+
+def _erlang_tail(phases: np.ndarray, x: float) -> np.ndarray:
+    """P(Erlang(m) > t) = Σ_{i<m} e^(-x)·x^i / i! para cada m (0 se m ≤ 0)"""
+    size = int(max(phases.max(initial=0), 0))
+    if size == 0:
+        return np.zeros(len(phases))
+    if x == 0:
+        # Com t = 0 toda espera positiva excede t
+        return np.where(phases > 0, 1.0, 0.0)
+    i = np.arange(size)
+    log_factorials = np.array([lgamma(j + 1) for j in range(size)])
+    log_terms = -x + i * np.log(x) - log_factorials
+    cumulative = np.minimum(np.cumsum(np.exp(log_terms)), 1.0)
+    return np.where(phases > 0, cumulative[np.clip(phases - 1, 0, None)], 0.0)
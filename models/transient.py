@@ -0,0 +1,268 @@
+"""
+Análise transitória dos modelos de nascimento e morte finitos por
+uniformização.
+
+Com Λ ≥ max(λn + μn), P = I + Q/Λ é estocástica e
+p(t) = Σ_k e^(-Λt)·(Λt)^k / k! · p(0)·P^k. Como Q é tridiagonal, cada produto
+p·P custa O(K) com fatias de arrays, sem montar matrizes densas (exceto com
+poucos estados, em que a matriz densa é mais rápida). Uma grade de tempos é
+avaliada em uma só passada, encadeando p(t_j) a partir de p(t_(j-1)) com
+passo t_j - t_(j-1).
+"""
+
+from math import ceil, log, sqrt
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+TRANSIENT_MODELS = ("MM1K", "MMSK", "MM1N", "MMSN")
+
+# Intervalo entre verificações de convergência das potências p·P^k
+_CONVERGENCE_CHECK = 32
+
+# Potências p·P^k acumuladas por vez em um único produto matricial
+_BLOCK_SIZE = 256
+
+
+def birth_death_rates(
+    model_type: str,
+    lamb: float,
+    mu: float,
+    s: int = 1,
+    k: Optional[int] = None,
+    N: Optional[int] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Taxas de nascimento λn e de morte μn para n = 0..max
+
+    Raises:
+        ValueError: Se o modelo não for suportado ou os parâmetros forem inválidos
+    """
+    if model_type not in TRANSIENT_MODELS:
+        raise ValueError(
+            f"Modelo '{model_type}' não suportado pela análise transitória. "
+            f"Modelos disponíveis: {', '.join(TRANSIENT_MODELS)}"
+        )
+    if lamb < 0 or mu <= 0:
+        raise ValueError("Parâmetros inválidos: requer λ ≥ 0 e μ > 0.")
+
+    if model_type in ("MM1K", "MM1N"):
+        s = 1
+    if s < 1:
+        raise ValueError("Número de servidores deve ser positivo.")
+
+    if model_type in ("MM1K", "MMSK"):
+        if k is None or k < 1:
+            raise ValueError(f"{model_type} requer k ≥ 1.")
+        states = np.arange(k + 1)
+        birth = np.where(states < k, lamb, 0.0)
+    else:
+        if N is None or N < 1:
+            raise ValueError(f"{model_type} requer N ≥ 1.")
+        states = np.arange(N + 1)
+        # População finita: cada cliente fora do sistema chega com taxa λ
+        birth = (N - states) * float(lamb)
+
+    death = np.minimum(states, s) * float(mu)
+    return birth.astype(float), death
+
+
+class UniformizedChain:
+    """
+    Operador P = I + Q/Λ de um processo de nascimento e morte
+
+    Para poucos estados P é guardada densa e cada passo é um único produto
+    vetor-matriz; acima de ``DENSE_LIMIT`` estados usa-se a forma tridiagonal.
+    O operador pode ser reaproveitado em vários intervalos com as mesmas taxas.
+    """
+
+    DENSE_LIMIT = 256
+
+    def __init__(self, birth: np.ndarray, death: np.ndarray) -> None:
+        self.size = len(birth)
+        self.rate = float(np.max(birth + death))
+        if self.rate == 0:
+            return
+
+        self.__stay = 1 - (birth + death) / self.rate
+        self.__up = birth[:-1] / self.rate
+        self.__down = death[1:] / self.rate
+        self.__matrix = None
+        if self.size <= self.DENSE_LIMIT:
+            self.__matrix = (
+                np.diag(self.__stay)
+                + np.diag(self.__up, 1)
+                + np.diag(self.__down, -1)
+            )
+
+    def step(self, v: np.ndarray) -> np.ndarray:
+        """Um passo da cadeia uniformizada: v·P"""
+        if self.__matrix is not None:
+            return v @ self.__matrix
+        following = self.__stay * v
+        following[1:] += self.__up * v[:-1]
+        following[:-1] += self.__down * v[1:]
+        return following
+
+    def propagate(
+        self, p: np.ndarray, dt: float, epsilon: float = 1e-10
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Distribuição ao fim de dt e distribuição média sobre [0, dt]
+
+        A média usa as mesmas potências p·P^k com pesos P(N > k) / (Λ·dt),
+        em que N ~ Poisson(Λ·dt), de modo que sai na mesma passada.
+        """
+        x = self.rate * dt
+        if x == 0:
+            return p.astype(float), p.astype(float)
+
+        weights = _poisson_weights(x, epsilon)
+        # ∫ p(t) dt / dt = Σ_k P(N > k)/x · p·P^k
+        tails = np.clip(1 - np.cumsum(weights), 0.0, None) / x
+        coefficients = np.vstack((weights, tails))
+
+        total = len(weights)
+        block = np.empty((min(total, _BLOCK_SIZE), self.size))
+        result = np.zeros((2, self.size))
+        v = p.astype(float)
+        done = 0
+        converged = False
+        while done < total and not converged:
+            count = min(len(block), total - done)
+            for row in range(count):
+                block[row] = v
+                following = self.step(v)
+                check = (done + row + 1) % _CONVERGENCE_CHECK == 0
+                # As potências já convergiram: o restante da série é o próprio v
+                converged = check and np.abs(following - v).sum() < epsilon
+                v = following
+                if converged:
+                    count = row + 1
+                    break
+            result += coefficients[:, done : done + count] @ block[:count]
+            done += count
+
+        accumulated = coefficients[:, :done].sum(axis=1)
+        if converged:
+            result += np.outer(1 - accumulated, v)
+            accumulated = np.ones(2)
+        final, mean = result / accumulated[:, None]
+        return final, mean
+
+
+def propagate(
+    p: np.ndarray,
+    birth: np.ndarray,
+    death: np.ndarray,
+    dt: float,
+    epsilon: float = 1e-10,
+) -> np.ndarray:
+    """
+    Distribuição após dt unidades de tempo, partindo de p
+
+    Args:
+        p: Distribuição inicial P0..Pmax
+        birth: Taxas de nascimento λn
+        death: Taxas de morte μn
+        dt: Duração do intervalo
+        epsilon: Massa de Poisson desprezada no truncamento da série
+    """
+    return UniformizedChain(birth, death).propagate(p, dt, epsilon)[0]
+
+
+def transient_metrics(
+    model_type: str,
+    times: Sequence[float],
+    lamb: float,
+    mu: float,
+    s: int = 1,
+    k: Optional[int] = None,
+    N: Optional[int] = None,
+    initial: Union[int, Sequence[float]] = 0,
+    distribution: bool = False,
+    epsilon: float = 1e-10,
+) -> Dict[str, Any]:
+    """
+    Métricas P0(t), L(t), Lq(t) e bloqueio Pk(t) sobre uma grade de tempos
+
+    Args:
+        model_type: 'MM1K', 'MMSK', 'MM1N' ou 'MMSN'
+        times: Instantes de avaliação, não negativos e em ordem crescente
+        lamb: Taxa de chegada (por cliente ocioso no MM1N e MMSN)
+        mu: Taxa de atendimento por servidor
+        s: Número de servidores (MMSK e MMSN)
+        k: Capacidade do sistema (MM1K e MMSK)
+        N: Tamanho da população (MM1N e MMSN)
+        initial: Número inicial de clientes ou distribuição inicial completa
+        distribution: Se True, inclui Pn(t) de cada instante
+        epsilon: Massa de Poisson desprezada a cada intervalo
+
+    Returns:
+        Dicionário com ``times`` e uma lista por métrica (``Pk`` apenas nos
+        modelos com capacidade finita)
+    """
+    birth, death = birth_death_rates(model_type, lamb, mu, s, k, N)
+    servers = 1 if model_type in ("MM1K", "MM1N") else s
+    states = np.arange(len(birth))
+
+    times = [float(t) for t in times]
+    if not times:
+        raise ValueError("Informe ao menos um instante de tempo.")
+    if times[0] < 0 or any(b < a for a, b in zip(times, times[1:])):
+        raise ValueError("Os instantes devem ser não negativos e crescentes.")
+
+    p = initial_distribution(initial, len(birth))
+    chain = UniformizedChain(birth, death)
+
+    series: Dict[str, List[Any]] = {"P0": [], "L": [], "Lq": []}
+    if model_type in ("MM1K", "MMSK"):
+        series["Pk"] = []
+    if distribution:
+        series["distribution"] = []
+
+    previous = 0.0
+    for t in times:
+        p, _ = chain.propagate(p, t - previous, epsilon)
+        previous = t
+
+        series["P0"].append(float(p[0]))
+        series["L"].append(float(states @ p))
+        series["Lq"].append(float(np.maximum(states - servers, 0) @ p))
+        if "Pk" in series:
+            series["Pk"].append(float(p[-1]))
+        if distribution:
+            series["distribution"].append(p.tolist())
+
+    return {"times": times, **series}
+
+
+def initial_distribution(
+    initial: Union[int, Sequence[float]], size: int
+) -> np.ndarray:
+    """Distribuição inicial a partir de um estado ou de uma lista de probabilidades"""
+    if isinstance(initial, (int, np.integer)):
+        if not 0 <= initial < size:
+            raise ValueError(f"Estado inicial deve estar entre 0 e {size - 1}.")
+        p = np.zeros(size)
+        p[initial] = 1.0
+        return p
+
+    p = np.asarray(initial, dtype=float)
+    if p.shape != (size,) or np.any(p < 0) or not np.isclose(p.sum(), 1.0):
+        raise ValueError(
+            f"A distribuição inicial deve ter {size} probabilidades somando 1."
+        )
+    return p
+
+
+def _poisson_weights(x: float, epsilon: float) -> np.ndarray:
+    """Pesos e^(-x)·x^k / k! até que a cauda desprezada seja menor que epsilon"""
+    right = int(ceil(x + 10 * sqrt(x) + 20))
+    k = np.arange(right + 1)
+    log_factorials = np.concatenate(([0.0], np.cumsum(np.log(k[1:]))))
+    weights = np.exp(-x + k * log(x) - log_factorials)
+
+    cumulative = np.cumsum(weights)
+    last = int(np.searchsorted(cumulative, 1 - epsilon)) + 1
+    return weights[: min(last, right + 1)]
@@ -0,0 +1,338 @@
+"""
+Avaliação vetorizada (NumPy) dos modelos de forma fechada.
+
+Cada função recebe arrays (ou escalares) de parâmetros, aplica broadcasting
+entre eles e devolve um dicionário de arrays com as mesmas métricas das
+classes escalares correspondentes, sem arredondamento. Pontos que as classes
+escalares rejeitariam com ``ValueError`` resultam em ``nan``.
+"""
+
+from math import lgamma, log
+from typing import Callable, Dict, Tuple
+
+import numpy as np
+
+from models.erlang import erlang_b_array, erlang_c_array
+
+# Abaixo do menor float normal, B perde precisão e o último termo é desprezível
+_TINY = np.finfo(float).tiny
+
+
+def mm1_metrics(lamb, mu, n=0, r=0, t=0.0) -> Dict[str, np.ndarray]:
+    """Métricas do modelo M/M/1 (ver ``MM1``)"""
+    lamb, mu, n, r, t = _as_float_arrays(lamb, mu, n, r, t)
+    valid = (lamb >= 0) & (mu > 0) & (lamb < mu) & (n >= 0) & (r >= 0) & (t >= 0)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rho = lamb / mu
+        p0 = 1 - rho
+        pn = (1 - rho) * rho**n
+        pr = rho ** (r + 1)
+        l = rho / (1 - rho)
+        lq = rho**2 / (1 - rho)
+        w = 1 / (mu - lamb)
+        # Mesma convenção do MM1 escalar (Wq reportado em minutos)
+        wq = 60 * rho / (mu * (1 - rho))
+        pw = np.exp(-(mu - lamb) * t)
+        pwq = rho * pw
+
+    return _mask_invalid(
+        {
+            "Rho": rho,
+            "P0": p0,
+            "Pn": pn,
+            "Pr": pr,
+            "L": l,
+            "Lq": lq,
+            "W": w,
+            "Wq": wq,
+            "pw": pw,
+            "pwq": pwq,
+        },
+        valid,
+    )
+
+
+def mms_metrics(lamb, mu, s, n=0, r=0, t=0.0) -> Dict[str, np.ndarray]:
+    """Métricas do modelo M/M/s (ver ``MMS``)"""
+    lamb, mu, s, n, r, t = _as_float_arrays(lamb, mu, s, n, r, t)
+    s = s.astype(np.int64)
+    n = n.astype(np.int64)
+    r = r.astype(np.int64)
+    valid = (lamb >= 0) & (mu > 0) & (s > 1) & (lamb < mu * s) & (n >= 0) & (t >= 0)
+
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        rho = lamb / (s * mu)
+        a = lamb / mu
+        valid_s = np.where(valid, s, 0)
+        valid_a = np.where(valid, a, 0.0)
+        log_a = np.log(valid_a)
+        log_factorials = _log_factorials(int(np.max(valid_s, initial=0)))
+        b, at_s, below_s = _log_erlang_sums(valid_a, valid_s, log_factorials)
+
+        log_denominator = np.logaddexp(below_s, at_s - np.log1p(-rho))
+        p0 = np.exp(-log_denominator)
+        c = s * b / (s - a * (1 - b))  # Erlang C
+        # Pn = P0·a^s/s!·ρ^(n - s) para n ≥ s
+        at_n = _log_poisson_terms(log_a, np.minimum(n, valid_s), log_factorials)
+        pn = np.exp(
+            np.where(n < s, at_n, at_s + (n - s) * np.log(rho)) - log_denominator
+        )
+        # P(N ≤ r): termos com n < s mais a soma geométrica a partir de s
+        below_r = _log_partial_sums(log_a, np.minimum(r, valid_s - 1))
+        tail_terms = np.maximum(r - s + 1, 0)
+        at_most_r = np.exp(below_r - log_denominator) + np.where(
+            tail_terms > 0, c * (1 - rho**tail_terms), 0.0
+        )
+        pr = 1 - at_most_r
+
+        # (1 - e^(-μ(s-1-a)t)) / (s-1-a), cujo limite em s - 1 = a é μt
+        gap = s - 1 - a
+        second_term = np.where(
+            gap == 0, mu * t, -np.expm1(-mu * gap * t) / np.where(gap == 0, 1, gap)
+        )
+        pw = np.exp(-mu * t) * (1 + c * second_term)
+        pwq = c * np.exp(-(s * mu - lamb) * t)
+
+        lq = c * rho / (1 - rho)
+        wq = lq / lamb
+        l = lq + a
+        w = wq + 1 / mu
+
+    return _mask_invalid(
+        {
+            "Rho": rho,
+            "P0": p0,
+            "Pn": pn,
+            "Pr": pr,
+            "pw": pw,
+            "pwq": pwq,
+            "Lq": lq,
+            "Wq": wq,
+            "L": l,
+            "W": w,
+        },
+        valid,
+    )
+
+
+def mm1k_metrics(lamb, mu, k, n=0) -> Dict[str, np.ndarray]:
+    """Métricas do modelo M/M/1/K (ver ``MM1K``)"""
+    lamb, mu, k, n = _as_float_arrays(lamb, mu, k, n)
+    k = k.astype(np.int64)
+    valid = (lamb >= 0) & (mu > 0) & (k >= 0) & (lamb < mu) & (n >= 0)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rho = lamb / mu
+        rho_k1 = rho ** (k + 1)
+        p0 = (1 - rho) / (1 - rho_k1)
+        pn = (1 - rho) * rho**n / (1 - rho_k1)
+        pk = (1 - rho) * rho**k / (1 - rho_k1)
+        l = rho / (1 - rho) - (k + 1) * rho_k1 / (1 - rho_k1)
+        lq = l - (1 - p0)
+        w = l / (lamb * (1 - pk))
+        wq = lq / (lamb * (1 - pk))
+
+    return _mask_invalid(
+        {"P0": p0, "Pn": pn, "L": l, "Lq": lq, "W": w, "Wq": wq}, valid
+    )
+
+
+def mmsk_metrics(lamb, mu, s, k, n=0) -> Dict[str, np.ndarray]:
+    """Métricas do modelo M/M/s/K (ver ``MMsK``)"""
+    lamb, mu, s, k, n = _as_float_arrays(lamb, mu, s, k, n)
+    s = s.astype(np.int64)
+    k = k.astype(np.int64)
+    n = n.astype(np.int64)
+    valid = (lamb >= 0) & (mu > 0) & (s > 1) & (k >= 0) & (n >= 0)
+
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        a = lamb / mu
+        rho = lamb / (s * mu)
+        valid_s = np.where(valid, s, 0)
+        valid_a = np.where(valid, a, 0.0)
+        log_a = np.log(valid_a)
+        log_factorials = _log_factorials(int(np.max(valid_s, initial=0)))
+        b, at_s, below_s = _log_erlang_sums(valid_a, valid_s, log_factorials)
+        # Σ n·a^n/n! para n < s é a·Σ a^m/m! para m < s - 1; B(s - 1) sai de
+        # B(s) desfazendo um passo da recorrência
+        b_previous = valid_s * b / (valid_a * (1 - b))
+        at_previous = at_s + np.log(valid_s) - log_a
+        weighted_below_s = log_a + np.where(
+            b_previous > _TINY,
+            at_previous + np.log1p(-b_previous) - np.log(b_previous),
+            valid_a,
+        )
+
+        # Soma geométrica de ρ^(n - s) para n = s + 1, ..., K
+        extra = np.maximum(k - s, 0)
+        geometric = np.where(
+            rho == 1, extra, rho * (1 - rho**extra) / (1 - rho)
+        )
+        log_denominator = np.logaddexp(below_s, at_s + np.log1p(geometric))
+        p0 = np.exp(-log_denominator)
+        ps = np.exp(at_s - log_denominator)
+
+        at_k = _log_poisson_terms(log_a, np.minimum(k, valid_s), log_factorials)
+        pk = np.where(k <= s, np.exp(at_k - log_denominator), ps * rho ** (k - s))
+
+        # Os estados vão até max(s, K), como em ``MMsK``
+        at_n = _log_poisson_terms(log_a, np.minimum(n, valid_s), log_factorials)
+        pn = np.where(
+            n <= s,
+            np.exp(at_n - log_denominator),
+            np.where(n <= k, ps * rho ** (n - s), 0.0),
+        )
+
+        first_part = ps * rho / (1 - rho) ** 2
+        second_part = 1 - rho**extra - (1 - rho) * extra * rho**extra
+        lq = first_part * second_part
+
+        prob_below_s = np.exp(below_s - log_denominator)
+        l = np.exp(weighted_below_s - log_denominator) + lq + s * (1 - prob_below_s)
+        wq = lq / (lamb * (1 - pk))
+        w = l / (lamb * (1 - pk))
+
+    return _mask_invalid(
+        {"P0": p0, "Pn": pn, "Lq": lq, "L": l, "Wq": wq, "W": w}, valid
+    )
+
+
+def mg1_metrics(lamb, mu, var=None) -> Dict[str, np.ndarray]:
+    """Métricas do modelo M/G/1 (ver ``MG1``)"""
+    if var is None:
+        lamb, mu = _as_float_arrays(lamb, mu)
+        var = (1 / mu) ** 2
+    lamb, mu, var = _as_float_arrays(lamb, mu, var)
+    valid = (lamb >= 0) & (mu > 0)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rho = lamb / mu
+        p0 = 1 - rho
+        lq = (rho**2 * (1 + var * mu**2)) / (2 * (1 - rho))
+        l = lq + rho
+        wq = lq / lamb
+        w = wq + 1 / mu
+
+    return _mask_invalid(
+        {"P0": p0, "p": rho, "Lq": lq, "L": l, "Wq": wq, "W": w}, valid
+    )
+
+
+def ggs_metrics(lamb, mu, s=1, ca2=1.0, cs2=1.0) -> Dict[str, np.ndarray]:
+    """Métricas da aproximação G/G/s de Allen-Cunneen (ver ``GGS``)"""
+    lamb, mu, s, ca2, cs2 = _as_float_arrays(lamb, mu, s, ca2, cs2)
+    s = s.astype(np.int64)
+    valid = (
+        (lamb >= 0) & (mu > 0) & (s >= 1) & (lamb < mu * s) & (ca2 >= 0) & (cs2 >= 0)
+    )
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rho = lamb / (s * mu)
+        a = lamb / mu
+        c = erlang_c_array(np.where(valid, s, 1), np.where(valid, a, 0.0))
+        wq = c / (s * mu - lamb) * (ca2 + cs2) / 2
+        lq = lamb * wq
+        w = wq + 1 / mu
+        l = lq + a
+
+    return _mask_invalid(
+        {"Rho": rho, "Pw": c, "Lq": lq, "L": l, "Wq": wq, "W": w}, valid
+    )
+
+
+VECTORIZED_MODELS: Dict[str, Callable[..., Dict[str, np.ndarray]]] = {
+    "MM1": mm1_metrics,
+    "MMS": mms_metrics,
+    "MM1K": mm1k_metrics,
+    "MMSK": mmsk_metrics,
+    "MG1": mg1_metrics,
+    "GGS": ggs_metrics,
+}
+
+
+def evaluate(model_type: str, **params) -> Dict[str, np.ndarray]:
+    """
+    Avalia um modelo sobre arrays de parâmetros
+
+    Args:
+        model_type: Tipo do modelo (ex: 'MM1', 'MMS', etc)
+        **params: Arrays ou escalares com os parâmetros do modelo
+
+    Returns:
+        Dicionário de métricas com um array por métrica
+
+    Raises:
+        ValueError: Se o modelo não tiver avaliação vetorizada
+    """
+    if model_type not in VECTORIZED_MODELS:
+        raise ValueError(
+            f"Modelo '{model_type}' não possui avaliação vetorizada. "
+            f"Modelos disponíveis: {', '.join(VECTORIZED_MODELS.keys())}"
+        )
+
+    try:
+        return VECTORIZED_MODELS[model_type](**params)
+    except TypeError as e:
+        raise ValueError(
+            f"Parâmetros inválidos para o modelo {model_type}: {str(e)}"
+        ) from e
+
+
+def _as_float_arrays(*values) -> list:
+    return np.broadcast_arrays(*(np.asarray(value, dtype=float) for value in values))
+
+
+def _mask_invalid(
+    metrics: Dict[str, np.ndarray], valid: np.ndarray
+) -> Dict[str, np.ndarray]:
+    return {key: np.where(valid, value, np.nan) for key, value in metrics.items()}
+
+
+def _log_factorials(m_max: int) -> np.ndarray:
+    """Tabela de log(m!) para m = 0, ..., m_max"""
+    return np.array([lgamma(m + 1) for m in range(m_max + 1)])
+
+
+def _log_poisson_terms(
+    log_a: np.ndarray, m: np.ndarray, log_factorials: np.ndarray
+) -> np.ndarray:
+    """Log de a^m / m! elemento a elemento, com m ≥ 0 limitado à tabela"""
+    m = np.clip(m, 0, len(log_factorials) - 1)
+    return np.where(m == 0, 0.0, m * log_a) - log_factorials[m]
+
+
+def _log_erlang_sums(
+    a: np.ndarray, s: np.ndarray, log_factorials: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Erlang B, o log do termo a^s / s! e o log da soma dos termos com n < s.
+
+    A soma não é acumulada termo a termo: como B = termo / (soma + termo),
+    ela vem de soma = termo·(1 - B) / B. Quando B fica abaixo do menor float
+    normal o termo é desprezível frente à soma, que então vale e^a.
+    """
+    b = erlang_b_array(s, a)
+    at_s = _log_poisson_terms(np.log(a), s, log_factorials)
+    below_s = np.where(b > _TINY, at_s + np.log1p(-b) - np.log(b), a)
+    return b, at_s, below_s
+
+
+def _log_partial_sums(log_a: np.ndarray, upper: np.ndarray) -> np.ndarray:
+    """
+    Log de Σ a^m / m! para m = 0, ..., upper, acumulado só nas linhas com
+    upper > 0 (upper = 0 dá log 1 e upper < 0, a soma vazia)
+    """
+    sums = np.where(upper >= 0, 0.0, -np.inf)
+    rows = np.flatnonzero(upper > 0)
+    if rows.size:
+        row_log_a = log_a.flat[rows]
+        row_upper = upper.flat[rows]
+        term = np.zeros(rows.size)
+        total = np.zeros(rows.size)
+        for m in range(1, int(row_upper.max()) + 1):
+            # log(a^m / m!) = log(a^(m-1) / (m-1)!) + log(a / m)
+            term = term + row_log_a - log(m)
+            total = np.where(m <= row_upper, np.logaddexp(total, term), total)
+        sums.flat[rows] = total
+    return sums
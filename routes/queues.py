@@ -1,9 +1,102 @@
-from flask import Blueprint, jsonify, request
+from typing import Optional
 
+from flask import Blueprint, Response, jsonify, request, stream_with_context
+
+from models.capacity import max_arrival_rate, max_arrival_rates
+from models.distribution import percentiles, probability_exceeding
+from models.mva import mva
+from models.network import DENSE_SOLVE_LIMIT, jackson_network
+from models.optimizer import minimum_servers
 from models.queue_factory import QueueFactory
+from models.registry import get_schema
+from models.schedule import schedule_metrics
+from models.staffing import staffing_schedule
+from models.transient import transient_metrics
+from services.calculation import (
+    build_distribution,
+    calculation_response,
+    serialize_metrics,
+    serialize_nested,
+)
+from services.instrumentation import PROMETHEUS_CONTENT_TYPE
+from services.queue_service import QueueService
+from services.streaming import NDJSON_MIMETYPE, ndjson_lines
+from services.sweep import csv_fieldnames, csv_lines, evaluate_grid, validate_grid
+from simulation.engine import SIMULATED_MODELS, simulate
+from simulation.replication import run_replications
+
+# Limite de eventos de uma simulação disparada pela API
+MAX_SIMULATION_EVENTS = 5_000_000
+MAX_SIMULATION_WORKERS = 8
 
 queues_bp = Blueprint("queues", __name__)
 
+# Limite de conjuntos de parâmetros aceitos em uma única requisição em lote
+MAX_BATCH_SIZE = 100_000
+
+# Limite de pontos de uma varredura disparada pela API
+MAX_SWEEP_POINTS = 10_000_000
+
+# Limites da análise transitória disparada pela API
+MAX_TRANSIENT_TIMES = 10_000
+MAX_TRANSIENT_STATES = 100_000
+MAX_SCHEDULE_INTERVALS = 100_000
+
+# Limites de uma rede de Jackson enviada à API
+MAX_NETWORK_STATIONS = 100_000
+MAX_NETWORK_ROUTES = 1_000_000
+# A MVA exata avança um cliente por vez; Schweitzer não depende de N
+MAX_CLOSED_POPULATION = 100_000
+
+# Conversores dos parâmetros aceitos pelo simulador
+_SIMULATION_CONVERTERS = {
+    "lamb": float,
+    "mu": float,
+    "s": int,
+    "k": int,
+    "N": int,
+    "var": float,
+}
+
+# Conversores dos parâmetros aceitos pelo otimizador de servidores
+_OPTIMIZER_CONVERTERS = {
+    "lamb": float,
+    "mu": float,
+    "target_wq": float,
+    "target_pwq": float,
+    "t": float,
+    "k": int,
+    "N": int,
+    "s_max": int,
+    "server_cost": float,
+    "waiting_cost": float,
+}
+
+# Conversores dos parâmetros aceitos pelo otimizador de escala
+_STAFFING_CONVERTERS = {
+    "mu": float,
+    "target_wq": float,
+    "target_pwq": float,
+    "t": float,
+    "k": int,
+    "interval": float,
+    "server_cost": float,
+    "waiting_cost": float,
+    "s_max": int,
+}
+
+# Conversores dos parâmetros aceitos pelo cálculo de capacidade
+_CAPACITY_CONVERTERS = {
+    "model_type": str,
+    "mu": float,
+    "metric": str,
+    "target": float,
+    "s": int,
+    "k": int,
+    "var": float,
+    "tol": float,
+}
+
 
 @queues_bp.route("/queues", methods=["GET"])
 def queues():
@@ -29,57 +122,419 @@ def calculate():
         if not model_type:
             return jsonify({"error": "model_type é obrigatório"}), 400
 
-        model_info = QueueFactory.get_model_info(model_type)
+        if _wants_stream(data):
+            schema = get_schema(model_type)
+            params = schema.coerce(data)
+            metrics = QueueService.calculate(model_type, **params)
 
-        params = {}
+            probabilities = None
+            if data.get("distribution"):
+                queue = QueueService.create_queue(model_type, **params)
+                probabilities = QueueService.timed(
+                    "distribution", model_type, params, queue.calculate_distribution
+                )
+            return _ndjson_response(
+                _calculation_lines(schema, metrics, probabilities, data)
+            )
+
+        body = calculation_response(model_type, data)
+        return QueueService.timed("serialize", model_type, data, lambda: jsonify(body)), 200
+
+    except ValueError as e:
+        return jsonify({"success": False, "error": str(e)}), 400
+    except Exception as e:
+        return jsonify({"success": False, "error": f"Erro interno: {str(e)}"}), 500
+
+
+@queues_bp.route("/api/calculate/batch", methods=["POST"])
+def calculate_batch():
+    """
+    Endpoint para calcular métricas de vários conjuntos de parâmetros
+
+    Aceita uma lista de objetos (``items`` ou o próprio corpo como lista) ou
+    um objeto orientado a colunas (``columns``). Os resultados são devolvidos
+    na mesma ordem da entrada, com erros reportados por linha.
+    """
+    try:
+        data = request.get_json()
 
-        # Parâmetros comuns - sempre obrigatórios
-        params["lamb"] = float(data.get("lamb", 0))
-        params["mu"] = float(data.get("mu", 0))
+        if not data:
+            return jsonify({"error": "Nenhum dado fornecido"}), 400
 
-        # Parâmetros específicos por modelo - apenas se listados nos params
-        if "s" in model_info.get("params", []):
-            params["s"] = int(data.get("s", 1))
+        rows = _expand_batch(data)
+        if len(rows) > MAX_BATCH_SIZE:
+            raise ValueError(
+                f"Lote excede o limite de {MAX_BATCH_SIZE} conjuntos de parâmetros."
+            )
 
-        if "k" in model_info.get("params", []):
-            params["k"] = int(data.get("k", 0))
+        if _wants_stream(data):
+            # Cada linha é calculada apenas quando o cliente a consome
+            return _ndjson_response(
+                {"index": index, **_calculate_row(row)} for index, row in enumerate(rows)
+            )
 
-        if "n" in model_info.get("params", []):
-            params["n"] = int(data.get("n", 0))
+        results = [_calculate_row(row) for row in rows]
 
-        if "N" in model_info.get("params", []):
-            params["N"] = int(data.get("N", 0))
+        return (
+            jsonify(
+                {
+                    "success": True,
+                    "count": len(results),
+                    "errors": sum(1 for result in results if not result["success"]),
+                    "results": results,
+                }
+            ),
+            200,
+        )
 
-        if "r" in model_info.get("params", []):
-            params["r"] = int(data.get("r", 0))
+    except ValueError as e:
+        return jsonify({"success": False, "error": str(e)}), 400
+    except Exception as e:
+        return jsonify({"success": False, "error": f"Erro interno: {str(e)}"}), 500
 
-        if "t" in model_info.get("params", []):
-            params["t"] = float(data.get("t", 0))
 
-        # Parâmetros especiais para modelos com prioridades
-        if "lamb_list" in model_info.get("params", []):
-            lamb_list = data.get("lamb_list", [])
-            if isinstance(lamb_list, str):
-                # Parse string como lista: "1,2,3" -> [1.0, 2.0, 3.0]
-                lamb_list = [
-                    float(x.strip()) for x in lamb_list.split(",") if x.strip()
-                ]
-            params["lamb_list"] = lamb_list
+@queues_bp.route("/api/sweep", methods=["POST"])
+def sweep():
+    """
+    Endpoint para varrer uma grade de parâmetros
 
-        # Criar fila e calcular métricas
-        queue = QueueFactory.create_queue(model_type, **params)
-        metrics = queue.calculate_metrics()
+    Os resultados são transmitidos linha a linha (NDJSON ou CSV) à medida
+    que cada bloco é avaliado.
+    """
+    try:
+        data = request.get_json()
 
-        # Serializar métricas
-        serialized_metrics = _serialize_metrics(metrics)
+        if not data:
+            return jsonify({"error": "Nenhum dado fornecido"}), 400
+
+        model_type = data.get("model_type")
+        if not model_type:
+            return jsonify({"error": "model_type é obrigatório"}), 400
+
+        grid = data.get("grid")
+        size = validate_grid(model_type, grid)
+        if size > MAX_SWEEP_POINTS:
+            raise ValueError(
+                f"Grade excede o limite de {MAX_SWEEP_POINTS} pontos."
+            )
+
+        output = data.get("format", "ndjson")
+        if output not in ("ndjson", "csv"):
+            raise ValueError("Formato deve ser 'ndjson' ou 'csv'.")
+
+        rows = evaluate_grid(
+            model_type,
+            grid,
+            chunk_size=int(data.get("chunk_size", 10_000)),
+            vectorized=bool(data.get("vectorized", True)),
+        )
+        if output == "ndjson":
+            return _ndjson_response(rows, headers={"X-Grid-Size": str(size)})
+
+        return Response(
+            stream_with_context(csv_lines(rows, csv_fieldnames(model_type, grid))),
+            mimetype="text/csv",
+            headers={"X-Grid-Size": str(size), "X-Accel-Buffering": "no"},
+        )
+
+    except ValueError as e:
+        return jsonify({"success": False, "error": str(e)}), 400
+    except Exception as e:
+        return jsonify({"success": False, "error": f"Erro interno: {str(e)}"}), 500
+
+
+@queues_bp.route("/api/simulate", methods=["POST"])
+def simulate_queue():
+    """Endpoint para estimar métricas por simulação de eventos discretos"""
+    try:
+        data = request.get_json()
+
+        if not data:
+            return jsonify({"error": "Nenhum dado fornecido"}), 400
+
+        model_type = data.get("model_type")
+        if not model_type:
+            return jsonify({"error": "model_type é obrigatório"}), 400
+
+        params, horizon, warmup = _simulation_params(model_type, data, 1)
+
+        result = simulate(
+            model_type,
+            horizon,
+            warmup=warmup,
+            batches=int(data.get("batches", 20)),
+            seed=data.get("seed"),
+            t=float(data["t"]) if data.get("t") is not None else None,
+            max_events=MAX_SIMULATION_EVENTS,
+            **params,
+        )
 
         return (
             jsonify(
                 {
                     "success": True,
                     "model": model_type,
-                    "model_name": model_info.get("name", model_type),
-                    "metrics": serialized_metrics,
+                    "metrics": serialize_nested(result["metrics"]),
+                    "confidence_intervals": serialize_nested(
+                        result["confidence_intervals"]
+                    ),
+                    "events": result["events"],
+                    "time": result["time"],
+                    "truncated": result["truncated"],
+                }
+            ),
+            200,
+        )
+
+    except ValueError as e:
+        return jsonify({"success": False, "error": str(e)}), 400
+    except Exception as e:
+        return jsonify({"success": False, "error": f"Erro interno: {str(e)}"}), 500
+
+
+@queues_bp.route("/api/simulate/replications", methods=["POST"])
+def simulate_replications():
+    """Endpoint para replicações independentes com parada por precisão"""
+    try:
+        data = request.get_json()
+
+        if not data:
+            return jsonify({"error": "Nenhum dado fornecido"}), 400
+
+        model_type = data.get("model_type")
+        if not model_type:
+            return jsonify({"error": "model_type é obrigatório"}), 400
+
+        max_replications = int(data.get("max_replications", 64))
+        workers = int(data.get("workers", 1))
+        if not 1 <= workers <= MAX_SIMULATION_WORKERS:
+            raise ValueError(f"workers deve estar entre 1 e {MAX_SIMULATION_WORKERS}.")
+        params, horizon, warmup = _simulation_params(model_type, data, max_replications)
+
+        result = run_replications(
+            model_type,
+            horizon,
+            warmup=warmup,
+            target_half_width=(
+                float(data["target_half_width"])
+                if data.get("target_half_width") is not None
+                else None
+            ),
+            metrics=data.get("metrics"),
+            min_replications=int(data.get("min_replications", 4)),
+            max_replications=max_replications,
+            workers=workers,
+            seed=data.get("seed"),
+            t=float(data["t"]) if data.get("t") is not None else None,
+            **params,
+        )
+
+        return (
+            jsonify(
+                {
+                    "success": True,
+                    "model": model_type,
+                    "metrics": serialize_nested(result["metrics"]),
+                    "confidence_intervals": serialize_nested(
+                        result["confidence_intervals"]
+                    ),
+                    "replications": result["replications"],
+                    "converged": result["converged"],
+                }
+            ),
+            200,
+        )
+
+    except ValueError as e:
+        return jsonify({"success": False, "error": str(e)}), 400
+    except Exception as e:
+        return jsonify({"success": False, "error": f"Erro interno: {str(e)}"}), 500
+
+
+@queues_bp.route("/api/optimize/servers", methods=["POST"])
+def optimize_servers():
+    """Endpoint para encontrar o menor número de servidores que atende às metas"""
+    try:
+        data = request.get_json()
+
+        if not data:
+            return jsonify({"error": "Nenhum dado fornecido"}), 400
+
+        model_type = data.get("model_type")
+        if not model_type:
+            return jsonify({"error": "model_type é obrigatório"}), 400
+
+        params = {
+            name: converter(data[name])
+            for name, converter in _OPTIMIZER_CONVERTERS.items()
+            if data.get(name) is not None
+        }
+        if "lamb" not in params or "mu" not in params:
+            raise ValueError("lamb e mu são obrigatórios.")
+
+        result = minimum_servers(model_type, **params)
+        curve = [serialize_metrics(point) for point in result.pop("curve")]
+
+        return (
+            jsonify(
+                {
+                    "success": True,
+                    "model": model_type,
+                    "s": result.pop("s"),
+                    "metrics": serialize_metrics(result),
+                    "curve": curve,
+                }
+            ),
+            200,
+        )
+
+    except ValueError as e:
+        return jsonify({"success": False, "error": str(e)}), 400
+    except Exception as e:
+        return jsonify({"success": False, "error": f"Erro interno: {str(e)}"}), 500
+
+
+@queues_bp.route("/api/optimize/staffing", methods=["POST"])
+def optimize_staffing():
+    """Endpoint para a escala de servidores de menor custo por intervalo"""
+    try:
+        data = request.get_json()
+
+        if not data:
+            return jsonify({"error": "Nenhum dado fornecido"}), 400
+
+        model_type = data.get("model_type")
+        if not model_type:
+            return jsonify({"error": "model_type é obrigatório"}), 400
+
+        lambs = data.get("lamb")
+        if not isinstance(lambs, list) or not lambs:
+            raise ValueError("lamb deve ser uma lista com a previsão de cada intervalo.")
+        if len(lambs) > MAX_SCHEDULE_INTERVALS:
+            raise ValueError(
+                f"A escala excede o limite de {MAX_SCHEDULE_INTERVALS} intervalos."
+            )
+
+        params = {
+            name: converter(data[name])
+            for name, converter in _STAFFING_CONVERTERS.items()
+            if data.get(name) is not None
+        }
+        if "mu" not in params:
+            raise ValueError("mu é obrigatório.")
+        if params.get("k", 0) > MAX_TRANSIENT_STATES:
+            raise ValueError(
+                f"O modelo excede o limite de {MAX_TRANSIENT_STATES} estados."
+            )
+
+        result = staffing_schedule(
+            model_type, [float(lamb) for lamb in lambs], **params
+        )
+
+        return jsonify({"success": True, "model": model_type, **result}), 200
+
+    except ValueError as e:
+        return jsonify({"success": False, "error": str(e)}), 400
+    except Exception as e:
+        return jsonify({"success": False, "error": f"Erro interno: {str(e)}"}), 500
+
+
+@queues_bp.route("/api/network", methods=["POST"])
+def network():
+    """Endpoint para resolver uma rede de Jackson aberta de estações M/M/1 e M/M/s"""
+    try:
+        data = request.get_json()
+
+        if not data:
+            return jsonify({"error": "Nenhum dado fornecido"}), 400
+
+        gamma = data.get("lamb")
+        if not isinstance(gamma, list) or not gamma:
+            raise ValueError("lamb deve ser uma lista com a chegada externa de cada estação.")
+        if len(gamma) > MAX_NETWORK_STATIONS:
+            raise ValueError(
+                f"A rede excede o limite de {MAX_NETWORK_STATIONS} estações."
+            )
+        if "mu" not in data:
+            raise ValueError("mu é obrigatório.")
+        routing, routes = data.get("routing"), data.get("routes")
+        if routing is not None and len(gamma) > DENSE_SOLVE_LIMIT:
+            raise ValueError(
+                f"Redes com mais de {DENSE_SOLVE_LIMIT} estações devem informar "
+                "as rotas como lista em routes."
+            )
+        if routes is not None and len(routes) > MAX_NETWORK_ROUTES:
+            raise ValueError(f"A rede excede o limite de {MAX_NETWORK_ROUTES} rotas.")
+
+        result = jackson_network(
+            gamma, data["mu"], data.get("s", 1), routing=routing, routes=routes
+        )
+
+        return jsonify({"success": True, **result}), 200
+
+    except ValueError as e:
+        return jsonify({"success": False, "error": str(e)}), 400
+    except Exception as e:
+        return jsonify({"success": False, "error": f"Erro interno: {str(e)}"}), 500
+
+
+@queues_bp.route("/api/network/closed", methods=["POST"])
+def closed_network():
+    """Endpoint para resolver uma rede fechada por MVA exata ou de Schweitzer"""
+    try:
+        data = request.get_json()
+
+        if not data:
+            return jsonify({"error": "Nenhum dado fornecido"}), 400
+
+        for name in ("N", "demands"):
+            if data.get(name) is None:
+                raise ValueError(f"{name} é obrigatório.")
+        populations = data["N"] if isinstance(data["N"], list) else [data["N"]]
+        method = data.get("method", "exact")
+        if method == "exact" and sum(float(n) for n in populations) > MAX_CLOSED_POPULATION:
+            raise ValueError(
+                f"A população excede o limite de {MAX_CLOSED_POPULATION} clientes da "
+                "MVA exata; use o método 'schweitzer'."
+            )
+
+        result = mva(
+            populations,
+            data["demands"],
+            servers=data.get("s", 1),
+            think_time=data.get("think_time", 0.0),
+            method=method,
+            curve=bool(data.get("curve")),
+        )
+
+        return jsonify({"success": True, **result}), 200
+
+    except ValueError as e:
+        return jsonify({"success": False, "error": str(e)}), 400
+    except Exception as e:
+        return jsonify({"success": False, "error": f"Erro interno: {str(e)}"}), 500
+
+
+@queues_bp.route("/api/capacity", methods=["POST"])
+def capacity():
+    """Endpoint para calcular o maior λ que atende a uma meta de W, Wq ou Pk"""
+    try:
+        data = request.get_json()
+
+        if not data:
+            return jsonify({"error": "Nenhum dado fornecido"}), 400
+
+        if not data.get("model_type"):
+            return jsonify({"error": "model_type é obrigatório"}), 400
+
+        result = max_arrival_rate(**_capacity_params(data))
+
+        return (
+            jsonify(
+                {
+                    "success": True,
+                    "model": data["model_type"],
+                    "result": serialize_metrics(result),
                 }
             ),
             200,
@@ -91,16 +546,353 @@ def calculate():
         return jsonify({"success": False, "error": f"Erro interno: {str(e)}"}), 500
 
 
-def _serialize_metrics(metrics: dict) -> dict:
-    """Converte valores não-serializáveis para JSON"""
-    serialized = {}
-    for key, value in metrics.items():
-        if value == float("inf"):
-            serialized[key] = "infinity"
-        elif value == float("-inf"):
-            serialized[key] = "-infinity"
-        elif isinstance(value, float):
-            serialized[key] = round(value, 6)
-        else:
-            serialized[key] = value
-    return serialized
+@queues_bp.route("/api/capacity/batch", methods=["POST"])
+def capacity_batch():
+    """
+    Endpoint para calcular a capacidade de várias configurações
+
+    Aceita uma lista de objetos (``items`` ou o próprio corpo como lista); os
+    resultados seguem a ordem da entrada, com erros reportados por linha.
+    """
+    try:
+        data = request.get_json()
+
+        if not data:
+            return jsonify({"error": "Nenhum dado fornecido"}), 400
+
+        rows = data.get("items") if isinstance(data, dict) else data
+        if not isinstance(rows, list):
+            raise ValueError("O lote deve ser uma lista de configurações.")
+        if len(rows) > MAX_BATCH_SIZE:
+            raise ValueError(
+                f"Lote excede o limite de {MAX_BATCH_SIZE} conjuntos de parâmetros."
+            )
+
+        configs, results = [], [None] * len(rows)
+        for index, row in enumerate(rows):
+            try:
+                if not isinstance(row, dict):
+                    raise ValueError("Cada item do lote deve ser um objeto.")
+                configs.append((index, _capacity_params(row)))
+            except ValueError as e:
+                results[index] = {"success": False, "error": str(e)}
+
+        solved = max_arrival_rates([params for _, params in configs])
+        for (index, params), result in zip(configs, solved):
+            if "error" in result:
+                results[index] = {"success": False, "error": result["error"]}
+            else:
+                results[index] = {
+                    "success": True,
+                    "model": params["model_type"],
+                    "result": serialize_metrics(result),
+                }
+
+        return (
+            jsonify(
+                {
+                    "success": True,
+                    "count": len(results),
+                    "errors": sum(1 for result in results if not result["success"]),
+                    "results": results,
+                }
+            ),
+            200,
+        )
+
+    except ValueError as e:
+        return jsonify({"success": False, "error": str(e)}), 400
+    except Exception as e:
+        return jsonify({"success": False, "error": f"Erro interno: {str(e)}"}), 500
+
+
+@queues_bp.route("/api/transient", methods=["POST"])
+def transient():
+    """Endpoint para a análise transitória (Pn(t), L(t), Pk(t)) por uniformização"""
+    try:
+        data = request.get_json()
+
+        if not data:
+            return jsonify({"error": "Nenhum dado fornecido"}), 400
+
+        model_type = data.get("model_type")
+        if not model_type:
+            return jsonify({"error": "model_type é obrigatório"}), 400
+
+        times = data.get("times")
+        if not isinstance(times, list) or not times:
+            raise ValueError("times deve ser uma lista de instantes.")
+        if len(times) > MAX_TRANSIENT_TIMES:
+            raise ValueError(
+                f"A grade excede o limite de {MAX_TRANSIENT_TIMES} instantes."
+            )
+
+        size = int(data.get("k") or data.get("N") or 0)
+        if size > MAX_TRANSIENT_STATES:
+            raise ValueError(
+                f"O modelo excede o limite de {MAX_TRANSIENT_STATES} estados."
+            )
+
+        initial = data.get("initial", 0)
+        result = transient_metrics(
+            model_type,
+            [float(t) for t in times],
+            lamb=float(data.get("lamb", 0)),
+            mu=float(data.get("mu", 0)),
+            s=int(data.get("s", 1)),
+            k=int(data["k"]) if data.get("k") is not None else None,
+            N=int(data["N"]) if data.get("N") is not None else None,
+            initial=initial if isinstance(initial, list) else int(initial),
+            distribution=bool(data.get("distribution")),
+        )
+
+        return jsonify({"success": True, "model": model_type, **result}), 200
+
+    except ValueError as e:
+        return jsonify({"success": False, "error": str(e)}), 400
+    except Exception as e:
+        return jsonify({"success": False, "error": f"Erro interno: {str(e)}"}), 500
+
+
+@queues_bp.route("/api/schedule", methods=["POST"])
+def schedule():
+    """Endpoint para métricas por intervalo sob uma escala de λ e s"""
+    try:
+        data = request.get_json()
+
+        if not data:
+            return jsonify({"error": "Nenhum dado fornecido"}), 400
+
+        model_type = data.get("model_type")
+        if not model_type:
+            return jsonify({"error": "model_type é obrigatório"}), 400
+
+        lambs = data.get("lamb")
+        if not isinstance(lambs, list) or not lambs:
+            raise ValueError("lamb deve ser uma lista com a taxa de cada intervalo.")
+        if len(lambs) > MAX_SCHEDULE_INTERVALS:
+            raise ValueError(
+                f"A escala excede o limite de {MAX_SCHEDULE_INTERVALS} intervalos."
+            )
+        k = int(data.get("k", 0))
+        if k > MAX_TRANSIENT_STATES:
+            raise ValueError(
+                f"O modelo excede o limite de {MAX_TRANSIENT_STATES} estados."
+            )
+
+        servers = data.get("s", 1)
+        initial = data.get("initial", 0)
+        result = schedule_metrics(
+            model_type,
+            [float(lamb) for lamb in lambs],
+            mu=float(data.get("mu", 0)),
+            k=k,
+            s_schedule=[int(s) for s in servers]
+            if isinstance(servers, list)
+            else int(servers),
+            interval=float(data.get("interval", 1.0)),
+            initial=initial if isinstance(initial, list) else int(initial),
+        )
+
+        return jsonify({"success": True, "model": model_type, **result}), 200
+
+    except ValueError as e:
+        return jsonify({"success": False, "error": str(e)}), 400
+    except Exception as e:
+        return jsonify({"success": False, "error": f"Erro interno: {str(e)}"}), 500
+
+
+@queues_bp.route("/api/cache", methods=["GET"])
+def cache_stats():
+    """Contadores do cache de resultados e do armazenamento persistente"""
+    return jsonify({**QueueService.cache_stats(), "store": QueueService.store_stats()})
+
+
+@queues_bp.route("/api/cache", methods=["DELETE"])
+def clear_cache():
+    """Esvazia o cache de resultados"""
+    QueueService.clear_cache()
+    return jsonify({"success": True})
+
+
+@queues_bp.route("/metrics", methods=["GET"])
+def metrics():
+    """Histogramas de latência e contadores no formato texto do Prometheus"""
+    return Response(QueueService.metrics_text(), content_type=PROMETHEUS_CONTENT_TYPE)
+
+
+@queues_bp.route("/api/coalescing", methods=["GET"])
+def coalescing_stats():
+    """Cálculos idênticos compartilhados e tempos de espera por chave"""
+    return jsonify(QueueService.coalescing_stats())
+
+
+def _expand_batch(data) -> list:
+    """Normaliza o corpo de uma requisição em lote para uma lista de linhas"""
+    if isinstance(data, list):
+        return data
+
+    if not isinstance(data, dict):
+        raise ValueError("Formato de lote inválido: esperado objeto ou lista.")
+
+    default_model = data.get("model_type")
+
+    if "items" in data:
+        items = data["items"]
+        if not isinstance(items, list):
+            raise ValueError("'items' deve ser uma lista de objetos.")
+        return [
+            {"model_type": default_model, **item} if isinstance(item, dict) else item
+            for item in items
+        ]
+
+    if "columns" in data:
+        columns = data["columns"]
+        if not isinstance(columns, dict) or not columns:
+            raise ValueError("'columns' deve ser um objeto de listas.")
+
+        # Valores escalares (ou um único lamb_list) são repetidos em todas as linhas
+        lengths = {
+            len(values) for name, values in columns.items() if _is_column(name, values)
+        }
+        if len(lengths) > 1:
+            raise ValueError("Todas as colunas devem ter o mesmo tamanho.")
+        size = lengths.pop() if lengths else 1
+
+        rows = []
+        for index in range(size):
+            row = {"model_type": default_model}
+            for name, values in columns.items():
+                row[name] = values[index] if _is_column(name, values) else values
+            rows.append(row)
+        return rows
+
+    raise ValueError("Lote deve conter 'items' ou 'columns'.")
+
+
+def _is_column(name: str, values) -> bool:
+    """Indica se o valor de uma coluna varia por linha"""
+    if not isinstance(values, list):
+        return False
+    if name == "lamb_list":
+        # lamb_list já é uma lista: só varia por linha se for uma lista de listas
+        return bool(values) and all(isinstance(v, (list, str)) for v in values)
+    return True
+
+
+def _calculate_row(row) -> dict:
+    """Calcula as métricas de uma linha do lote, capturando erros da linha"""
+    try:
+        if not isinstance(row, dict):
+            raise ValueError("Cada item do lote deve ser um objeto.")
+
+        model_type = row.get("model_type")
+        if not model_type:
+            raise ValueError("model_type é obrigatório")
+
+        params = get_schema(model_type).coerce(row)
+        metrics = QueueService.calculate(model_type, **params)
+
+        result = {
+            "success": True,
+            "model": model_type,
+            "metrics": serialize_metrics(metrics),
+        }
+        if row.get("distribution"):
+            queue = QueueService.create_queue(model_type, **params)
+            result["distribution"] = QueueService.timed(
+                "distribution", model_type, params, lambda: build_distribution(queue, row)
+            )
+        return result
+
+    except ValueError as e:
+        return {"success": False, "error": str(e)}
+    except Exception as e:
+        return {"success": False, "error": f"Erro interno: {str(e)}"}
+
+
+def _simulation_params(model_type: str, data: dict, replications: int) -> tuple:
+    """
+    Parâmetros do simulador, horizonte e aquecimento de uma requisição, com o
+    total de eventos das replicações limitado a MAX_SIMULATION_EVENTS
+    """
+    if model_type not in SIMULATED_MODELS:
+        raise ValueError(f"Modelo '{model_type}' não suportado pelo simulador.")
+
+    params = {}
+    for name in SIMULATED_MODELS[model_type]["params"]:
+        if name == "lamb_list":
+            params[name] = QueueFactory.parse_lamb_list(data.get(name, []))
+        elif data.get(name) is not None:
+            params[name] = _SIMULATION_CONVERTERS[name](data[name])
+
+    horizon = float(data.get("horizon", 10_000))
+    warmup = float(data.get("warmup", horizon * 0.1))
+    total_rate = sum(params.get("lamb_list", [])) or params.get("lamb", 0.0)
+    events = 2 * total_rate * params.get("N", 1) * horizon * replications
+    if events > MAX_SIMULATION_EVENTS:
+        raise ValueError(
+            f"Simulação excede o limite de {MAX_SIMULATION_EVENTS} eventos; "
+            "reduza o horizonte ou o número de replicações."
+        )
+    return params, horizon, warmup
+
+
+def _capacity_params(data: dict) -> dict:
+    """Converte os parâmetros do cálculo de capacidade, exigindo os obrigatórios"""
+    params = {
+        name: converter(data[name])
+        for name, converter in _CAPACITY_CONVERTERS.items()
+        if data.get(name) is not None
+    }
+    missing = [
+        name for name in ("model_type", "mu", "metric", "target") if name not in params
+    ]
+    if missing:
+        raise ValueError(f"Parâmetros obrigatórios ausentes: {', '.join(missing)}")
+    return params
+
+
+def _wants_stream(data) -> bool:
+    """Modo streaming: ``"stream": true`` no corpo ou ``Accept: application/x-ndjson``"""
+    if isinstance(data, dict) and data.get("stream"):
+        return True
+    return NDJSON_MIMETYPE in request.accept_mimetypes.values()
+
+
+def _ndjson_response(rows, headers: Optional[dict] = None) -> Response:
+    """
+    Resposta transmitida em partes (chunked), uma linha JSON por resultado,
+    produzida à medida que o cliente consome
+    """
+    return Response(
+        stream_with_context(ndjson_lines(rows)),
+        mimetype=NDJSON_MIMETYPE,
+        # Evita que proxies reverso acumulem a resposta antes de repassá-la
+        headers={"X-Accel-Buffering": "no", **(headers or {})},
+    )
+
+
+def _calculation_lines(schema, metrics, probabilities, data):
+    """Linhas do /api/calculate em streaming: métricas e depois um estado por linha"""
+    yield {
+        "success": True,
+        "model": schema.key,
+        "model_name": schema.name,
+        "metrics": metrics,
+    }
+    if probabilities is None:
+        return
+
+    for n, p in enumerate(probabilities):
+        yield {"n": n, "p": p}
+
+    summary = {}
+    if "r" in data:
+        summary["Pr"] = probability_exceeding(probabilities, int(data["r"]))
+    if data.get("percentiles"):
+        summary["percentiles"] = percentiles(
+            probabilities, [float(q) for q in data["percentiles"]]
+        )
+    if summary:
+        yield summary
@@ -0,0 +1,87 @@
+"""
+Montagem das respostas de cálculo, compartilhada pelas rotas Flask e pelo
+app ASGI (``asgi.py``), para que os dois exponham o mesmo contrato.
+"""
+
+from typing import Any, Dict
+
+from models.distribution import percentiles, probability_exceeding
+from models.registry import get_schema
+from services.queue_service import QueueService
+
+
+def calculation_response(model_type: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Corpo da resposta de ``/api/calculate`` para um modelo e seus parâmetros
+
+    Raises:
+        ValueError: Se o modelo ou os parâmetros forem inválidos
+    """
+    schema = get_schema(model_type)
+    params = schema.coerce(data)
+
+    # Calcular métricas (reaproveitando resultados em cache)
+    metrics = QueueService.calculate(model_type, **params)
+
+    response = {
+        "success": True,
+        "model": model_type,
+        "model_name": schema.name,
+        "metrics": serialize_metrics(metrics),
+    }
+
+    # Distribuição completa P0..Pmax apenas quando solicitada
+    if data.get("distribution"):
+        queue = QueueService.create_queue(model_type, **params)
+        response["distribution"] = QueueService.timed(
+            "distribution", model_type, params, lambda: build_distribution(queue, data)
+        )
+
+    return response
+
+
+def build_distribution(queue, data: dict) -> dict:
+    """Monta a distribuição de estados e as consultas derivadas dela"""
+    probabilities = queue.calculate_distribution()
+    distribution = {"probabilities": [round(p, 6) for p in probabilities]}
+
+    if "r" in data:
+        pr = probability_exceeding(probabilities, int(data["r"]))
+        distribution["Pr"] = round(pr, 6)
+
+    if data.get("percentiles"):
+        distribution["percentiles"] = percentiles(
+            probabilities, [float(q) for q in data["percentiles"]]
+        )
+
+    return distribution
+
+
+def serialize_nested(values: dict) -> dict:
+    """Arredonda valores aninhados e troca nan por None (JSON válido)"""
+    serialized = {}
+    for key, value in values.items():
+        if isinstance(value, dict):
+            serialized[key] = serialize_nested(value)
+        elif isinstance(value, float) and value != value:
+            serialized[key] = None
+        elif isinstance(value, float):
+            serialized[key] = round(value, 6)
+        else:
+            serialized[key] = value
+    return serialized
+
+
+def serialize_metrics(metrics: dict) -> dict:
+    """Converte valores não-serializáveis para JSON"""
+    serialized = {}
+    for key, value in metrics.items():
+        if value == float("inf"):
+            serialized[key] = "infinity"
+        elif value == float("-inf"):
+            serialized[key] = "-infinity"
+        elif isinstance(value, float):
+            serialized[key] = round(value, 6)
+        else:
+            serialized[key] = value
+    return serialized
@@ -0,0 +1,298 @@
+"""
+Instrumentação do caminho quente: histogramas de latência, contagens de
+chamadas e de erros por etapa, modelo e faixa de tamanho dos parâmetros,
+expostos no formato texto do Prometheus.
+
+Para que o custo no caminho quente fique abaixo de 1%, a latência é
+amostrada: uma em cada ``sample_every`` chamadas é cronometrada e entra nos
+histogramas com peso ``sample_every``, de modo que contagens e somas estimam
+o total. As demais custam só a chamada que decide a amostra. Erros são
+contados em todas as chamadas, no próprio tratamento da exceção. Cada thread
+escreve no seu próprio conjunto de séries, sem lock; os conjuntos são somados
+quando ``/metrics`` é lido, e o de uma thread encerrada é incorporado ao total.
+"""
+
+import itertools
+import threading
+import weakref
+from bisect import bisect_left
+from time import perf_counter as _perf_counter
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from models.registry import MODEL_REGISTRY
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Limites superiores dos buckets de latência, em segundos
+LATENCY_BUCKETS = (
+    0.00001,
+    0.000025,
+    0.00005,
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+# Uma em cada SAMPLE_EVERY chamadas tem a latência registrada
+SAMPLE_EVERY = 64
+
+# Faixas do maior parâmetro de tamanho (s, k, N ou número de classes)
+SIZE_LIMITS = (10, 100, 1000, 10_000)
+SIZE_LABELS = ("1-10", "11-100", "101-1000", "1001-10000", "10001+")
+_SIZE_PARAMS = ("s", "k", "N")
+
+
+def size_bucket(params: Mapping[str, Any]) -> str:
+    """Faixa de tamanho de um conjunto de parâmetros (convertidos ou brutos)"""
+    size = 0
+    for name in _SIZE_PARAMS:
+        value = params.get(name)
+        if value is None:
+            continue
+        if value.__class__ is not int:
+            # Valores brutos (texto, float) só aparecem antes da conversão
+            try:
+                value = int(float(value))
+            except (TypeError, ValueError):
+                continue
+        if value > size:
+            size = value
+    classes = params.get("lamb_list")
+    if classes.__class__ is list and len(classes) > size:
+        size = len(classes)
+    return SIZE_LABELS[bisect_left(SIZE_LIMITS, size)]
+
+
+def model_label(model_type: Any) -> str:
+    """Rótulo do modelo; tipos desconhecidos viram 'unknown' para não criar séries"""
+    return model_type if model_type in MODEL_REGISTRY else "unknown"
+
+
+class _Shard:
+    """Séries escritas por uma única thread"""
+
+    __slots__ = ("series", "__weakref__")
+
+    def __init__(self) -> None:
+        # Por série: contagens por bucket (+Inf no fim), soma, total e erros
+        self.series: Dict[Tuple[str, str, str], List[Any]] = {}
+
+
+class Instrumentation:
+    """
+    Histogramas de latência por (etapa, modelo, faixa de tamanho)
+
+    As etapas usadas pelo serviço são ``create`` (construção do modelo),
+    ``calculate`` (``calculate_metrics``) e ``serialize`` (resposta JSON).
+
+    No caminho quente, ``sample()`` decide o que fazer com cada chamada:
+    cronometrar (True), só contar erros (False) ou nada, com a
+    instrumentação desligada (None). É o ``__next__`` de um iterador de
+    ``itertools``, uma chamada em C atômica sob o GIL, refeito sempre que
+    ``enabled`` ou o intervalo mudam.
+    """
+
+    def __init__(self, enabled: bool = True, sample_every: int = SAMPLE_EVERY) -> None:
+        self._enabled = enabled
+        self._local = threading.local()
+        # O lock só protege a criação e o descarte de shards e a leitura
+        self._lock = threading.Lock()
+        self._shards: "weakref.WeakSet[_Shard]" = weakref.WeakSet()
+        self._retired: Dict[Tuple[str, str, str], List[Any]] = {}
+        self.configure_sampling(sample_every)
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, value: bool) -> None:
+        self._enabled = value
+        self._update_sample()
+
+    def configure_sampling(self, sample_every: int) -> None:
+        """Cronometra uma em cada ``sample_every`` chamadas (1 cronometra todas)"""
+        if sample_every < 1:
+            raise ValueError("sample_every deve ser um inteiro positivo.")
+        self.sample_every = sample_every
+        self._update_sample()
+
+    def _update_sample(self) -> None:
+        if self._enabled:
+            ticks = itertools.cycle([True] + [False] * (self.sample_every - 1))
+        else:
+            ticks = itertools.repeat(None)
+        self.sample: Callable[[], Optional[bool]] = ticks.__next__
+
+    def timed(
+        self,
+        stage: str,
+        model_type: str,
+        params: Mapping[str, Any],
+        function: Callable[[], Any],
+    ) -> Any:
+        """Executa a função registrando a duração e se ela levantou exceção"""
+        sampled = self.sample()
+        if sampled is None:
+            return function()
+        if not sampled:
+            try:
+                return function()
+            except BaseException:
+                self.fail(stage, model_type, size_bucket(params))
+                raise
+        size = size_bucket(params)
+        weight = self.sample_every
+        start = _perf_counter()
+        try:
+            result = function()
+        except BaseException:
+            self.observe(stage, model_type, size, _perf_counter() - start, True, weight)
+            raise
+        self.observe(stage, model_type, size, _perf_counter() - start, False, weight)
+        return result
+
+    def observe(
+        self,
+        stage: str,
+        model_type: str,
+        size: str,
+        seconds: float,
+        failed: bool = False,
+        weight: int = 1,
+    ) -> None:
+        """Registra uma duração, contada ``weight`` vezes no histograma"""
+        series = self._get_series(stage, model_type, size)
+        series[bisect_left(LATENCY_BUCKETS, seconds)] += weight
+        series[_SUM] += seconds * weight
+        series[_COUNT] += weight
+        if failed:
+            series[_ERRORS] += 1
+
+    def fail(self, stage: str, model_type: str, size: str) -> None:
+        """Conta um erro de uma chamada fora da amostra"""
+        self._get_series(stage, model_type, size)[_ERRORS] += 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self._retired.clear()
+            for shard in list(self._shards):
+                shard.series.clear()
+
+    def snapshot(self) -> Dict[Tuple[str, str, str], Dict[str, Any]]:
+        """Soma das séries de todas as threads (buckets não cumulativos)"""
+        with self._lock:
+            merged: Dict[Tuple[str, str, str], List[Any]] = {}
+            _merge(merged, self._retired)
+            for shard in list(self._shards):
+                _merge(merged, shard.series)
+        return {
+            key: {
+                "buckets": series[:_SLOTS],
+                "sum": series[_SUM],
+                "count": series[_COUNT],
+                "errors": series[_ERRORS],
+            }
+            for key, series in merged.items()
+        }
+
+    def _get_series(self, stage: str, model_type: str, size: str) -> List[Any]:
+        try:
+            series_map = self._local.shard.series
+        except AttributeError:
+            series_map = self._new_shard().series
+        key = (stage, model_type, size)
+        series = series_map.get(key)
+        if series is None:
+            key = (stage, model_label(model_type), size)
+            series = series_map.setdefault(key, [0] * _SLOTS + [0.0, 0, 0])
+        return series
+
+    def _new_shard(self) -> _Shard:
+        shard = _Shard()
+        self._local.shard = shard
+        with self._lock:
+            self._shards.add(shard)
+        # Quando a thread termina o shard é coletado e suas séries vão para o total
+        weakref.finalize(shard, self._retire, shard.series)
+        return shard
+
+    def _retire(self, series: Dict[Tuple[str, str, str], List[Any]]) -> None:
+        with self._lock:
+            _merge(self._retired, series)
+
+    def render(
+        self, extra: Optional[Iterable[Tuple[str, str, str, float]]] = None
+    ) -> str:
+        """
+        Texto no formato de exposição do Prometheus
+
+        Args:
+            extra: Métricas adicionais como (nome, tipo, ajuda, valor)
+        """
+        lines: List[str] = [
+            "# HELP queue_stage_duration_seconds Duração de cada etapa do cálculo.",
+            "# TYPE queue_stage_duration_seconds histogram",
+        ]
+        snapshot = sorted(self.snapshot().items())
+        for (stage, model, size), series in snapshot:
+            labels = f'stage="{stage}",model="{_escape(model)}",size="{size}"'
+            cumulative = 0
+            for limit, count in zip(LATENCY_BUCKETS, series["buckets"]):
+                cumulative += count
+                lines.append(
+                    f'queue_stage_duration_seconds_bucket{{{labels},le="{limit:g}"}} '
+                    f"{cumulative}"
+                )
+            lines.append(
+                f'queue_stage_duration_seconds_bucket{{{labels},le="+Inf"}} '
+                f"{series['count']}"
+            )
+            lines.append(f"queue_stage_duration_seconds_sum{{{labels}}} {series['sum']!r}")
+            lines.append(f"queue_stage_duration_seconds_count{{{labels}}} {series['count']}")
+
+        lines.append("# HELP queue_stage_errors_total Etapas que terminaram em exceção.")
+        lines.append("# TYPE queue_stage_errors_total counter")
+        for (stage, model, size), series in snapshot:
+            labels = f'stage="{stage}",model="{_escape(model)}",size="{size}"'
+            lines.append(f"queue_stage_errors_total{{{labels}}} {series['errors']}")
+
+        for name, kind, description, value in extra or ():
+            lines.append(f"# HELP {name} {description}")
+            lines.append(f"# TYPE {name} {kind}")
+            lines.append(f"{name} {value}")
+        return "\n".join(lines) + "\n"
+
+
+_SLOTS = len(LATENCY_BUCKETS) + 1
+_SUM, _COUNT, _ERRORS = _SLOTS, _SLOTS + 1, _SLOTS + 2
+
+
+def _merge(
+    target: Dict[Tuple[str, str, str], List[Any]],
+    source: Dict[Tuple[str, str, str], List[Any]],
+) -> None:
+    for key, series in list(source.items()):
+        total = target.get(key)
+        if total is None:
+            target[key] = list(series)
+        else:
+            for index, value in enumerate(series):
+                total[index] += value
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
@@ -0,0 +1,230 @@
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional
+
+from models.base_queue import BaseQueueModel
+from models.queue_factory import QueueFactory
+from services.instrumentation import Instrumentation, size_bucket
+from services.result_cache import ResultCache
+from services.result_store import ResultStore
+from services.singleflight import SingleFlight
+
+
+class QueueService:
+    """
+    Camada de serviço entre as rotas e a QueueFactory, com cache de resultados
+
+    Em caso de falta no cache, requisições idênticas simultâneas compartilham
+    um único cálculo (single-flight), cuja construção do modelo e chamada a
+    ``calculate_metrics`` são instrumentadas. Quando configurado, um
+    armazenamento persistente (``ResultStore``) é consultado antes de
+    calcular e preserva os resultados entre reinícios.
+    """
+
+    _cache = ResultCache()
+    _flights = SingleFlight()
+    _metrics = Instrumentation()
+    # ``_metrics.sample`` como atributo de classe: no caminho quente, uma
+    # única chamada em C decide entre desligada, fora da amostra e amostrada
+    _sample = _metrics.sample
+    _store: Optional[ResultStore] = None
+
+    @classmethod
+    def calculate(cls, model_type: str, **params) -> Dict[str, Any]:
+        """
+        Calcula as métricas de um modelo, reaproveitando resultados anteriores
+
+        Args:
+            model_type: Tipo do modelo (ex: 'MM1', 'MM1K', etc)
+            **params: Parâmetros já convertidos para o modelo
+
+        Returns:
+            Métricas retornadas por ``calculate_metrics``
+
+        Raises:
+            ValueError: Se o modelo ou os parâmetros forem inválidos
+        """
+        key = ResultCache.make_key(model_type, params)
+        return cls._cache.get_or_compute(
+            key, lambda: cls._flights.do(key, lambda: cls._load_or_compute(model_type, params))
+        )
+
+    @classmethod
+    def calculate_many(cls, model_type: str, params_list: List[Dict[str, Any]]) -> List[Any]:
+        """
+        Calcula vários conjuntos de parâmetros do mesmo modelo sem passar pelo
+        cache em memória, com leitura e gravação em lote no armazenamento
+
+        Returns:
+            Para cada conjunto, as métricas ou a exceção levantada
+        """
+        store = cls._store
+        keys, stored = [], {}
+        if store is not None:
+            keys = [ResultStore.make_key(model_type, params) for params in params_list]
+            stored = store.get_many(keys)
+
+        results: List[Any] = []
+        computed = []
+        for index, params in enumerate(params_list):
+            if keys and keys[index] in stored:
+                results.append(stored[keys[index]])
+                continue
+            try:
+                metrics = cls._compute(model_type, params)
+            except Exception as e:
+                results.append(e)
+                continue
+            results.append(metrics)
+            if store is not None:
+                computed.append((keys[index], model_type, metrics))
+
+        if computed:
+            store.put_many(computed)
+        return results
+
+    @classmethod
+    def create_queue(cls, model_type: str, **params) -> BaseQueueModel:
+        """``QueueFactory.create_queue`` com a construção instrumentada"""
+        return cls._metrics.timed(
+            "create",
+            model_type,
+            params,
+            lambda: QueueFactory.create_queue(model_type, **params),
+        )
+
+    @classmethod
+    def timed(
+        cls,
+        stage: str,
+        model_type: str,
+        params: Dict[str, Any],
+        function: Callable[[], Any],
+    ) -> Any:
+        """Executa uma etapa (ex: 'serialize') registrando sua duração"""
+        return cls._metrics.timed(stage, model_type, params, function)
+
+    @classmethod
+    def _load_or_compute(cls, model_type: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        store = cls._store
+        if store is None:
+            return cls._compute(model_type, params)
+        key = ResultStore.make_key(model_type, params)
+        metrics = store.get(key)
+        if metrics is None:
+            metrics = cls._compute(model_type, params)
+            store.put(key, model_type, metrics)
+        return metrics
+
+    @classmethod
+    def _compute(cls, model_type: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        # Caminho mais quente do serviço. Fora da amostra, ligada ou não, a
+        # instrumentação só conta as falhas, e o ``try`` não custa nada quando
+        # não há exceção; as chamadas amostradas são cronometradas à parte
+        sampled = cls._sample()
+        if sampled:
+            return cls._compute_sampled(model_type, params)
+        try:
+            queue = QueueFactory.create_queue(model_type, **params)
+        except BaseException:
+            if sampled is not None:
+                cls._metrics.fail("create", model_type, size_bucket(params))
+            raise
+        try:
+            return queue.calculate_metrics()
+        except BaseException:
+            if sampled is not None:
+                cls._metrics.fail("calculate", model_type, size_bucket(params))
+            raise
+
+    @classmethod
+    def _compute_sampled(cls, model_type: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        # As duas etapas são cronometradas em linha, sem os closures de ``timed``
+        metrics = cls._metrics
+        size = size_bucket(params)
+        weight = metrics.sample_every
+        start = perf_counter()
+        try:
+            queue = QueueFactory.create_queue(model_type, **params)
+        except BaseException:
+            metrics.observe("create", model_type, size, perf_counter() - start, True, weight)
+            raise
+        built = perf_counter()
+        try:
+            result = queue.calculate_metrics()
+        except BaseException:
+            finished = perf_counter()
+            metrics.observe("create", model_type, size, built - start, False, weight)
+            metrics.observe("calculate", model_type, size, finished - built, True, weight)
+            raise
+        finished = perf_counter()
+        metrics.observe("create", model_type, size, built - start, False, weight)
+        metrics.observe("calculate", model_type, size, finished - built, False, weight)
+        return result
+
+    @classmethod
+    def configure_cache(cls, max_size: int) -> None:
+        """Redimensiona o cache (0 desativa)"""
+        cls._cache.resize(max_size)
+
+    @classmethod
+    def cache_stats(cls) -> Dict[str, int]:
+        return cls._cache.stats()
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        cls._cache.clear()
+
+    @classmethod
+    def configure_store(cls, path: Optional[str], max_entries: int = 1_000_000) -> None:
+        """Abre o armazenamento persistente em ``path`` (None desativa)"""
+        previous = cls._store
+        cls._store = ResultStore(path, max_entries) if path else None
+        if previous is not None:
+            previous.close()
+
+    @classmethod
+    def store_stats(cls) -> Optional[Dict[str, Any]]:
+        return cls._store.stats() if cls._store else None
+
+    @classmethod
+    def coalescing_stats(cls) -> Dict[str, Any]:
+        return cls._flights.stats()
+
+    @classmethod
+    def configure_metrics(cls, enabled: bool, sample_every: Optional[int] = None) -> None:
+        """Liga ou desliga a instrumentação e, se dado, o intervalo de amostragem"""
+        cls._metrics.enabled = enabled
+        if sample_every is not None:
+            cls._metrics.configure_sampling(sample_every)
+        cls._sample = cls._metrics.sample
+
+    @classmethod
+    def metrics_text(cls) -> str:
+        """Métricas no formato do Prometheus, incluindo cache e coalescência"""
+        cache = cls._cache.stats()
+        flights = cls._flights.stats()
+        return cls._metrics.render(
+            [
+                ("queue_cache_hits_total", "counter", "Acertos do cache.", cache["hits"]),
+                ("queue_cache_misses_total", "counter", "Faltas do cache.", cache["misses"]),
+                (
+                    "queue_cache_evictions_total",
+                    "counter",
+                    "Entradas descartadas do cache.",
+                    cache["evictions"],
+                ),
+                ("queue_cache_entries", "gauge", "Entradas no cache.", cache["size"]),
+                (
+                    "queue_coalesced_total",
+                    "counter",
+                    "Chamadas que aguardaram um cálculo idêntico em andamento.",
+                    flights["shared"],
+                ),
+                (
+                    "queue_in_flight",
+                    "gauge",
+                    "Cálculos distintos em andamento.",
+                    flights["in_flight"],
+                ),
+            ]
+        )
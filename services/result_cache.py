@@ -0,0 +1,105 @@
+import copy
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+
+class ResultCache:
+    """
+    Cache LRU limitado e thread-safe para métricas calculadas
+
+    Erros de validação (``ValueError``) também são armazenados, de modo que
+    requisições inválidas repetidas não reconstroem o modelo.
+    """
+
+    def __init__(self, max_size: int = 1024) -> None:
+        if max_size < 0:
+            raise ValueError("Tamanho máximo do cache deve ser não negativo.")
+        self.max_size = max_size
+        self._entries: "OrderedDict[Hashable, Tuple[bool, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._negative_hits = 0
+
+    @staticmethod
+    def make_key(model_type: str, params: Dict[str, Any]) -> Tuple:
+        """Chave canônica: tipo do modelo + parâmetros ordenados e imutáveis"""
+        return (model_type, tuple(sorted((k, _freeze(v)) for k, v in params.items())))
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Devolve o valor em cache ou calcula, armazena e devolve"""
+        if self.max_size == 0:
+            return compute()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                if not entry[0]:
+                    self._negative_hits += 1
+            else:
+                self._misses += 1
+
+        if entry is not None:
+            return _unpack(entry)
+
+        # O cálculo acontece fora do lock para não serializar as requisições
+        try:
+            entry = (True, compute())
+        except ValueError as e:
+            entry = (False, str(e))
+
+        self._store(key, entry)
+        return _unpack(entry)
+
+    def resize(self, max_size: int) -> None:
+        if max_size < 0:
+            raise ValueError("Tamanho máximo do cache deve ser não negativo.")
+        with self._lock:
+            self.max_size = max_size
+            self._evict()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "negative_hits": self._negative_hits,
+            }
+
+    def _store(self, key: Hashable, entry: Tuple[bool, Any]) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            self._evict()
+
+    def _evict(self) -> None:
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+
+def _freeze(value: Any) -> Hashable:
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    return value
+
+
+def _unpack(entry: Tuple[bool, Any]) -> Any:
+    ok, value = entry
+    if not ok:
+        raise ValueError(value)
+    # Cópia para que o chamador não altere o valor armazenado
+    return copy.deepcopy(value)
@@ -0,0 +1,227 @@
+"""
+Armazenamento persistente de métricas calculadas em SQLite (modo WAL).
+
+Cada resultado é endereçado pelo conteúdo: SHA-256 do tipo do modelo, dos
+parâmetros canonizados e de uma versão do modelo derivada do código-fonte
+do módulo da sua classe e dos módulos ``models.*`` que ele importa, direta
+ou indiretamente, de modo que alterar um modelo ou o núcleo numérico que ele
+usa invalida apenas os resultados afetados. O modo WAL permite que vários
+processos leiam enquanto um escreve.
+
+Ao passar de ``max_entries``, os resultados acessados há mais tempo são
+descartados.
+"""
+
+import ast
+import hashlib
+import importlib
+import importlib.util
+import inspect
+import json
+import sqlite3
+import threading
+import time
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from models.registry import get_schema
+
+# Incrementar quando o formato armazenado mudar
+STORE_VERSION = 1
+
+# Fração extra descartada a cada despejo, para não despejar a cada escrita
+EVICTION_SLACK = 0.1
+
+# Limite de variáveis por comando do SQLite
+_CHUNK = 500
+
+# Pacote cujos módulos entram na versão de um modelo
+_MODEL_PACKAGE = "models"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    key TEXT PRIMARY KEY,
+    model TEXT NOT NULL,
+    value TEXT NOT NULL,
+    accessed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed);
+"""
+
+
+@lru_cache(maxsize=None)
+def model_version(model_type: str) -> str:
+    """
+    Hash do código-fonte do módulo que define a classe do modelo e dos
+    módulos ``models.*`` que ele importa, direta ou indiretamente
+    """
+    model_class = get_schema(model_type).model_class
+    digest = hashlib.sha256(f"{STORE_VERSION}:".encode())
+    try:
+        for name, source in _module_sources(model_class.__module__):
+            digest.update(f"{name}\0{source}\0".encode())
+    except (OSError, TypeError):
+        digest.update(model_class.__qualname__.encode())
+    return digest.hexdigest()[:16]
+
+
+def _module_sources(root: str) -> List[Tuple[str, str]]:
+    """Código-fonte de ``root`` e dos módulos do pacote que ele alcança"""
+    sources: Dict[str, str] = {}
+    pending = [root]
+    while pending:
+        name = pending.pop()
+        if name in sources:
+            continue
+        sources[name] = inspect.getsource(importlib.import_module(name))
+        pending.extend(_package_imports(sources[name]) - sources.keys())
+    return sorted(sources.items())
+
+
+def _package_imports(source: str) -> Set[str]:
+    """Módulos de ``models`` citados em ``import`` e ``from ... import``"""
+    found = set()
+    for node in ast.walk(ast.parse(source)):
+        if isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+            # "from models import erlang" também importa models.erlang
+            names = [node.module] + [f"{node.module}.{alias.name}" for alias in node.names]
+        else:
+            continue
+        found.update(
+            name
+            for name in names
+            if name.startswith(f"{_MODEL_PACKAGE}.") and _is_module(name)
+        )
+    return found
+
+
+def _is_module(name: str) -> bool:
+    try:
+        return importlib.util.find_spec(name) is not None
+    except ModuleNotFoundError:
+        return False
+
+
+class ResultStore:
+    """
+    Resultados persistidos entre reinícios, com leituras e escritas em lote
+
+    Apenas cálculos bem-sucedidos são armazenados; erros de validação ficam
+    no cache em memória (``ResultCache``).
+    """
+
+    def __init__(self, path: str, max_entries: int = 1_000_000) -> None:
+        if max_entries < 1:
+            raise ValueError("Tamanho máximo do armazenamento deve ser positivo.")
+        self.path = path
+        self.max_entries = max_entries
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+        self._estimated_size = self._count()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @staticmethod
+    def make_key(model_type: str, params: Dict[str, Any]) -> str:
+        """Endereço do resultado: modelo, versão do modelo e parâmetros canônicos"""
+        canonical = json.dumps(
+            [model_type, model_version(model_type), params],
+            sort_keys=True,
+            separators=(",", ":"),
+        )
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """Resultados encontrados, por chave; as ausentes não aparecem"""
+        keys = list(dict.fromkeys(keys))
+        found: Dict[str, Any] = {}
+        with self._lock:
+            for start in range(0, len(keys), _CHUNK):
+                chunk = keys[start : start + _CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._connection.execute(
+                    f"SELECT key, value FROM results WHERE key IN ({placeholders})",
+                    chunk,
+                ).fetchall()
+                found.update((key, json.loads(value)) for key, value in rows)
+            if found:
+                now = time.time()
+                self._connection.executemany(
+                    "UPDATE results SET accessed = ? WHERE key = ?",
+                    [(now, key) for key in found],
+                )
+                self._connection.commit()
+            self._hits += len(found)
+            self._misses += len(keys) - len(found)
+        return found
+
+    def put(self, key: str, model_type: str, value: Any) -> None:
+        self.put_many([(key, model_type, value)])
+
+    def put_many(self, items: Iterable[Tuple[str, str, Any]]) -> None:
+        """Grava (chave, modelo, valor) em uma única transação"""
+        now = time.time()
+        rows = [(key, model, json.dumps(value), now) for key, model, value in items]
+        if not rows:
+            return
+        with self._lock:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO results (key, model, value, accessed) "
+                "VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            self._connection.commit()
+            self._estimated_size += len(rows)
+            if self._estimated_size > self.max_entries:
+                self._evict()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._connection.execute("DELETE FROM results")
+            self._connection.commit()
+            self._estimated_size = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "path": self.path,
+                "size": self._count(),
+                "max_entries": self.max_entries,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def _count(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def _evict(self) -> None:
+        # A estimativa ignora escritas de outros processos e substituições;
+        # a contagem exata só é feita quando ela passa do limite
+        size = self._count()
+        excess = size - self.max_entries
+        if excess > 0:
+            excess = min(size, excess + int(self.max_entries * EVICTION_SLACK))
+            self._connection.execute(
+                "DELETE FROM results WHERE key IN "
+                "(SELECT key FROM results ORDER BY accessed LIMIT ?)",
+                (excess,),
+            )
+            self._connection.commit()
+            self._evictions += excess
+            size -= excess
+        self._estimated_size = max(size, 0)
+
@@ -0,0 +1,170 @@
+"""
+Coalescência de cálculos idênticos em andamento (single-flight).
+
+A primeira chamada de uma chave (a líder) executa o cálculo; as que chegam
+enquanto ele está em andamento esperam e recebem o mesmo resultado, em vez
+de recalcular. Ao contrário do cache, nada fica guardado depois que o
+cálculo termina: o objetivo é eliminar a rajada de requisições simultâneas
+mesmo com o cache frio.
+"""
+
+import asyncio
+import copy
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+
+class _Call:
+    """Cálculo em andamento compartilhado pelas threads que pediram a mesma chave"""
+
+    __slots__ = ("done", "value", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Deduplicação de cálculos em andamento por chave
+
+    ``do`` atende threads (rotas Flask, executor do ASGI) e ``do_async``
+    atende corrotinas de um mesmo laço de eventos. As métricas de espera são
+    mantidas por chave para as ``max_keys`` chaves usadas mais recentemente.
+    """
+
+    def __init__(self, max_keys: int = 256) -> None:
+        self.max_keys = max_keys
+        self._calls: Dict[Hashable, _Call] = {}
+        self._async_calls: Dict[Hashable, asyncio.Future] = {}
+        self._async_waiters: Dict[Hashable, int] = {}
+        self._lock = threading.Lock()
+        self._keys: "OrderedDict[Hashable, Dict[str, float]]" = OrderedDict()
+        self._leaders = 0
+        self._shared = 0
+
+    def do(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """
+        Executa ``compute`` ou aguarda a execução já em andamento da mesma chave
+
+        Quem aguarda recebe uma cópia do resultado (ou da exceção).
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        start = time.perf_counter()
+        if leader:
+            try:
+                call.value = compute()
+            except BaseException as e:
+                call.error = e
+            finally:
+                with self._lock:
+                    del self._calls[key]
+                call.done.set()
+        else:
+            call.done.wait()
+        self._record(key, not leader, time.perf_counter() - start)
+
+        if call.error is not None:
+            if leader:
+                raise call.error
+            # Cópia para que as threads não acumulem frames no mesmo traceback
+            raise copy.copy(call.error).with_traceback(call.error.__traceback__)
+        return call.value if leader else copy.deepcopy(call.value)
+
+    async def do_async(self, key: Hashable, start: Callable[[], Awaitable]) -> Any:
+        """
+        Versão para corrotinas: ``start`` inicia o cálculo e devolve um awaitable
+
+        Se quem aguarda for cancelado (ex: cliente desconectou), o cálculo
+        compartilhado só é cancelado quando não resta mais ninguém esperando.
+        """
+        call = self._async_calls.get(key)
+        leader = call is None
+        if leader:
+            call = asyncio.ensure_future(start())
+            self._async_calls[key] = call
+            call.add_done_callback(lambda _: self._async_calls.pop(key, None))
+        self._async_waiters[key] = self._async_waiters.get(key, 0) + 1
+
+        begin = time.perf_counter()
+        try:
+            result = await asyncio.shield(call)
+        finally:
+            self._async_waiters[key] -= 1
+            if self._async_waiters[key] == 0:
+                del self._async_waiters[key]
+                if not call.done():
+                    call.cancel()
+            self._record(key, not leader, time.perf_counter() - begin)
+        return result if leader else copy.deepcopy(result)
+
+    def stats(self) -> Dict[str, Any]:
+        """Totais e, por chave, chamadas, compartilhadas e tempos de espera"""
+        with self._lock:
+            keys = {
+                describe_key(key): {
+                    "calls": int(entry["calls"]),
+                    "shared": int(entry["shared"]),
+                    "mean_wait": entry["wait"] / entry["calls"],
+                    "max_wait": entry["max_wait"],
+                }
+                for key, entry in self._keys.items()
+            }
+            return {
+                "in_flight": len(self._calls) + len(self._async_calls),
+                "leaders": self._leaders,
+                "shared": self._shared,
+                "keys": keys,
+            }
+
+    def clear_stats(self) -> None:
+        with self._lock:
+            self._keys.clear()
+            self._leaders = 0
+            self._shared = 0
+
+    def _record(self, key: Hashable, shared: bool, waited: float) -> None:
+        with self._lock:
+            if shared:
+                self._shared += 1
+            else:
+                self._leaders += 1
+            if self.max_keys == 0:
+                return
+
+            entry = self._keys.get(key)
+            if entry is None:
+                entry = self._keys[key] = {
+                    "calls": 0,
+                    "shared": 0,
+                    "wait": 0.0,
+                    "max_wait": 0.0,
+                }
+            self._keys.move_to_end(key)
+            entry["calls"] += 1
+            entry["shared"] += shared
+            entry["wait"] += waited
+            entry["max_wait"] = max(entry["max_wait"], waited)
+            while len(self._keys) > self.max_keys:
+                self._keys.popitem(last=False)
+
+
+def describe_key(key: Hashable) -> str:
+    """Rótulo legível de uma chave (model_type, ((param, valor), ...))"""
+    if (
+        isinstance(key, tuple)
+        and len(key) == 2
+        and isinstance(key[0], str)
+        and isinstance(key[1], tuple)
+    ):
+        params = ", ".join(f"{name}={value!r}" for name, value in key[1])
+        return f"{key[0]}({params})"
+    return repr(key)
@@ -0,0 +1,33 @@
+"""
+Serialização incremental de resultados em NDJSON.
+
+Cada resultado vira uma linha JSON assim que é produzido, de modo que as
+respostas podem ser transmitidas em partes (chunked) e a memória do servidor
+não cresce com o tamanho do resultado.
+"""
+
+import json
+from math import isnan
+from typing import Any, Dict, Iterable, Iterator
+
+NDJSON_MIMETYPE = "application/x-ndjson"
+
+
+def json_safe(value: Any) -> Any:
+    """Mesma convenção das rotas: ±inf vira texto e nan vira null"""
+    if isinstance(value, dict):
+        return {key: json_safe(inner) for key, inner in value.items()}
+    if isinstance(value, list):
+        return [json_safe(inner) for inner in value]
+    if isinstance(value, float):
+        if isnan(value):
+            return None
+        if value in (float("inf"), float("-inf")):
+            return "infinity" if value > 0 else "-infinity"
+    return value
+
+
+def ndjson_lines(rows: Iterable[Dict[str, Any]]) -> Iterator[str]:
+    """Serializa as linhas como NDJSON (um objeto JSON por linha)"""
+    for row in rows:
+        yield json.dumps(json_safe(row), ensure_ascii=False) + "\n"
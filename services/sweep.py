@@ -0,0 +1,369 @@
+"""
+Varredura de parâmetros sobre grades cartesianas.
+
+A grade é expandida de forma preguiçosa (gerador), avaliada em blocos e
+emitida linha a linha em NDJSON ou CSV, de modo que a memória não cresce com
+o número de pontos. Modelos com avaliação vetorizada usam ``models.vectorized``
+em cada bloco; os demais passam pelas classes escalares, assim como os pontos
+que o esquema rejeitaria ou que o núcleo vetorizado não representa, para que
+os dois caminhos produzam as mesmas linhas.
+"""
+
+import argparse
+import csv
+import inspect
+import io
+import itertools
+import sys
+from math import floor, isnan
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+import numpy as np
+
+from models.registry import (
+    LEGACY_CLASSES,
+    ParamSpec,
+    get_schema,
+    parse_lamb_list,
+    to_int,
+)
+from models.vectorized import VECTORIZED_MODELS
+from services.queue_service import QueueService
+from services.streaming import ndjson_lines
+
+DEFAULT_CHUNK_SIZE = 10_000
+
+# Casas decimais das classes escalares, para que os dois caminhos coincidam
+_DIGITS = {"MMS": 2}
+_DEFAULT_DIGITS = 4
+
+# Métricas de cada modelo, na ordem em que as classes escalares as devolvem
+METRIC_NAMES = {
+    "MM1": ("Rho", "P0", "Pn", "Pr", "L", "Lq", "W", "Wq", "pw", "pwq"),
+    "MMS": ("Rho", "P0", "Pn", "Pr", "pw", "pwq", "Lq", "Wq", "L", "W"),
+    "MM1K": ("P0", "Pn", "L", "Lq", "W", "Wq"),
+    "MM1N": ("P0", "Pn", "Lq", "L", "Wq", "W"),
+    "MMSK": ("P0", "Pn", "Lq", "L", "Wq", "W"),
+    "MMSN": ("P0", "Pn", "L", "Lq", "W", "Wq"),
+    "MG1": ("P0", "p", "Lq", "L", "Wq", "W"),
+    "GGS": ("Rho", "Pw", "Lq", "L", "Wq", "W"),
+}
+# Modelos de prioridade: métricas de cada classe i e do sistema
+_CLASS_METRICS = ("W", "Wq", "L", "Lq")
+_SYSTEM_METRICS = ("Rho", "W", "Wq", "L", "Lq")
+
+
+def axis_values(spec: Any, name: Optional[str] = None) -> List[Any]:
+    """
+    Valores de um eixo da grade
+
+    Aceita um escalar, uma lista de valores ou um intervalo
+    ``{"start", "stop", "step"}`` / ``{"start", "stop", "num"}`` (inclusivo).
+    Para ``lamb_list`` o eixo é uma lista de listas; uma lista simples é um
+    único valor.
+    """
+    if name == "lamb_list":
+        nested = isinstance(spec, list) and all(
+            isinstance(value, (list, str)) for value in spec
+        )
+        return spec if nested and spec else [spec]
+    if isinstance(spec, dict):
+        start, stop = float(spec["start"]), float(spec["stop"])
+        if "num" in spec:
+            return np.linspace(start, stop, int(spec["num"])).tolist()
+        step = float(spec.get("step", 1))
+        if step <= 0:
+            raise ValueError("O passo do intervalo deve ser positivo.")
+        count = floor((stop - start) / step + 1e-9) + 1
+        return [start + i * step for i in range(max(count, 0))]
+    if isinstance(spec, list):
+        return spec
+    return [spec]
+
+
+def grid_size(grid: Dict[str, Any]) -> int:
+    """Número de pontos da grade, sem expandi-la"""
+    size = 1
+    for name, spec in grid.items():
+        size *= len(axis_values(spec, name))
+    return size
+
+
+def validate_grid(model_type: str, grid: Dict[str, Any]) -> int:
+    """
+    Confere os parâmetros da grade e devolve o número de pontos
+
+    Raises:
+        ValueError: Se a grade usar parâmetros que o modelo não aceita ou
+            omitir um parâmetro obrigatório
+    """
+    schema = get_schema(model_type)
+    if not isinstance(grid, dict) or not grid:
+        raise ValueError("A grade deve ser um objeto com pelo menos um parâmetro.")
+    unknown = set(grid) - schema.names
+    if unknown:
+        raise ValueError(
+            f"Parâmetros não aceitos pelo modelo {model_type}: "
+            f"{', '.join(sorted(unknown))}"
+        )
+    missing = schema.required - set(grid)
+    if missing:
+        raise ValueError(
+            f"Parâmetros obrigatórios ausentes para o modelo {model_type}: "
+            f"{', '.join(sorted(missing))}"
+        )
+    return grid_size(grid)
+
+
+def expand_grid(model_type: str, grid: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """Gera os pontos do produto cartesiano da grade, um de cada vez"""
+    validate_grid(model_type, grid)
+
+    names = list(grid)
+    axes = [axis_values(grid[name], name) for name in names]
+    for values in itertools.product(*axes):
+        yield dict(zip(names, values))
+
+
+def evaluate_grid(
+    model_type: str,
+    grid: Dict[str, Any],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    vectorized: bool = True,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Avalia todos os pontos da grade em blocos, na ordem do produto cartesiano
+
+    Cada linha traz os parâmetros do ponto seguidos das métricas, ou de
+    ``error`` quando o ponto é inválido.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size deve ser positivo.")
+
+    points = expand_grid(model_type, grid)
+    use_vectorized = vectorized and model_type in VECTORIZED_MODELS
+    while True:
+        chunk = list(itertools.islice(points, chunk_size))
+        if not chunk:
+            return
+        if use_vectorized:
+            yield from _evaluate_vectorized(model_type, chunk)
+        else:
+            yield from _evaluate_scalar(model_type, chunk)
+
+
+def csv_fieldnames(model_type: str, grid: Dict[str, Any]) -> List[str]:
+    """
+    Colunas do CSV, conhecidas antes da avaliação: os parâmetros da grade,
+    as métricas do modelo (as aninhadas viram ``grupo.métrica``) e ``error``
+
+    Nos modelos de prioridade há colunas para cada classe que algum ponto da
+    grade pode ter.
+    """
+    validate_grid(model_type, grid)
+    if model_type in METRIC_NAMES:
+        metrics = list(METRIC_NAMES[model_type])
+    else:
+        metrics = [
+            f"Class {i}.{name}{i}"
+            for i in range(1, _class_count(grid) + 1)
+            for name in _CLASS_METRICS
+        ]
+        metrics += [f"System.{name}" for name in _SYSTEM_METRICS]
+    return list(grid) + metrics + ["error"]
+
+
+def csv_lines(rows: Iterable[Dict[str, Any]], fieldnames: List[str]) -> Iterator[str]:
+    """
+    Serializa as linhas como CSV com as colunas de ``csv_fieldnames``
+
+    O cabeçalho sai antes da primeira linha e cada linha é escrita assim que
+    chega; colunas ausentes numa linha (métricas de um ponto com erro ou de
+    uma classe sem chegadas) ficam vazias.
+    """
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=fieldnames, extrasaction="ignore")
+    writer.writeheader()
+    yield buffer.getvalue()
+    for row in rows:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerow(_flatten(row))
+        yield buffer.getvalue()
+
+
+def _class_count(grid: Dict[str, Any]) -> int:
+    """Maior número de classes entre os pontos de um modelo de prioridade"""
+    if "lamb_list" not in grid:
+        return len(LEGACY_CLASSES)
+    counts = []
+    for value in axis_values(grid["lamb_list"], "lamb_list"):
+        try:
+            # Uma lista vazia recai nos parâmetros legados lamb1..lamb4
+            counts.append(len(parse_lamb_list(value)) or len(LEGACY_CLASSES))
+        except (TypeError, ValueError):
+            continue
+    return max(counts, default=len(LEGACY_CLASSES))
+
+
+def _evaluate_vectorized(
+    model_type: str, chunk: List[Dict[str, Any]]
+) -> Iterator[Dict[str, Any]]:
+    """
+    Avalia o bloco com o núcleo vetorizado
+
+    Os valores são conferidos coluna a coluna contra o esquema (conversão,
+    inteiros e limites). Pontos que ``schema.coerce`` rejeitaria, que fixam
+    um parâmetro ignorado pelo núcleo em valor diferente do padrão ou para os
+    quais o núcleo devolve ``nan`` vão para as classes escalares, que dão o
+    mesmo resultado ou a mesma mensagem de erro do caminho escalar.
+    """
+    schema = get_schema(model_type)
+    function = VECTORIZED_MODELS[model_type]
+    accepted = inspect.signature(function).parameters
+    size = len(chunk)
+    scalar = np.zeros(size, dtype=bool)
+    columns = {}
+    for spec in schema.params:
+        # Os pontos de uma grade têm todos os mesmos parâmetros
+        if spec.name not in chunk[0]:
+            if spec.name in accepted and spec.default is not None:
+                columns[spec.name] = np.full(size, float(spec.default))
+            continue
+        values = _numeric_column([point[spec.name] for point in chunk])
+        scalar |= ~_conforms(spec, values)
+        if spec.name in accepted:
+            columns[spec.name] = values
+        elif spec.default is None:
+            scalar[:] = True
+        else:
+            scalar |= values != float(spec.default)
+
+    rows: List[Optional[Dict[str, Any]]] = [None] * size
+    indices = np.flatnonzero(~scalar)
+    if indices.size:
+        metrics = function(
+            **{name: column[indices] for name, column in columns.items()}
+        )
+        keys = list(metrics)
+        digits = _DIGITS.get(model_type, _DEFAULT_DIGITS)
+        values = np.column_stack([metrics[key] for key in keys]).tolist()
+        for index, row in zip(indices.tolist(), values):
+            if any(isnan(value) for value in row):
+                scalar[index] = True
+            else:
+                rounded = (round(value, digits) for value in row)
+                rows[index] = {**chunk[index], **dict(zip(keys, rounded))}
+
+    fallback = np.flatnonzero(scalar).tolist()
+    if fallback:
+        evaluated = _evaluate_scalar(model_type, [chunk[index] for index in fallback])
+        for index, row in zip(fallback, evaluated):
+            rows[index] = row
+    yield from rows
+
+
+def _numeric_column(values: List[Any]) -> np.ndarray:
+    """Coluna de floats; valores sem conversão numérica viram ``nan``"""
+    try:
+        return np.asarray(values, dtype=float)
+    except (TypeError, ValueError):
+        return np.array([_to_float(value) for value in values])
+
+
+def _to_float(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return float("nan")
+
+
+def _conforms(spec: ParamSpec, values: np.ndarray) -> np.ndarray:
+    """Máscara dos valores que ``spec.coerce`` aceitaria sem mudança"""
+    ok = ~np.isnan(values)
+    if spec.converter is to_int:
+        ok &= np.isfinite(values) & (values == np.floor(values))
+    if spec.minimum is not None:
+        ok &= values > spec.minimum if spec.exclusive else values >= spec.minimum
+    return ok
+
+
+def _evaluate_scalar(
+    model_type: str, chunk: List[Dict[str, Any]]
+) -> Iterator[Dict[str, Any]]:
+    schema = get_schema(model_type)
+    coerced: List[Any] = []
+    for point in chunk:
+        try:
+            coerced.append(schema.coerce(point))
+        except ValueError as e:
+            coerced.append(e)
+
+    # Um único lote por bloco no armazenamento persistente, quando configurado
+    valid = [params for params in coerced if not isinstance(params, Exception)]
+    results = iter(QueueService.calculate_many(model_type, valid))
+    for point, params in zip(chunk, coerced):
+        result = params if isinstance(params, Exception) else next(results)
+        if isinstance(result, ValueError):
+            yield {**point, "error": str(result)}
+        elif isinstance(result, Exception):
+            yield {**point, "error": f"Erro interno: {str(result)}"}
+        else:
+            yield {**point, **result}
+
+
+def _flatten(row: Dict[str, Any]) -> Dict[str, Any]:
+    flat = {}
+    for key, value in row.items():
+        if isinstance(value, dict):
+            for inner_key, inner_value in value.items():
+                flat[f"{key}.{inner_key}"] = inner_value
+        elif isinstance(value, list):
+            flat[key] = ",".join(str(v) for v in value)
+        else:
+            flat[key] = value
+    return flat
+
+
+def _parse_axis(text: str) -> Any:
+    """Converte 'início:fim:passo', 'a,b,c' ou um valor único em um eixo"""
+    if ":" in text:
+        start, stop, *step = text.split(":")
+        return {"start": start, "stop": stop, "step": step[0] if step else 1}
+    if "," in text:
+        return [float(value) for value in text.split(",") if value.strip()]
+    return float(text)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Varredura de parâmetros de um modelo de fila"
+    )
+    parser.add_argument("model_type", help="Tipo do modelo (ex: MMS)")
+    parser.add_argument(
+        "--param",
+        action="append",
+        default=[],
+        metavar="NOME=VALOR",
+        help="Eixo da grade: valor, lista 'a,b,c' ou intervalo 'início:fim:passo'",
+    )
+    parser.add_argument("--format", choices=["ndjson", "csv"], default="ndjson")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    args = parser.parse_args(argv)
+
+    grid = {}
+    for item in args.param:
+        name, _, value = item.partition("=")
+        grid[name] = _parse_axis(value)
+
+    rows = evaluate_grid(args.model_type, grid, chunk_size=args.chunk_size)
+    if args.format == "csv":
+        lines = csv_lines(rows, csv_fieldnames(args.model_type, grid))
+    else:
+        lines = ndjson_lines(rows)
+    for line in lines:
+        sys.stdout.write(line)
+
+
+if __name__ == "__main__":
+    main()
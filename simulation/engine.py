@@ -0,0 +1,698 @@
+"""
+Simulador de eventos discretos para as topologias dos modelos analíticos.
+
+Há dois laços de eventos. Com uma única classe os clientes são atendidos em
+ordem de chegada: a fila guarda só os instantes de chegada e o calendário é
+um heap com os términos (com um servidor, uma única variável). Com classes
+de prioridade o calendário é um heap de términos versionados, para descartar
+os de atendimentos interrompidos, e cada cliente é uma tupla compacta
+(chegada, serviço, restante). Em ambos os números aleatórios são sorteados
+em blocos pelo NumPy e consumidos diretamente das listas, sem uma chamada de
+função por evento. Os intervalos de confiança são obtidos por médias em
+lotes (batch means).
+"""
+
+import heapq
+from collections import deque
+from math import inf, nextafter, sqrt
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+# Tamanho dos blocos de números aleatórios gerados de uma só vez
+_BLOCK_SIZE = 65_536
+
+# Quantis t de Student bicaudais de 95% por graus de liberdade
+_T_QUANTILES_95 = {
+    1: 12.706, 2: 4.303, 3: 3.182, 4: 2.776, 5: 2.571, 6: 2.447, 7: 2.365,
+    8: 2.306, 9: 2.262, 10: 2.228, 11: 2.201, 12: 2.179, 13: 2.160, 14: 2.145,
+    15: 2.131, 16: 2.120, 17: 2.110, 18: 2.101, 19: 2.093, 20: 2.086,
+    21: 2.080, 22: 2.074, 23: 2.069, 24: 2.064, 25: 2.060, 26: 2.056,
+    27: 2.052, 28: 2.048, 29: 2.045, 30: 2.042, 40: 2.021, 60: 2.000,
+    120: 1.980,
+}
+
+
+def t_quantile_95(df: int) -> float:
+    """Quantil t de 95% (bicaudal) para df graus de liberdade"""
+    if df < 1:
+        return inf
+    for limit in sorted(_T_QUANTILES_95):
+        if df <= limit:
+            return _T_QUANTILES_95[limit]
+    return 1.960
+
+
+class QueueSimulator:
+    """
+    Simulador de filas com s servidores, capacidade K, população finita N,
+    tempo de serviço geral e classes de prioridade (com ou sem interrupção)
+
+    Args:
+        lamb: Taxa de chegada (por cliente ocioso quando N é informado)
+        mu: Taxa de atendimento por servidor
+        s: Número de servidores
+        k: Capacidade máxima do sistema (None para infinita)
+        N: Tamanho da população (None para infinita)
+        var: Variância do tempo de serviço (None para exponencial)
+        lamb_list: Taxas de chegada por classe de prioridade (classe 1 primeiro)
+        preemptive: Se a chegada de uma classe mais prioritária interrompe o atendimento
+        seed: Semente ou ``numpy.random.SeedSequence`` do gerador
+    """
+
+    def __init__(
+        self,
+        lamb: float,
+        mu: float,
+        s: int = 1,
+        k: Optional[int] = None,
+        N: Optional[int] = None,
+        var: Optional[float] = None,
+        lamb_list: Optional[List[float]] = None,
+        preemptive: bool = False,
+        seed=None,
+    ) -> None:
+        if lamb_list:
+            lamb = float(sum(lamb_list))
+        if lamb < 0 or mu <= 0 or s < 1:
+            raise ValueError("Parâmetros inválidos: requer λ ≥ 0, μ > 0 e s ≥ 1.")
+        if k is not None and k < 1:
+            raise ValueError("Capacidade K deve ser maior ou igual a 1.")
+        if N is not None and N < 1:
+            raise ValueError("População N deve ser maior ou igual a 1.")
+        if var is not None and var < 0:
+            raise ValueError("Variância do tempo de serviço deve ser não negativa.")
+        if lamb_list and any(rate < 0 for rate in lamb_list):
+            raise ValueError("Taxas de chegada das classes devem ser não negativas.")
+        if lamb_list and N is not None:
+            raise ValueError("Classes de prioridade exigem população infinita.")
+
+        self.lamb = lamb
+        self.mu = mu
+        self.s = s
+        self.k = k
+        self.N = N
+        self.var = var
+        self.lamb_list = list(lamb_list) if lamb_list else [lamb]
+        self.preemptive = preemptive
+        self.rng = np.random.default_rng(seed)
+
+    def run(
+        self,
+        horizon: float,
+        warmup: float = 0.0,
+        batches: int = 20,
+        t: Optional[float] = None,
+        max_events: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Executa a simulação até o instante ``horizon``
+
+        Args:
+            horizon: Instante final da simulação
+            warmup: Período inicial descartado das estatísticas
+            batches: Número de lotes para os intervalos de confiança
+            t: Tempo para estimar P(W > t) e P(Wq > t)
+            max_events: Limite opcional de eventos processados
+
+        Returns:
+            Dicionário com ``metrics``, ``confidence_intervals`` (meia largura
+            de 95% por médias em lotes), ``events``, ``time`` e ``truncated``
+            (True se ``max_events`` encerrou a simulação antes do horizonte,
+            caso em que ``time`` cobre só os lotes completos)
+        """
+        if horizon <= warmup or warmup < 0:
+            raise ValueError("Requer 0 ≤ warmup < horizon.")
+        if batches < 2:
+            raise ValueError("São necessários pelo menos 2 lotes.")
+
+        # Fronteiras dos lotes: a primeira coincide com o fim do aquecimento
+        boundaries = [warmup + (horizon - warmup) * b / batches for b in range(batches + 1)]
+        classes = len(self.lamb_list)
+        if classes > 1:
+            snapshots, events, truncated = self.__run_priority(
+                horizon, warmup, boundaries, t, max_events
+            )
+        else:
+            snapshots, events, truncated = self.__run_fifo(
+                horizon, warmup, boundaries, t, max_events
+            )
+        return self.__summarize(snapshots, classes, t, events, truncated)
+
+    def __run_fifo(
+        self,
+        horizon: float,
+        warmup: float,
+        boundaries: List[float],
+        t: Optional[float],
+        max_events: Optional[int],
+    ) -> Tuple[List[List[float]], int, bool]:
+        """
+        Laço de eventos de uma única classe em ordem de chegada
+
+        Os servidores são idênticos, então basta guardar os instantes de
+        término: com um servidor, o próximo término é uma variável; com mais,
+        um heap. A fila guarda só os instantes de chegada e o atendimento é
+        sorteado ao começar. As fronteiras de lote e o limite de eventos são
+        verificados por uma única comparação por evento.
+        """
+        s, N, lamb = self.s, self.N, self.lamb
+        capacity = self.k if self.k is not None else inf
+        limit = max_events if max_events is not None else inf
+        threshold = inf if t is None else t
+        rng = self.rng
+        draw_service = self.__service_sampler()
+        heappush, heapreplace, heappop = heapq.heappush, heapq.heapreplace, heapq.heappop
+        gaps: List[float] = []
+        requirements: List[float] = []
+
+        waiting: deque = deque()
+        # s > 1: (término, chegada, atendimento) de cada cliente em atendimento
+        calendar: List[Tuple[float, float, float]] = []
+        # s = 1: chegada e atendimento do cliente em atendimento
+        serving_arrival = serving_requirement = 0.0
+        next_departure = inf
+
+        snapshots: List[List[float]] = []
+        next_boundary = 0
+        boundary = boundaries[0]
+        area_n = area_busy = empty_time = 0.0
+        sum_w = sum_wq = 0.0
+        arrivals = blocked = served = count_pw = count_pwq = 0
+        now = 0.0
+        n = busy = 0
+        events = 0
+        truncated = False
+
+        if lamb > 0:
+            gaps = rng.standard_exponential(_BLOCK_SIZE).tolist()
+            next_arrival = gaps.pop() / (lamb if N is None else N * lamb)
+        else:
+            next_arrival = inf
+
+        while True:
+            event_time = next_arrival if next_arrival <= next_departure else next_departure
+            if event_time >= boundary or events >= limit:
+                # Fecha os lotes cujas fronteiras ficaram para trás
+                while next_boundary < len(boundaries) and boundaries[
+                    next_boundary
+                ] <= min(event_time, horizon):
+                    dt = boundaries[next_boundary] - now
+                    area_n += n * dt
+                    area_busy += busy * dt
+                    if n == 0:
+                        empty_time += dt
+                    now = boundaries[next_boundary]
+                    snapshots.append(
+                        [now, area_n, area_n - area_busy, area_busy, empty_time,
+                         arrivals, blocked, served, sum_w, sum_wq,
+                         count_pw, count_pwq]
+                    )
+                    next_boundary += 1
+                # Depois do último lote, qualquer evento além do horizonte encerra
+                boundary = (
+                    boundaries[next_boundary]
+                    if next_boundary < len(boundaries)
+                    else nextafter(horizon, inf)
+                )
+                if event_time > horizon:
+                    break
+                if events >= limit:
+                    # O limite cortou o horizonte: os lotes restantes ficam de fora
+                    truncated = True
+                    break
+
+            dt = event_time - now
+            area_n += n * dt
+            area_busy += busy * dt
+            if n == 0:
+                empty_time += dt
+            now = event_time
+            events += 1
+
+            if next_arrival <= next_departure:
+                # Chegada
+                if now >= warmup:
+                    arrivals += 1
+                if n >= capacity:
+                    if now >= warmup:
+                        blocked += 1
+                else:
+                    n += 1
+                    if busy < s:
+                        busy += 1
+                        if not requirements:
+                            requirements = draw_service(_BLOCK_SIZE).tolist()
+                        requirement = requirements.pop()
+                        if s == 1:
+                            serving_arrival, serving_requirement = now, requirement
+                            next_departure = now + requirement
+                        else:
+                            heappush(calendar, (now + requirement, now, requirement))
+                            next_departure = calendar[0][0]
+                    else:
+                        waiting.append(now)
+                if N is None:
+                    if not gaps:
+                        gaps = rng.standard_exponential(_BLOCK_SIZE).tolist()
+                    next_arrival = now + gaps.pop() / lamb
+
+            else:
+                # Conclusão de atendimento
+                if s == 1:
+                    arrived, requirement = serving_arrival, serving_requirement
+                else:
+                    _, arrived, requirement = calendar[0]
+                if now >= warmup:
+                    w = now - arrived
+                    wq = w - requirement
+                    served += 1
+                    sum_w += w
+                    sum_wq += wq
+                    if w > threshold:
+                        count_pw += 1
+                    if wq > threshold:
+                        count_pwq += 1
+                n -= 1
+
+                if waiting:
+                    arrived = waiting.popleft()
+                    if not requirements:
+                        requirements = draw_service(_BLOCK_SIZE).tolist()
+                    requirement = requirements.pop()
+                    if s == 1:
+                        serving_arrival, serving_requirement = arrived, requirement
+                        next_departure = now + requirement
+                    else:
+                        heapreplace(calendar, (now + requirement, arrived, requirement))
+                        next_departure = calendar[0][0]
+                else:
+                    busy -= 1
+                    if s == 1:
+                        next_departure = inf
+                    else:
+                        heappop(calendar)
+                        next_departure = calendar[0][0] if calendar else inf
+
+            if N is not None:
+                # Chegadas de população finita: taxa (N - n)·λ, sem memória
+                rate = (N - n) * lamb
+                if rate > 0:
+                    if not gaps:
+                        gaps = rng.standard_exponential(_BLOCK_SIZE).tolist()
+                    next_arrival = now + gaps.pop() / rate
+                else:
+                    next_arrival = inf
+
+        return snapshots, events, truncated
+
+    def __run_priority(
+        self,
+        horizon: float,
+        warmup: float,
+        boundaries: List[float],
+        t: Optional[float],
+        max_events: Optional[int],
+    ) -> Tuple[List[List[float]], int, bool]:
+        """
+        Laço de eventos com classes de prioridade, com ou sem interrupção
+
+        Cada cliente é uma tupla (chegada, serviço, restante); uma interrupção
+        devolve à fila uma nova tupla com o restante descontado, e a classe de
+        quem está em atendimento fica com o servidor. O calendário guarda
+        (término, servidor, versão): interromper um atendimento muda a versão
+        do servidor e o término antigo é descartado ao chegar ao topo do heap.
+        Com um único servidor não há calendário: o próximo término é o do
+        cliente em atendimento. L e Lq de cada classe saem da lei de Little,
+        sem acumular a área de cada classe a cada evento.
+        """
+        s, lamb = self.s, self.lamb
+        classes = len(self.lamb_list)
+        preemptive = self.preemptive
+        single = s == 1
+        capacity = self.k if self.k is not None else inf
+        limit = max_events if max_events is not None else inf
+        threshold = inf if t is None else t
+        rng = self.rng
+        draw_service = self.__service_sampler()
+        weights = np.asarray(self.lamb_list, dtype=float) / lamb if lamb > 0 else None
+        heappush, heappop = heapq.heappush, heapq.heappop
+        heapreplace = heapq.heapreplace
+        gaps: List[float] = []
+        requirements: List[float] = []
+        labels: List[int] = []
+
+        server_customer: List[Optional[Tuple[float, float, float]]] = [None] * s
+        server_class = [classes] * s
+        server_start = [0.0] * s
+        server_token = [0] * s
+        free_servers = list(range(s - 1, -1, -1))
+        calendar: List[Tuple[float, int, int]] = []
+        queues = [deque() for _ in range(classes)]
+        priorities = range(classes)
+        next_departure = inf
+
+        snapshots: List[List[float]] = []
+        next_boundary = 0
+        boundary = boundaries[0]
+        area_n = area_busy = empty_time = 0.0
+        arrivals = blocked = 0
+        class_count = [0] * classes
+        class_w = [0.0] * classes
+        class_wq = [0.0] * classes
+        class_pw = [0] * classes
+        class_pwq = [0] * classes
+        now = 0.0
+        n = busy = 0
+        events = 0
+        truncated = False
+
+        if lamb > 0:
+            gaps = rng.standard_exponential(_BLOCK_SIZE).tolist()
+            next_arrival = gaps.pop() / lamb
+        else:
+            next_arrival = inf
+
+        while True:
+            event_time = next_arrival if next_arrival <= next_departure else next_departure
+            if event_time >= boundary or events >= limit:
+                # Fecha os lotes cujas fronteiras ficaram para trás
+                while next_boundary < len(boundaries) and boundaries[
+                    next_boundary
+                ] <= min(event_time, horizon):
+                    dt = boundaries[next_boundary] - now
+                    area_n += n * dt
+                    area_busy += busy * dt
+                    if n == 0:
+                        empty_time += dt
+                    now = boundaries[next_boundary]
+                    snapshots.append(
+                        [now, area_n, area_n - area_busy, area_busy, empty_time,
+                         arrivals, blocked]
+                        + class_count + class_w + class_wq + class_pw + class_pwq
+                    )
+                    next_boundary += 1
+                # Depois do último lote, qualquer evento além do horizonte encerra
+                boundary = (
+                    boundaries[next_boundary]
+                    if next_boundary < len(boundaries)
+                    else nextafter(horizon, inf)
+                )
+                if event_time > horizon:
+                    break
+                if events >= limit:
+                    # O limite cortou o horizonte: os lotes restantes ficam de fora
+                    truncated = True
+                    break
+
+            dt = event_time - now
+            area_n += n * dt
+            area_busy += busy * dt
+            if n == 0:
+                empty_time += dt
+            now = event_time
+            events += 1
+
+            if next_arrival <= next_departure:
+                # Chegada
+                if now >= warmup:
+                    arrivals += 1
+                if n >= capacity:
+                    if now >= warmup:
+                        blocked += 1
+                else:
+                    if not labels:
+                        labels = rng.choice(classes, size=_BLOCK_SIZE, p=weights).tolist()
+                    c = labels.pop()
+                    if not requirements:
+                        requirements = draw_service(_BLOCK_SIZE).tolist()
+                    requirement = requirements.pop()
+                    customer = (now, requirement, requirement)
+                    n += 1
+
+                    if single:
+                        if not busy:
+                            busy = 1
+                            server_customer[0] = customer
+                            server_class[0] = c
+                            server_start[0] = now
+                            next_departure = now + requirement
+                        elif preemptive and server_class[0] > c:
+                            arrived, service, left = server_customer[0]
+                            queues[server_class[0]].appendleft(
+                                (arrived, service, left - (now - server_start[0]))
+                            )
+                            server_customer[0] = customer
+                            server_class[0] = c
+                            server_start[0] = now
+                            next_departure = now + requirement
+                        else:
+                            queues[c].append(customer)
+                    elif busy < s:
+                        server = free_servers.pop()
+                        busy += 1
+                        server_customer[server] = customer
+                        server_class[server] = c
+                        server_start[server] = now
+                        heappush(
+                            calendar, (now + requirement, server, server_token[server])
+                        )
+                        if now + requirement < next_departure:
+                            next_departure = now + requirement
+                    elif preemptive:
+                        # Interrompe o cliente de menor prioridade em atendimento
+                        victim = -1
+                        victim_class = c
+                        for j in range(s):
+                            cj = server_class[j]
+                            if cj > victim_class:
+                                victim, victim_class = j, cj
+                        if victim < 0:
+                            queues[c].append(customer)
+                        else:
+                            arrived, service, left = server_customer[victim]
+                            queues[victim_class].appendleft(
+                                (arrived, service, left - (now - server_start[victim]))
+                            )
+                            server_token[victim] += 1
+                            server_customer[victim] = customer
+                            server_class[victim] = c
+                            server_start[victim] = now
+                            heappush(
+                                calendar,
+                                (now + requirement, victim, server_token[victim]),
+                            )
+                            # O término do cliente interrompido sai do topo
+                            while calendar[0][2] != server_token[calendar[0][1]]:
+                                heappop(calendar)
+                            next_departure = calendar[0][0]
+                    else:
+                        queues[c].append(customer)
+
+                if not gaps:
+                    gaps = rng.standard_exponential(_BLOCK_SIZE).tolist()
+                next_arrival = now + gaps.pop() / lamb
+
+            else:
+                # Conclusão de atendimento
+                # O topo do calendário é sempre um término válido
+                server = 0 if single else calendar[0][1]
+                arrived, service, _ = server_customer[server]
+                c = server_class[server]
+                if now >= warmup:
+                    w = now - arrived
+                    wq = w - service
+                    class_count[c] += 1
+                    class_w[c] += w
+                    class_wq[c] += wq
+                    if w > threshold:
+                        class_pw[c] += 1
+                    if wq > threshold:
+                        class_pwq[c] += 1
+                n -= 1
+
+                if single:
+                    for c in priorities:
+                        queue = queues[c]
+                        if queue:
+                            customer = queue.popleft()
+                            server_customer[0] = customer
+                            server_class[0] = c
+                            server_start[0] = now
+                            next_departure = now + customer[2]
+                            break
+                    else:
+                        busy = 0
+                        server_customer[0] = None
+                        next_departure = inf
+                    continue
+
+                for c in priorities:
+                    queue = queues[c]
+                    if queue:
+                        customer = queue.popleft()
+                        server_customer[server] = customer
+                        server_class[server] = c
+                        server_start[server] = now
+                        server_token[server] += 1
+                        heapreplace(
+                            calendar, (now + customer[2], server, server_token[server])
+                        )
+                        break
+                else:
+                    heappop(calendar)
+                    busy -= 1
+                    server_customer[server] = None
+                    free_servers.append(server)
+                if preemptive:
+                    # Descarta conclusões de atendimentos interrompidos
+                    while calendar and calendar[0][2] != server_token[calendar[0][1]]:
+                        heappop(calendar)
+                next_departure = calendar[0][0] if calendar else inf
+
+        return snapshots, events, truncated
+
+    def __service_sampler(self) -> Callable[[int], np.ndarray]:
+        """Sorteia um bloco de tempos de atendimento"""
+        rng, mean = self.rng, 1 / self.mu
+        if self.var is None:
+            return lambda size: rng.exponential(mean, size)
+        if self.var == 0:
+            return lambda size: np.full(size, mean)
+        # Gama com média 1/μ e a variância informada
+        shape = mean**2 / self.var
+        scale = self.var / mean
+        return lambda size: rng.gamma(shape, scale, size)
+
+    def __summarize(
+        self,
+        snapshots: List[List[float]],
+        classes: int,
+        t: Optional[float],
+        events: int,
+        truncated: bool,
+    ) -> Dict[str, Any]:
+        if len(snapshots) < 3:
+            raise ValueError("Simulação encerrada antes de completar dois lotes.")
+
+        table = np.asarray(snapshots, dtype=float)
+        per_batch = self.__batch_metrics(np.diff(table, axis=0), classes, t)
+        overall = self.__batch_metrics(table[-1:] - table[:1], classes, t)
+
+        critical = t_quantile_95(len(table) - 2)
+        metrics: Dict[str, Any] = {}
+        intervals: Dict[str, Any] = {}
+        for key, values in per_batch.items():
+            half_width = critical * np.nanstd(values, ddof=1) / sqrt(len(values))
+            group = key.split("|")
+            target_metrics, target_intervals = metrics, intervals
+            if len(group) == 2:
+                target_metrics = metrics.setdefault(group[0], {})
+                target_intervals = intervals.setdefault(group[0], {})
+            target_metrics[group[-1]] = float(overall[key][0])
+            target_intervals[group[-1]] = float(half_width)
+
+        return {
+            "metrics": metrics,
+            "confidence_intervals": intervals,
+            "events": events,
+            "time": float(table[-1, 0] - table[0, 0]),
+            "truncated": truncated,
+        }
+
+    def __batch_metrics(
+        self, rows: np.ndarray, classes: int, t: Optional[float]
+    ) -> Dict[str, np.ndarray]:
+        """Converte os acumuladores de cada linha (lote) em métricas"""
+        duration = rows[:, 0]
+        area_n, area_q, area_busy, empty_time, arrivals, blocked = rows[:, 1:7].T
+        class_count, class_w, class_wq, class_pw, class_pwq = (
+            rows[:, 7 + j * classes : 7 + (j + 1) * classes] for j in range(5)
+        )
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            served = class_count.sum(axis=1)
+            result = {
+                "Rho": area_busy / (self.s * duration),
+                "P0": empty_time / duration,
+                "L": area_n / duration,
+                "Lq": area_q / duration,
+                "W": class_w.sum(axis=1) / served,
+                "Wq": class_wq.sum(axis=1) / served,
+            }
+            if self.k is not None:
+                result["Pk"] = blocked / arrivals
+            if t is not None:
+                result["pw"] = class_pw.sum(axis=1) / served
+                result["pwq"] = class_pwq.sum(axis=1) / served
+
+            if classes > 1:
+                for c in range(classes):
+                    label, i = f"Class {c + 1}", c + 1
+                    w_c = class_w[:, c] / class_count[:, c]
+                    wq_c = class_wq[:, c] / class_count[:, c]
+                    result[f"{label}|W{i}"] = w_c
+                    result[f"{label}|Wq{i}"] = wq_c
+                    # Lei de Little com a vazão observada da classe
+                    result[f"{label}|L{i}"] = class_count[:, c] / duration * w_c
+                    result[f"{label}|Lq{i}"] = class_count[:, c] / duration * wq_c
+
+        return result
+
+
+# Tradução dos modelos analíticos para a configuração do simulador
+SIMULATED_MODELS: Dict[str, Dict[str, Any]] = {
+    "MM1": {"fixed": {"s": 1}, "params": ["lamb", "mu"]},
+    "MMS": {"fixed": {}, "params": ["lamb", "mu", "s"]},
+    "MM1K": {"fixed": {"s": 1}, "params": ["lamb", "mu", "k"]},
+    "MMSK": {"fixed": {}, "params": ["lamb", "mu", "s", "k"]},
+    "MM1N": {"fixed": {"s": 1}, "params": ["lamb", "mu", "N"]},
+    "MMSN": {"fixed": {}, "params": ["lamb", "mu", "s", "N"]},
+    "MG1": {"fixed": {"s": 1}, "params": ["lamb", "mu", "var"]},
+    "MCPCI": {"fixed": {"s": 1, "preemptive": True}, "params": ["mu", "lamb_list"]},
+    "MCPCIS": {"fixed": {"preemptive": True}, "params": ["mu", "s", "lamb_list"]},
+    "MCPSI": {"fixed": {"preemptive": False}, "params": ["mu", "s", "lamb_list"]},
+}
+
+
+def build_simulator(model_type: str, seed=None, **params) -> QueueSimulator:
+    """
+    Cria um simulador com a mesma topologia de um modelo analítico
+
+    Args:
+        model_type: Tipo do modelo (ex: 'MM1', 'MMSK', 'MCPSI', etc)
+        seed: Semente do gerador
+        **params: Parâmetros do modelo; os que não se aplicam são ignorados
+
+    Raises:
+        ValueError: Se o modelo não puder ser simulado
+    """
+    if model_type not in SIMULATED_MODELS:
+        raise ValueError(
+            f"Modelo '{model_type}' não suportado pelo simulador. "
+            f"Modelos disponíveis: {', '.join(SIMULATED_MODELS.keys())}"
+        )
+
+    spec = SIMULATED_MODELS[model_type]
+    config = {name: params[name] for name in spec["params"] if name in params}
+    config.update(spec["fixed"])
+    if "lamb" not in config:
+        config["lamb"] = params.get("lamb", 0.0)
+    return QueueSimulator(seed=seed, **config)
+
+
+def simulate(
+    model_type: str,
+    horizon: float,
+    warmup: float = 0.0,
+    batches: int = 20,
+    seed=None,
+    t: Optional[float] = None,
+    max_events: Optional[int] = None,
+    **params,
+) -> Dict[str, Any]:
+    """Atalho para ``build_simulator(...).run(...)``"""
+    simulator = build_simulator(model_type, seed=seed, **params)
+    return simulator.run(
+        horizon, warmup=warmup, batches=batches, t=t, max_events=max_events
+    )
@@ -0,0 +1,185 @@
+"""
+Execução de replicações independentes do simulador em paralelo.
+
+Cada replicação recebe um fluxo aleatório próprio obtido por
+``SeedSequence.spawn``, de modo que a i-ésima replicação produz o mesmo
+resultado qualquer que seja o número de processos. Cada processo acumula as
+suas replicações (Welford) e devolve apenas os acumuladores, que são
+combinados em ordem fixa, sem guardar as amostras; a execução para assim que
+a meia largura pedida é atingida.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from math import sqrt
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+
+from simulation.engine import simulate, t_quantile_95
+
+
+class RunningStatistics:
+    """Média e variância acumuladas pelo algoritmo de Welford"""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def add(self, value: float) -> None:
+        if value != value:  # nan: replicação sem observações para a métrica
+            return
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    def merge(self, other: "RunningStatistics") -> None:
+        """Combina com outro acumulador (fórmula de Chan et al.)"""
+        if other.count == 0:
+            return
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.m2 += other.m2 + delta**2 * self.count * other.count / total
+        self.mean += delta * other.count / total
+        self.count = total
+
+    def variance(self) -> float:
+        return self.m2 / (self.count - 1) if self.count > 1 else float("inf")
+
+    def half_width(self) -> float:
+        """Meia largura do intervalo de confiança de 95% da média"""
+        if self.count < 2:
+            return float("inf")
+        return t_quantile_95(self.count - 1) * sqrt(self.variance() / self.count)
+
+
+def run_replications(
+    model_type: str,
+    horizon: float,
+    warmup: float = 0.0,
+    target_half_width: Optional[float] = None,
+    metrics: Optional[Iterable[str]] = None,
+    min_replications: int = 4,
+    max_replications: int = 64,
+    workers: Optional[int] = None,
+    seed: Optional[int] = None,
+    t: Optional[float] = None,
+    **params,
+) -> Dict[str, Any]:
+    """
+    Executa replicações até atingir a precisão desejada
+
+    Args:
+        model_type: Tipo do modelo simulado (ver ``SIMULATED_MODELS``)
+        horizon: Instante final de cada replicação
+        warmup: Período de aquecimento descartado em cada replicação
+        target_half_width: Meia largura máxima desejada (None executa todas)
+        metrics: Métricas que precisam atingir a meia largura (padrão: todas);
+            grupos de classes usam 'Class 1|W1'
+        min_replications: Mínimo de replicações antes de avaliar a parada
+        max_replications: Máximo de replicações
+        workers: Número de processos (1 executa no processo atual)
+        seed: Semente raiz da ``SeedSequence``
+        t: Tempo para estimar P(W > t) e P(Wq > t)
+        **params: Parâmetros do modelo
+
+    Returns:
+        Dicionário com ``metrics`` (média entre replicações),
+        ``confidence_intervals``, ``replications`` e ``converged``
+
+    Raises:
+        ValueError: Se os parâmetros forem inválidos ou ``metrics`` citar uma
+            métrica que a simulação não produz
+    """
+    if min_replications < 2 or max_replications < min_replications:
+        raise ValueError("Requer 2 ≤ min_replications ≤ max_replications.")
+
+    streams = np.random.SeedSequence(seed).spawn(max_replications)
+    workers = workers or 1
+    # Rodadas de tamanho fixo tornam a decisão de parada reprodutível
+    round_size = max(workers, min_replications)
+    statistics: Dict[str, RunningStatistics] = {}
+    watched = list(metrics) if metrics is not None else None
+    done = 0
+    converged = False
+
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        while done < max_replications and not converged:
+            batch = streams[done : done + round_size]
+            # Uma tarefa por processo, cada uma com uma fatia contígua da rodada
+            share = -(-len(batch) // workers)
+            arguments = [
+                (model_type, horizon, warmup, batch[i : i + share], t, params)
+                for i in range(0, len(batch), share)
+            ]
+            if executor is None:
+                partials = map(_run_replications, arguments)
+            else:
+                partials = executor.map(_run_replications, arguments)
+
+            for partial in partials:
+                for key, stat in partial.items():
+                    statistics.setdefault(key, RunningStatistics()).merge(stat)
+            done += len(batch)
+
+            if watched is not None:
+                unknown = [key for key in watched if key not in statistics]
+                if unknown:
+                    raise ValueError(
+                        f"Métricas não produzidas pela simulação de {model_type}: "
+                        f"{', '.join(unknown)}. Disponíveis: {', '.join(statistics)}"
+                    )
+            if target_half_width is not None and done >= min_replications:
+                converged = all(
+                    statistics[key].half_width() <= target_half_width
+                    for key in (watched or statistics.keys())
+                )
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+    return {
+        "metrics": _unflatten({key: stat.mean for key, stat in statistics.items()}),
+        "confidence_intervals": _unflatten(
+            {key: stat.half_width() for key, stat in statistics.items()}
+        ),
+        "replications": done,
+        "converged": converged,
+    }
+
+
+def _run_replications(arguments: tuple) -> Dict[str, RunningStatistics]:
+    """Executa replicações em sequência (em um processo do pool) e as acumula"""
+    model_type, horizon, warmup, streams, t, params = arguments
+    statistics: Dict[str, RunningStatistics] = {}
+    for stream in streams:
+        result = simulate(
+            model_type, horizon, warmup=warmup, batches=2, seed=stream, t=t, **params
+        )
+        for key, value in _flatten(result["metrics"]).items():
+            statistics.setdefault(key, RunningStatistics()).add(value)
+    return statistics
+
+
+def _flatten(metrics: Dict[str, Any]) -> Dict[str, float]:
+    flat = {}
+    for key, value in metrics.items():
+        if isinstance(value, dict):
+            for inner_key, inner_value in value.items():
+                flat[f"{key}|{inner_key}"] = inner_value
+        else:
+            flat[key] = value
+    return flat
+
+
+def _unflatten(flat: Dict[str, float]) -> Dict[str, Any]:
+    nested: Dict[str, Any] = {}
+    for key, value in flat.items():
+        group: List[str] = key.split("|")
+        if len(group) == 2:
+            nested.setdefault(group[0], {})[group[1]] = value
+        else:
+            nested[key] = value
+    return nested
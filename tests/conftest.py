@@ -0,0 +1,12 @@
+import pytest
+
+from app import app as flask_app
+from services.queue_service import QueueService
+
+
+@pytest.fixture
+def client():
+    flask_app.config["TESTING"] = True
+    QueueService.clear_cache()
+    with flask_app.test_client() as client:
+        yield client
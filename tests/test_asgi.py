@@ -0,0 +1,84 @@
+import asyncio
+import json
+import threading
+
+import pytest
+
+from asgi import BoundedExecutor, QueueASGIApp
+from services.queue_service import QueueService
+
+
+def _request(app, method, path, body=None, raw=None):
+    async def run():
+        payload = raw if raw is not None else json.dumps(body).encode() if body else b""
+        messages = [{"type": "http.request", "body": payload, "more_body": False}]
+        sent = []
+
+        async def receive():
+            if messages:
+                return messages.pop(0)
+            await asyncio.Event().wait()  # O cliente nunca desconecta
+
+        async def send(message):
+            sent.append(message)
+
+        await app({"type": "http", "method": method, "path": path}, receive, send)
+        app.executor.shutdown()
+        data = sent[1]["body"]
+        return sent[0]["status"], json.loads(data) if data else None
+
+    return asyncio.run(run())
+
+
+@pytest.fixture
+def app():
+    QueueService.clear_cache()
+    return QueueASGIApp(max_workers=2, max_pending=2)
+
+
+def test_calculate_matches_the_flask_route(app, client):
+    payload = {"model_type": "MMS", "lamb": 3, "mu": 2, "s": 2}
+    status, body = _request(app, "POST", "/api/calculate", payload)
+
+    assert status == 200
+    assert body == client.post("/api/calculate", json=payload).get_json()
+
+
+@pytest.mark.parametrize(
+    "method,path,raw,status",
+    [
+        ("POST", "/api/calculate", b"{", 400),
+        ("POST", "/api/calculate", b"", 400),
+        ("GET", "/api/calculate", b"", 405),
+        ("GET", "/api/nope", b"", 404),
+    ],
+)
+def test_request_errors(app, method, path, raw, status):
+    assert _request(app, method, path, raw=raw)[0] == status
+
+
+def test_validation_errors_are_400(app):
+    status, body = _request(
+        app, "POST", "/api/calculate", {"model_type": "MM1", "lamb": 3, "mu": 2}
+    )
+
+    assert status == 400 and not body["success"]
+
+
+def test_full_executor_rejects_instead_of_queueing():
+    async def run():
+        executor = BoundedExecutor(max_workers=1, max_pending=0)
+        release = threading.Event()
+        running = executor.submit(release.wait)
+        rejected = executor.submit(lambda: None)
+        release.set()
+        await running
+        await asyncio.sleep(0)  # A vaga é devolvida pelo laço de eventos
+        accepted = executor.submit(lambda: "ok")
+        result = await accepted
+        executor.shutdown()
+        return rejected, executor.rejected, result
+
+    rejected, count, result = asyncio.run(run())
+    assert rejected is None and count == 1
+    assert result == "ok"
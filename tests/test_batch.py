@@ -0,0 +1,45 @@
+from models.mm1 import MM1
+
+
+def test_batch_items_preserve_order_and_report_row_errors(client):
+    response = client.post(
+        "/api/calculate/batch",
+        json={
+            "model_type": "MM1",
+            "items": [
+                {"lamb": 1, "mu": 2},
+                {"lamb": 3, "mu": 2},
+                {"lamb": 1, "mu": 4},
+            ],
+        },
+    )
+
+    assert response.status_code == 200
+    body = response.get_json()
+    assert body["count"] == 3
+    assert body["errors"] == 1
+    first, unstable, last = body["results"]
+    assert first["success"] and last["success"]
+    assert not unstable["success"]
+    assert first["metrics"]["L"] == MM1(1, 2, 0, 1, 0, 0, 0).calculate_metrics()["L"]
+    assert last["metrics"]["Rho"] == 0.25
+
+
+def test_batch_columns_repeat_scalars(client):
+    response = client.post(
+        "/api/calculate/batch",
+        json={"model_type": "MMS", "columns": {"lamb": [1, 2, 3], "mu": 1, "s": 5}},
+    )
+
+    results = response.get_json()["results"]
+    assert [row["metrics"]["Rho"] for row in results] == [0.2, 0.4, 0.6]
+
+
+def test_batch_rejects_mismatched_columns(client):
+    response = client.post(
+        "/api/calculate/batch",
+        json={"model_type": "MM1", "columns": {"lamb": [1, 2], "mu": [2, 3, 4]}},
+    )
+
+    assert response.status_code == 400
+    assert not response.get_json()["success"]
@@ -0,0 +1,91 @@
+import pytest
+
+from benchmarks.suite import (
+    MAX_INSTRUMENTATION_OVERHEAD,
+    MIN_EVENTS_PER_SECOND,
+    MODEL_CASES,
+    ROUTE_CASES,
+    SIMULATION_CASES,
+    compare,
+    missed_targets,
+    overhead_benchmarks,
+)
+from models.queue_factory import QueueFactory
+from simulation.engine import simulate
+
+
+def test_every_registered_model_has_a_case():
+    covered = {model_type for model_type, _ in MODEL_CASES.values()}
+
+    assert covered == set(QueueFactory.get_available_models())
+
+
+@pytest.mark.parametrize("name", list(MODEL_CASES))
+def test_model_cases_are_valid(name):
+    model_type, data = MODEL_CASES[name]
+    params = QueueFactory.build_params(model_type, data)
+
+    assert QueueFactory.create_queue(model_type, **params).calculate_metrics()
+
+
+@pytest.mark.parametrize("name", list(ROUTE_CASES))
+def test_route_cases_are_valid(client, name):
+    assert client.post("/api/calculate", json=ROUTE_CASES[name]).status_code == 200
+
+
+@pytest.mark.parametrize("name", list(SIMULATION_CASES))
+def test_simulation_cases_are_valid(name):
+    model_type, params, horizon = SIMULATION_CASES[name]
+
+    assert simulate(model_type, horizon / 100, seed=0, **params)["events"] > 0
+
+
+def test_throughput_below_the_target_is_reported():
+    results = {
+        "sim/fast": {"median_us": 0.5, "events_per_s": 2 * MIN_EVENTS_PER_SECOND},
+        "sim/slow": {"median_us": 2.0, "events_per_s": MIN_EVENTS_PER_SECOND / 2},
+        "MM1/typical": {"median_us": 10.0},
+    }
+
+    missed = missed_targets(results)
+
+    assert len(missed) == 1
+    assert missed[0].startswith("sim/slow")
+
+
+def test_instrumentation_overhead_above_the_target_is_reported():
+    results = {
+        "overhead/cheap": {"median_us": 9.0, "overhead": MAX_INSTRUMENTATION_OVERHEAD / 2},
+        "overhead/costly": {"median_us": 9.0, "overhead": 2 * MAX_INSTRUMENTATION_OVERHEAD},
+    }
+
+    missed = missed_targets(results)
+
+    assert len(missed) == 1
+    assert missed[0].startswith("overhead/costly")
+
+
+def test_instrumentation_overhead_stays_below_the_target():
+    result = overhead_benchmarks(repeat=2)["overhead/MM1"]
+
+    assert result["timed_overhead"] > 0
+    assert result["overhead"] < MAX_INSTRUMENTATION_OVERHEAD
+
+
+def test_compare_classifies_each_case():
+    def document(**medians):
+        return {"results": {name: {"median_us": us} for name, us in medians.items()}}
+
+    rows = compare(
+        document(slow=10.0, fast=10.0, same=10.0, gone=1.0),
+        document(slow=20.0, fast=5.0, same=12.0, new=3.0),
+        threshold=1.5,
+    )
+
+    assert {row["name"]: row["status"] for row in rows} == {
+        "slow": "regressão",
+        "fast": "melhora",
+        "same": "ok",
+        "gone": "ausente",
+        "new": "novo",
+    }
@@ -0,0 +1,61 @@
+from math import inf
+
+import pytest
+
+from models.capacity import max_arrival_rate, max_arrival_rates
+from models.optimizer import MIN_SERVERS
+from models.queue_factory import QueueFactory
+from models.registry import get_schema
+
+
+def _metrics(model_type, **params):
+    full = get_schema(model_type).coerce(params)
+    return QueueFactory.create_queue(model_type, **full).calculate_metrics()
+
+
+def test_mm1_has_a_closed_form_answer():
+    result = max_arrival_rate("MM1", mu=1.0, metric="W", target=2.0)
+
+    assert result["lamb"] == pytest.approx(0.5)
+    assert result["Rho"] == pytest.approx(0.5)
+
+
+def test_mms_limit_reproduces_the_target():
+    result = max_arrival_rate("MMS", mu=1.0, metric="Wq", target=0.1, s=10)
+    metrics = _metrics("MMS", lamb=result["lamb"], mu=1.0, s=10)
+
+    assert result["Wq"] == pytest.approx(0.1)
+    assert metrics["Wq"] == pytest.approx(0.1, abs=0.005)
+
+
+@pytest.mark.parametrize("model_type, extra", [("MMS", {}), ("MMSK", {"k": 8})])
+def test_multi_server_models_require_the_minimum_number_of_servers(model_type, extra):
+    with pytest.raises(ValueError, match=str(MIN_SERVERS)):
+        max_arrival_rate(model_type, mu=1.0, metric="W", target=2.0, s=MIN_SERVERS - 1, **extra)
+
+
+def test_mmsk_blocking_target():
+    result = max_arrival_rate("MMSK", mu=1.0, metric="Pk", target=0.01, s=3, k=8)
+    params = get_schema("MMSK").coerce({"lamb": result["lamb"], "mu": 1.0, "s": 3, "k": 8})
+    probabilities = QueueFactory.create_queue("MMSK", **params).calculate_distribution()
+
+    assert probabilities[-1] == pytest.approx(0.01, rel=1e-6)
+
+
+def test_target_above_the_supremum_is_never_violated():
+    result = max_arrival_rate("MMSK", mu=1.0, metric="W", target=10.0, s=2, k=4)
+
+    assert result["lamb"] == inf
+
+
+def test_unreachable_target_is_reported_per_item():
+    results = max_arrival_rates(
+        [
+            {"model_type": "MM1", "mu": 1.0, "metric": "W", "target": 0.5},
+            {"model_type": "MG1", "mu": 1.0, "metric": "Wq", "target": 1.0, "var": 0.0},
+        ]
+    )
+
+    assert "error" in results[0]
+    # Pollaczek-Khinchine com serviço determinístico: Wq = ρ / (2(1 - ρ))
+    assert results[1]["lamb"] == pytest.approx(2 / 3)
@@ -0,0 +1,49 @@
+import pytest
+
+from models.distribution import mean_customers_system, percentile, probability_exceeding
+from models.mm1k import MM1K
+from models.mms import MMS
+from models.mmsk import MMsK
+
+
+def test_mm1k_distribution_is_geometric():
+    probabilities = MM1K(0.5, 1, 4, 1, 0).calculate_distribution()
+
+    assert len(probabilities) == 5
+    assert sum(probabilities) == pytest.approx(1)
+    for previous, current in zip(probabilities, probabilities[1:]):
+        assert current / previous == pytest.approx(0.5)
+
+
+def test_mmsk_distribution_agrees_with_metrics():
+    queue = MMsK(3, 1, 10, 4, 2)
+    probabilities = queue.calculate_distribution()
+    metrics = queue.calculate_metrics()
+
+    assert sum(probabilities) == pytest.approx(1)
+    assert probabilities[0] == pytest.approx(metrics["P0"], abs=1e-4)
+    assert mean_customers_system(probabilities) == pytest.approx(metrics["L"], abs=1e-4)
+
+
+def test_derived_queries():
+    probabilities = [0.5, 0.25, 0.125, 0.125]
+
+    assert probability_exceeding(probabilities, 1) == pytest.approx(0.25)
+    assert percentile(probabilities, 0.5) == 0
+    assert percentile(probabilities, 0.8) == 2
+
+
+def test_infinite_models_have_no_distribution():
+    with pytest.raises(ValueError):
+        MMS(3, 1, 0, 5, 0, 0, 0).calculate_distribution()
+
+
+def test_calculate_returns_distribution_on_request(client):
+    response = client.post(
+        "/api/calculate",
+        json={"model_type": "MM1K", "lamb": 0.5, "mu": 1, "k": 4, "distribution": True},
+    )
+
+    distribution = response.get_json()["distribution"]
+    assert len(distribution["probabilities"]) == 5
+    assert sum(distribution["probabilities"]) == pytest.approx(1, abs=1e-5)
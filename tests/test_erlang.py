@@ -0,0 +1,47 @@
+from math import exp, factorial
+
+import pytest
+
+from models.erlang import (
+    erlang_b,
+    erlang_c,
+    mms_log_probability_system_empty,
+)
+from models.mms import MMS
+
+
+def _erlang_c_factorial(s, a):
+    """Fórmula direta com fatoriais, válida para s pequeno"""
+    top = a**s / factorial(s) * s / (s - a)
+    return top / (sum(a**n / factorial(n) for n in range(s)) + top)
+
+
+@pytest.mark.parametrize("s,a", [(1, 0.5), (2, 1.5), (5, 3.0), (20, 17.5)])
+def test_erlang_c_matches_factorial_formula(s, a):
+    assert erlang_c(s, a) == pytest.approx(_erlang_c_factorial(s, a), rel=1e-12)
+
+
+@pytest.mark.parametrize("s,a", [(2, 1.5), (10, 7.0)])
+def test_log_p0_matches_factorial_formula(s, a):
+    p0 = 1 / (
+        sum(a**n / factorial(n) for n in range(s)) + a**s / factorial(s) / (1 - a / s)
+    )
+    assert exp(mms_log_probability_system_empty(s, a)) == pytest.approx(p0, rel=1e-12)
+
+
+def test_erlang_b_of_single_server():
+    # B(1, a) = a / (1 + a)
+    assert erlang_b(1, 3.0) == pytest.approx(0.75)
+
+
+def test_large_server_counts_do_not_overflow():
+    metrics = MMS(4500, 1, 0, 5000, 10, 10, 0.1).calculate_metrics()
+
+    assert 0 <= metrics["P0"] <= 1
+    assert metrics["Lq"] >= 0
+
+
+def test_erlang_c_rejects_unstable_load():
+    with pytest.raises(ValueError):
+        erlang_c(3, 3.0)
+
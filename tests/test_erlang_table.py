@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+
+from models import erlang_table
+from models.erlang import erlang_c
+from models.erlang_table import ErlangCTable, build_table, table_erlang_c
+
+
+@pytest.fixture(scope="module")
+def table_path(tmp_path_factory):
+    path = tmp_path_factory.mktemp("erlang") / "erlang_c.npy"
+    np.save(path, build_table(s_max=60, points=513))
+    return str(path)
+
+
+@pytest.fixture
+def table(table_path):
+    return ErlangCTable.load(table_path)
+
+
+def test_interpolation_stays_within_the_measured_error(table):
+    rng = np.random.default_rng(7)
+    for s in rng.integers(1, table.s_max + 1, 200):
+        a = float(rng.uniform(0, table.rho_max * s))
+        assert abs(table.erlang_c(int(s), a) - erlang_c(int(s), a)) <= table.max_error
+
+
+def test_scalar_lookup_returns_python_floats(table):
+    assert type(table.erlang_c(10, 7.5)) is float
+
+
+def test_points_outside_the_table_are_exact(table):
+    assert table.erlang_c(100, 90.0) == erlang_c(100, 90.0)
+    assert table.erlang_c(10, 9.995) == erlang_c(10, 9.995)
+    with pytest.raises(ValueError, match="instável"):
+        table.erlang_c(10, 10.0)
+
+
+def test_array_lookup_matches_the_scalar_lookup(table):
+    s = np.array([1, 5, 60, 100, 4])
+    a = np.array([0.3, 4.0, 50.0, 90.0, 4.0])
+
+    result = table.lookup(s, a)
+
+    assert result[:4] == pytest.approx([table.erlang_c(int(x), y) for x, y in zip(s[:4], a[:4])])
+    assert np.isnan(result[4])
+
+
+def test_table_backend_is_opt_in(table_path, monkeypatch):
+    erlang_table.configured_table.cache_clear()
+    monkeypatch.delenv(erlang_table.TABLE_ENV, raising=False)
+    assert table_erlang_c(8, 6.123) == erlang_c(8, 6.123)
+
+    monkeypatch.setenv(erlang_table.TABLE_ENV, table_path)
+    erlang_table.configured_table.cache_clear()
+    try:
+        interpolated = table_erlang_c(8, 6.123)
+        assert interpolated != erlang_c(8, 6.123)
+        assert interpolated == pytest.approx(erlang_c(8, 6.123), abs=1e-3)
+    finally:
+        erlang_table.configured_table.cache_clear()
@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from models.erlang import erlang_c, erlang_c_array
+from models.queue_factory import QueueFactory
+from models.registry import get_schema
+
+METRICS = ("Lq", "L", "Wq", "W")
+
+
+def _metrics(model_type, **params):
+    full = get_schema(model_type).coerce(params)
+    return QueueFactory.create_queue(model_type, **full).calculate_metrics()
+
+
+@pytest.mark.parametrize("lamb, mu, s", [(3.0, 1.0, 4), (90.0, 1.0, 100)])
+def test_poisson_arrivals_and_service_match_mms(lamb, mu, s):
+    ggs = _metrics("GGS", lamb=lamb, mu=mu, s=s)
+    mms = _metrics("MMS", lamb=lamb, mu=mu, s=s)
+
+    for key in METRICS:
+        # M/M/s arredonda em 2 casas
+        assert ggs[key] == pytest.approx(mms[key], abs=0.006)
+    assert ggs["Pw"] == pytest.approx(erlang_c(s, lamb / mu), abs=1e-4)
+
+
+@pytest.mark.parametrize("cs2", [0.0, 0.5, 3.0])
+def test_single_server_with_poisson_arrivals_matches_mg1(cs2):
+    lamb, mu = 0.7, 1.0
+    ggs = _metrics("GGS", lamb=lamb, mu=mu, s=1, cs2=cs2)
+    mg1 = _metrics("MG1", lamb=lamb, mu=mu, var=cs2 / mu**2)
+
+    for key in METRICS:
+        assert ggs[key] == pytest.approx(mg1[key], abs=1e-4)
+
+
+def test_capacity_is_not_part_of_the_schema():
+    schema = get_schema("GGS")
+
+    assert "k" not in [spec.name for spec in schema.params]
+    assert "k" not in schema.coerce({"lamb": 1, "mu": 2, "k": 5})
+
+
+def test_erlang_c_array_matches_the_scalar_function():
+    s = np.array([1, 4, 50, 1000, 3])
+    a = np.array([0.5, 3.0, 45.0, 900.0, 3.0])
+
+    result = erlang_c_array(s, a)
+
+    assert result[:4] == pytest.approx([erlang_c(si, ai) for si, ai in zip(s[:4], a[:4])])
+    assert np.isnan(result[4])
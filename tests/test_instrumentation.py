@@ -0,0 +1,107 @@
+import threading
+
+import pytest
+
+from services.instrumentation import SAMPLE_EVERY, Instrumentation, model_label, size_bucket
+from services.queue_service import QueueService
+
+
+def test_size_bucket_uses_the_largest_size_parameter():
+    assert size_bucket({"lamb": 1, "mu": 2}) == "1-10"
+    assert size_bucket({"s": 5, "k": "250"}) == "101-1000"
+    assert size_bucket({"N": 10_000}) == "1001-10000"
+    assert size_bucket({"lamb_list": [1.0] * 20}) == "11-100"
+    assert size_bucket({"s": "abc"}) == "1-10"
+
+
+def test_unknown_models_share_one_series():
+    assert model_label("MMS") == "MMS"
+    assert model_label("<script>") == "unknown"
+
+
+def test_timed_counts_calls_errors_and_buckets():
+    instrumentation = Instrumentation(sample_every=1)
+    instrumentation.timed("calculate", "MM1", {}, lambda: 1)
+    with pytest.raises(ValueError):
+        instrumentation.timed("calculate", "MM1", {}, _fail)
+    instrumentation.observe("serialize", "MM1", "1-10", 0.003)
+
+    snapshot = instrumentation.snapshot()
+    calculate = snapshot[("calculate", "MM1", "1-10")]
+    assert calculate["count"] == 2 and calculate["errors"] == 1
+    serialize = snapshot[("serialize", "MM1", "1-10")]
+    assert serialize["buckets"].index(1) == 8  # 0.003 cai no bucket ≤ 0.005
+
+
+def test_render_is_cumulative_prometheus_text():
+    instrumentation = Instrumentation()
+    instrumentation.observe("create", "MMS", "1-10", 0.00002)
+    instrumentation.observe("create", "MMS", "1-10", 0.2)
+    text = instrumentation.render([("queue_cache_hits_total", "counter", "Acertos.", 3)])
+
+    labels = 'stage="create",model="MMS",size="1-10"'
+    assert f'queue_stage_duration_seconds_bucket{{{labels},le="2.5e-05"}} 1' in text
+    assert f'queue_stage_duration_seconds_bucket{{{labels},le="+Inf"}} 2' in text
+    assert f"queue_stage_errors_total{{{labels}}} 0" in text
+    assert "queue_cache_hits_total 3" in text
+
+
+def test_disabled_instrumentation_records_nothing():
+    instrumentation = Instrumentation(enabled=False)
+    assert instrumentation.timed("calculate", "MM1", {}, lambda: 7) == 7
+    assert instrumentation.snapshot() == {}
+
+
+def test_sampled_calls_are_weighted_and_errors_are_exact():
+    instrumentation = Instrumentation(sample_every=4)
+    for _ in range(8):
+        instrumentation.timed("calculate", "MM1", {"s": 1}, lambda: 1)
+    for _ in range(3):
+        with pytest.raises(ValueError):
+            instrumentation.timed("create", "MM1", {"s": 1}, _fail)
+
+    snapshot = instrumentation.snapshot()
+    assert snapshot[("calculate", "MM1", "1-10")]["count"] == 8
+    # A primeira falha foi amostrada (peso 4); as outras só contam o erro
+    create = snapshot[("create", "MM1", "1-10")]
+    assert create["count"] == 4 and create["errors"] == 3
+
+
+def test_sample_interval_must_be_positive():
+    with pytest.raises(ValueError):
+        Instrumentation(sample_every=0)
+
+
+def test_series_of_finished_threads_are_kept():
+    instrumentation = Instrumentation(sample_every=1)
+
+    def work():
+        for _ in range(100):
+            instrumentation.observe("calculate", "MMS", "1-10", 0.0001)
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    work()
+
+    assert instrumentation.snapshot()[("calculate", "MMS", "1-10")]["count"] == 500
+    instrumentation.reset()
+    assert instrumentation.snapshot() == {}
+
+
+def test_metrics_endpoint_reports_the_calculation(client):
+    QueueService.configure_metrics(True, sample_every=1)
+    try:
+        client.post("/api/calculate", json={"model_type": "MM1", "lamb": 1, "mu": 2})
+        response = client.get("/metrics")
+    finally:
+        QueueService.configure_metrics(True, sample_every=SAMPLE_EVERY)
+
+    assert response.status_code == 200
+    assert 'stage="calculate",model="MM1"' in response.get_data(as_text=True)
+
+
+def _fail():
+    raise ValueError("falhou")
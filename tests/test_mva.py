@@ -0,0 +1,126 @@
+import math
+
+import numpy as np
+import pytest
+
+from models.mm1n import MM1N
+from models.mmsn import MMSN
+from models.mva import (
+    MAX_EXACT_MULTI_SERVER_STATIONS,
+    MAX_EXACT_MULTI_SERVER_WORK,
+    _exact_single_class,
+    _exact_single_class_small,
+    mva,
+)
+
+
+def _normalizing_constants(population, demands, servers, think):
+    """G(0..N) da rede pela convolução de Buzen"""
+
+    def factor(demand, s, j):
+        if s == 0 or j <= s:
+            return demand**j / math.factorial(j)
+        return demand**j / (math.factorial(s) * s ** (j - s))
+
+    g = np.zeros(population + 1)
+    g[0] = 1.0
+    for demand, s in list(zip(demands, servers)) + [(think, 0)]:
+        factors = np.array([factor(demand, s, j) for j in range(population + 1)])
+        g = np.array([factors[: n + 1] @ g[n::-1] for n in range(population + 1)])
+    return g
+
+
+@pytest.mark.parametrize("model, s", [(MM1N, 1), (MMSN, 3)])
+def test_single_station_matches_the_finite_population_models(model, s):
+    lamb, mu, population = 0.1, 1.0, 20
+    expected = model(lamb, mu, 0, s, 1, population).calculate_metrics()
+
+    result = mva(population, [1 / mu], servers=s, think_time=1 / lamb)
+
+    assert result["approximate"] is False
+    assert result["stations"]["L"][0] == pytest.approx(expected["L"], abs=1e-4)
+    assert result["response_time"][0] == pytest.approx(expected["W"], abs=1e-4)
+
+
+@pytest.mark.parametrize(
+    "demands, servers, think, population",
+    [
+        ([0.5, 4.0], [1, 16], 10.0, 60),
+        ([0.5, 4.0, 1.0], [1, 16, 3], 5.0, 60),
+        ([1.0, 2.0, 1.5], [2, 4, 3], 5.0, 60),
+    ],
+)
+def test_multi_server_throughput_matches_the_convolution(demands, servers, think, population):
+    g = _normalizing_constants(population, demands, servers, think)
+
+    result = mva(population, demands, servers=servers, think_time=think, curve=True)
+
+    expected = g[:-1] / g[1:]
+    assert result["curve"]["throughput"] == pytest.approx(expected, rel=1e-9)
+
+
+def test_saturated_multi_server_network_stays_at_the_bottleneck_rate():
+    # A estação com um servidor (D = 0.5) limita a vazão a 2; a recursão de
+    # p(0) por normalização derivava para valores bem abaixo disso
+    result = mva(3000, [0.5, 4.0], servers=[1, 16], think_time=10.0)
+
+    assert result["throughput"][0] == pytest.approx(2.0, rel=1e-12)
+    assert result["stations"]["U"][1] == pytest.approx(0.5, rel=1e-12)
+
+
+def test_python_and_numpy_recursions_agree():
+    demands = np.array([0.5, 4.0, 1.0, 0.2])
+    servers = np.array([1, 16, 3, 0])
+
+    fast = _exact_single_class_small(500, demands, servers, 5.0)
+    vectorized = _exact_single_class(500, demands, servers, 5.0)
+
+    assert fast[0] == pytest.approx(vectorized[0], rel=1e-12)
+    assert fast[1] == pytest.approx(vectorized[1], rel=1e-12)
+    assert fast[2][0] == pytest.approx(vectorized[2][0], rel=1e-12)
+
+
+def test_many_multi_server_stations_fall_back_to_seidmann():
+    stations = MAX_EXACT_MULTI_SERVER_STATIONS + 1
+    result = mva(30, [1.0] * stations, servers=2)
+
+    assert result["approximate"] is True
+    with pytest.raises(ValueError, match="curva"):
+        mva(30, [1.0] * stations, servers=2, curve=True)
+
+
+def test_large_populations_with_multi_server_stations_fall_back_to_seidmann(client):
+    servers = [2, 4, 8, 16]
+    population = MAX_EXACT_MULTI_SERVER_WORK // 2 ** len(servers) + 1
+    body = {"N": population, "demands": [1.0] * 4, "s": servers, "think_time": 5.0}
+
+    assert mva(population - 1, [1.0] * 4, servers=servers, think_time=5.0)["approximate"] is False
+    assert mva(population, [1.0] * 4, servers=servers, think_time=5.0)["approximate"] is True
+    response = client.post("/api/network/closed", json={**body, "curve": True})
+    assert response.status_code == 400
+    assert str(MAX_EXACT_MULTI_SERVER_WORK) in response.get_json()["error"]
+
+
+def test_schweitzer_is_close_to_the_exact_solution():
+    exact = mva(40, [1.0, 0.5, 0.8], think_time=4.0)
+    approximate = mva(40, [1.0, 0.5, 0.8], think_time=4.0, method="schweitzer")
+
+    assert approximate["approximate"] is True
+    assert approximate["throughput"][0] == pytest.approx(exact["throughput"][0], rel=0.02)
+
+
+def test_multi_class_lattice_limit():
+    with pytest.raises(ValueError, match="schweitzer"):
+        mva([1000, 1000], [[1.0, 1.0], [1.0, 1.0]])
+
+
+def test_route_caps_only_the_exact_population(client):
+    body = {"N": 200_000, "demands": [1.0, 0.5], "think_time": 1.0}
+
+    rejected = client.post("/api/network/closed", json=body)
+    approximate = client.post("/api/network/closed", json={**body, "method": "schweitzer"})
+
+    assert rejected.status_code == 400
+    assert "schweitzer" in rejected.get_json()["error"]
+    assert approximate.status_code == 200
+    assert approximate.get_json()["throughput"][0] == pytest.approx(1.0, rel=1e-3)
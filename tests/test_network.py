@@ -0,0 +1,69 @@
+import time
+
+import numpy as np
+import pytest
+
+from models.network import DENSE_SOLVE_LIMIT, jackson_network
+
+
+def _ring(size, stay):
+    return [[i, (i + 1) % size, stay] for i in range(size)]
+
+
+def test_tandem_adds_the_station_times():
+    result = jackson_network([1.0, 0.0], [2.0, 3.0], routes=[[0, 1, 1.0]])
+
+    assert result["stations"]["lamb"] == pytest.approx([1.0, 1.0])
+    assert result["W"] == pytest.approx(1 / (2 - 1) + 1 / (3 - 1))
+
+
+def test_feedback_scales_the_arrival_rate():
+    result = jackson_network([1.0], 4.0, routing=[[0.5]])
+
+    assert result["stations"]["lamb"] == pytest.approx([2.0])
+    assert result["stations"]["visits"] == pytest.approx([2.0])
+
+
+def test_large_ring_with_a_small_exit_is_solved():
+    size, exit_probability = DENSE_SOLVE_LIMIT + 1, 1e-4
+    gamma = np.zeros(size)
+    gamma[0] = 1.0
+    result = jackson_network(gamma, 2e4, routes=_ring(size, 1 - exit_probability))
+
+    stay = 1 - exit_probability
+    expected = stay ** np.arange(size) / (1 - stay**size)
+    assert result["stations"]["lamb"] == pytest.approx(expected, rel=1e-9)
+
+
+def test_sparse_solve_matches_the_dense_solution():
+    rng = np.random.default_rng(3)
+    size = DENSE_SOLVE_LIMIT + 200
+    source = rng.integers(0, size, 4 * size)
+    target = rng.integers(0, size, 4 * size)
+    probability = rng.uniform(0, 0.1, 4 * size)
+    gamma = rng.uniform(0, 1, size)
+    routes = np.column_stack([source, target, probability]).tolist()
+
+    system = np.eye(size)
+    np.subtract.at(system, (target, source), probability)
+    expected = np.linalg.solve(system, gamma)
+    result = jackson_network(gamma, 1e3, routes=routes)
+
+    assert result["stations"]["lamb"] == pytest.approx(expected, rel=1e-9)
+
+
+@pytest.mark.parametrize("size", [10, 50_000])
+def test_closed_ring_is_rejected_from_the_routes(size):
+    gamma = np.zeros(size)
+    gamma[0] = 1.0
+    start = time.perf_counter()
+    with pytest.raises(ValueError, match="sem caminho até a saída: 0, 1, 2"):
+        jackson_network(gamma, 10.0, routes=_ring(size, 1.0))
+    assert time.perf_counter() - start < 5
+
+
+def test_trapped_stations_are_named():
+    # 0 sai da rede, mas 1 e 2 trocam clientes entre si para sempre
+    routes = [[0, 1, 0.5], [1, 2, 1.0], [2, 1, 1.0]]
+    with pytest.raises(ValueError, match="saída: 1, 2$"):
+        jackson_network([1.0, 0.0, 0.0], 10.0, routes=routes)
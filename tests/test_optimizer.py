@@ -0,0 +1,62 @@
+import pytest
+
+from models.optimizer import CURVE_RADIUS, minimum_servers
+from models.queue_factory import QueueFactory
+from models.registry import get_schema
+
+
+def test_light_load_returns_the_smallest_valid_mms():
+    result = minimum_servers("MMS", lamb=0.1, mu=1.0, target_wq=10.0)
+
+    assert result["s"] == 2
+    assert [point["s"] for point in result["curve"]] == [2]
+
+
+def test_mms_result_matches_the_model():
+    result = minimum_servers("MMS", lamb=9.0, mu=1.0, target_wq=0.05)
+    params = get_schema("MMS").coerce({"lamb": 9.0, "mu": 1.0, "s": result["s"]})
+    metrics = QueueFactory.create_queue("MMS", **params).calculate_metrics()
+
+    assert metrics["Wq"] == pytest.approx(result["Wq"], abs=0.005)
+    assert result["Wq"] <= 0.05
+    assert result["curve"][-2]["Wq"] > 0.05
+
+
+@pytest.mark.parametrize("model_type,extra", [("MMSK", {"k": 30}), ("MMSN", {"N": 30})])
+def test_binary_search_finds_the_first_feasible_s(model_type, extra):
+    result = minimum_servers(model_type, lamb=0.3, mu=1.0, target_wq=0.2, **extra)
+    s = result["s"]
+
+    assert s >= 2
+    assert result["Wq"] <= 0.2
+    if s > 2:
+        below = minimum_servers(
+            model_type, lamb=0.3, mu=1.0, target_wq=1e9, s_max=s - 1, **extra
+        )["curve"]
+        assert all(point["Wq"] > 0.2 for point in below if point["s"] == s - 1)
+
+
+@pytest.mark.parametrize(
+    "model_type,lamb,extra", [("MMSK", 30.0, {"k": 200}), ("MMSN", 0.3, {"N": 200})]
+)
+def test_finite_model_curve_is_contiguous_around_the_choice(model_type, lamb, extra):
+    result = minimum_servers(model_type, lamb=lamb, mu=1.0, target_wq=0.01, **extra)
+    servers = [point["s"] for point in result["curve"]]
+
+    assert servers == list(range(result["s"] - CURVE_RADIUS, result["s"] + CURVE_RADIUS + 1))
+    assert all(point["Wq"] > 0.01 for point in result["curve"] if point["s"] < result["s"])
+
+
+def test_single_server_limit_has_no_candidate():
+    with pytest.raises(ValueError, match="s_max"):
+        minimum_servers("MMSK", lamb=0.5, mu=1.0, target_wq=1.0, k=1)
+
+
+def test_cost_picks_the_cheapest_feasible_point():
+    result = minimum_servers(
+        "MMS", lamb=9.0, mu=1.0, target_wq=10.0, server_cost=1.0, waiting_cost=50.0
+    )
+    feasible = [point for point in result["curve"] if point["Wq"] <= 10.0]
+
+    assert result["cost"] == min(point["cost"] for point in feasible)
+    assert result["s"] > min(point["s"] for point in feasible)
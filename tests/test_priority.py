@@ -0,0 +1,48 @@
+import pytest
+
+from models.queue_factory import QueueFactory
+from models.registry import get_schema
+from services.queue_service import QueueService
+
+
+def _metrics(model_type, **params):
+    return QueueService.calculate(model_type, **get_schema(model_type).coerce(params))
+
+
+def test_top_class_of_the_preemptive_model_is_an_mm1():
+    metrics = _metrics("MCPCI", mu=4.0, lamb_list=[1.0, 2.0])
+
+    assert metrics["Class 1"]["W1"] == pytest.approx(1 / (4.0 - 1.0), abs=1e-6)
+
+
+def test_non_preemptive_total_wait_matches_fcfs():
+    # Prioridade sem interrupção não altera a espera média do sistema
+    priority = _metrics("MCPSI", mu=4.0, s=2, lamb_list=[1.0, 2.0])
+    fcfs = QueueFactory.create_queue(
+        "MMS", **get_schema("MMS").coerce({"lamb": 3.0, "mu": 4.0, "s": 2})
+    ).calculate_metrics()
+
+    assert priority["System"]["Wq"] == pytest.approx(fcfs["Wq"], abs=0.005)
+
+
+def test_lamb_list_matches_legacy_parameters():
+    legacy = _metrics("MCPCIS", mu=4.0, s=2, lamb1=1.0, lamb2=0.5, lamb3=1.5)
+    listed = _metrics("MCPCIS", mu=4.0, s=2, lamb_list=[1.0, 0.5, 1.5])
+
+    assert legacy == listed
+
+
+def test_more_than_four_classes():
+    metrics = _metrics("MCPCI", mu=10.0, lamb_list=[1.0] * 6)
+
+    assert list(metrics) == [f"Class {i}" for i in range(1, 7)] + ["System"]
+
+
+@pytest.mark.parametrize("model_type", ["MCPCI", "MCPCIS", "MCPSI"])
+@pytest.mark.parametrize("extra", [{}, {"lamb_list": []}, {"lamb_list": [0, 0]}])
+def test_all_idle_classes_are_rejected(client, model_type, extra):
+    payload = {"model_type": model_type, "mu": 4, "s": 1 if model_type == "MCPCI" else 2}
+    response = client.post("/api/calculate", json={**payload, **extra})
+
+    assert response.status_code == 400
+    assert "λi > 0" in response.get_json()["error"]
@@ -0,0 +1,51 @@
+import inspect
+
+import pytest
+
+from models.queue_factory import QueueFactory
+from models.registry import MODEL_REGISTRY, get_schema
+
+
+@pytest.mark.parametrize("model_type", list(MODEL_REGISTRY))
+def test_every_schema_parameter_reaches_the_constructor(model_type):
+    schema = get_schema(model_type)
+    accepted = inspect.signature(schema.model_class.__init__).parameters
+
+    assert schema.names <= set(accepted)
+    assert schema.required <= schema.names
+    assert QueueFactory.get_model_info(model_type) == schema.info()
+
+
+def test_coerce_fills_defaults_and_converts_text():
+    params = get_schema("MMS").coerce({"lamb": "3", "mu": "2.5", "s": "4.0", "x": 1})
+
+    assert params == {
+        "lamb": 3.0, "mu": 2.5, "s": 4, "k": 0, "n": 0, "r": 0, "t": 0.0,
+    }
+    assert isinstance(params["s"], int)
+
+
+@pytest.mark.parametrize(
+    "data,message",
+    [
+        ({"lamb": 1}, "obrigatórios ausentes para o modelo MMS: mu, s"),
+        ({"lamb": 1, "mu": "", "s": 2}, "ausentes para o modelo MMS: mu"),
+        ({"lamb": 1, "mu": 2, "s": 2.5}, "'s' inválido"),
+        ({"lamb": 1, "mu": 0, "s": 2}, "'mu' deve ser maior que 0"),
+        ({"lamb": -1, "mu": 2, "s": 2}, "'lamb' deve ser maior ou igual a 0"),
+    ],
+)
+def test_coerce_errors(data, message):
+    with pytest.raises(ValueError, match=message):
+        get_schema("MMS").coerce(data)
+
+
+def test_lamb_list_accepts_text():
+    params = get_schema("MCPCI").coerce({"mu": 4, "lamb_list": "1, 2,3"})
+
+    assert params["lamb_list"] == [1.0, 2.0, 3.0]
+
+
+def test_unknown_model():
+    with pytest.raises(ValueError, match="não suportado"):
+        get_schema("MMX")
@@ -0,0 +1,59 @@
+import pytest
+
+from simulation.replication import RunningStatistics, run_replications
+
+
+def test_merge_equals_sequential_accumulation():
+    values = [1.0, 4.0, 2.5, 7.0, 3.0, 0.5]
+    sequential, left, right = RunningStatistics(), RunningStatistics(), RunningStatistics()
+    for value in values:
+        sequential.add(value)
+    for value in values[:2]:
+        left.add(value)
+    for value in values[2:]:
+        right.add(value)
+    left.merge(right)
+
+    assert left.count == sequential.count
+    assert left.mean == pytest.approx(sequential.mean)
+    assert left.variance() == pytest.approx(sequential.variance())
+
+
+def test_worker_count_does_not_change_the_estimate():
+    kwargs = dict(max_replications=6, min_replications=6, seed=5, lamb=0.5, mu=1)
+    serial = run_replications("MM1", 2_000, workers=1, **kwargs)
+    parallel = run_replications("MM1", 2_000, workers=2, **kwargs)
+
+    assert parallel["replications"] == serial["replications"] == 6
+    for key, value in serial["metrics"].items():
+        assert parallel["metrics"][key] == pytest.approx(value)
+
+
+def test_stops_once_the_half_width_is_reached():
+    result = run_replications(
+        "MM1", 5_000, target_half_width=0.5, metrics=["L"], seed=1, lamb=0.5, mu=1
+    )
+
+    assert result["converged"]
+    assert result["replications"] < 64
+    assert result["confidence_intervals"]["L"] <= 0.5
+
+
+def test_unknown_metric_is_rejected():
+    with pytest.raises(ValueError, match="Pk"):
+        run_replications(
+            "MM1", 1_000, target_half_width=0.1, metrics=["Pk"], seed=1, lamb=0.5, mu=1
+        )
+
+
+def test_replications_route(client):
+    response = client.post(
+        "/api/simulate/replications",
+        json={"model_type": "MM1", "lamb": 0.5, "mu": 1, "horizon": 1_000,
+              "max_replications": 4, "seed": 2},
+    )
+
+    body = response.get_json()
+    assert response.status_code == 200
+    assert body["replications"] == 4
+    assert "L" in body["metrics"]
@@ -0,0 +1,51 @@
+import pytest
+
+from services.result_cache import ResultCache
+
+
+def test_lru_eviction_keeps_recently_used_keys():
+    cache = ResultCache(max_size=2)
+    cache.get_or_compute("a", lambda: 1)
+    cache.get_or_compute("b", lambda: 2)
+    cache.get_or_compute("a", lambda: pytest.fail("'a' deveria estar em cache"))
+    cache.get_or_compute("c", lambda: 3)
+
+    assert cache.get_or_compute("a", lambda: -1) == 1
+    assert cache.get_or_compute("b", lambda: -2) == -2
+    assert cache.stats()["evictions"] == 2
+
+
+def test_validation_errors_are_cached():
+    cache = ResultCache()
+    calls = []
+
+    def invalid():
+        calls.append(1)
+        raise ValueError("inválido")
+
+    for _ in range(2):
+        with pytest.raises(ValueError, match="inválido"):
+            cache.get_or_compute("x", invalid)
+    assert len(calls) == 1
+    assert cache.stats()["negative_hits"] == 1
+
+
+def test_cached_values_are_copies():
+    cache = ResultCache()
+    cache.get_or_compute("k", lambda: {"L": 1.0})["L"] = 99
+
+    assert cache.get_or_compute("k", dict) == {"L": 1.0}
+
+
+def test_make_key_is_order_independent():
+    first = ResultCache.make_key("MCPCI", {"mu": 1, "lamb_list": [1, 2]})
+    second = ResultCache.make_key("MCPCI", {"lamb_list": [1, 2], "mu": 1})
+
+    assert first == second
+
+
+def test_zero_size_disables_the_cache():
+    cache = ResultCache(max_size=0)
+    cache.get_or_compute("k", lambda: 1)
+
+    assert cache.get_or_compute("k", lambda: 2) == 2
@@ -0,0 +1,80 @@
+import inspect
+import itertools
+
+import pytest
+
+from services import result_store
+from services.result_store import ResultStore, model_version
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "results.sqlite3")
+
+
+def test_results_round_trip(path):
+    store = ResultStore(path)
+    key = ResultStore.make_key("MM1", {"lamb": 1.0, "mu": 2.0})
+
+    store.put(key, "MM1", {"L": 1.0, "W": 1.0})
+
+    assert store.get(key) == {"L": 1.0, "W": 1.0}
+    assert store.get_many([key, "ausente"]) == {key: {"L": 1.0, "W": 1.0}}
+    assert store.stats()["hits"] == 2
+    assert store.stats()["misses"] == 1
+
+
+def test_results_survive_reopening(path):
+    key = ResultStore.make_key("MMS", {"lamb": 3.0, "mu": 1.0, "s": 4})
+    first = ResultStore(path)
+    first.put(key, "MMS", {"Lq": 1.53})
+    first.close()
+
+    reopened = ResultStore(path)
+
+    assert reopened.get(key) == {"Lq": 1.53}
+    assert reopened.stats()["size"] == 1
+
+
+def test_least_recently_accessed_results_are_evicted(path, monkeypatch):
+    clock = itertools.count()
+    monkeypatch.setattr(result_store.time, "time", lambda: float(next(clock)))
+    store = ResultStore(path, max_entries=10)
+    for i in range(10):
+        store.put(f"k{i}", "MM1", i)
+    store.get("k0")  # Acesso recente protege k0
+
+    store.put("k10", "MM1", 10)
+
+    # Excesso de 1 mais a folga de 10% de 10 entradas
+    assert store.stats()["evictions"] == 2
+    assert store.get_many(f"k{i}" for i in range(11)).keys() == {
+        "k0", *(f"k{i}" for i in range(3, 11))
+    }
+
+
+def test_version_covers_the_imported_model_modules():
+    sources = dict(result_store._module_sources("models.mcpci"))
+
+    assert {"models.mcpci", "models.priority", "models.base_queue"} <= set(sources)
+    assert "models.mms" not in sources
+
+
+def test_changing_a_dependency_changes_the_version(monkeypatch):
+    model_version.cache_clear()
+    before = model_version("MMS")
+    unrelated = model_version("MM1")
+    original = inspect.getsource
+
+    def edited(module):
+        source = original(module)
+        return source + "\n# alterado\n" if module.__name__ == "models.erlang" else source
+
+    monkeypatch.setattr(result_store.inspect, "getsource", edited)
+    model_version.cache_clear()
+    try:
+        assert model_version("MMS") != before
+        assert model_version("MM1") == unrelated
+    finally:
+        monkeypatch.undo()
+        model_version.cache_clear()
@@ -0,0 +1,36 @@
+import pytest
+
+from models.queue_factory import QueueFactory
+from models.registry import get_schema
+from models.schedule import schedule_metrics
+
+
+def test_constant_schedule_from_steady_state_stays_there():
+    params = get_schema("MMSK").coerce({"lamb": 3.0, "mu": 1.0, "s": 2, "k": 6})
+    model = QueueFactory.create_queue("MMSK", **params)
+    stationary = model.calculate_distribution()
+
+    result = schedule_metrics(
+        "MMSK", [3.0] * 3, 1.0, 6, s_schedule=2, initial=stationary
+    )
+
+    assert result["L"] == pytest.approx([model.calculate_metrics()["L"]] * 3, abs=1e-4)
+    assert result["final_distribution"] == pytest.approx(stationary, abs=1e-9)
+
+
+def test_schedules_chain_through_the_final_distribution():
+    lambs, servers = [1.0, 4.0, 2.0], [1, 3, 2]
+    whole = schedule_metrics("MMSK", lambs, 1.0, 8, s_schedule=servers)
+    first = schedule_metrics("MMSK", lambs[:1], 1.0, 8, s_schedule=servers[:1])
+    rest = schedule_metrics(
+        "MMSK", lambs[1:], 1.0, 8, s_schedule=servers[1:],
+        initial=first["final_distribution"],
+    )
+
+    assert whole["L"] == pytest.approx(first["L"] + rest["L"])
+    assert whole["final_distribution"] == pytest.approx(rest["final_distribution"])
+
+
+def test_server_schedule_length_must_match():
+    with pytest.raises(ValueError):
+        schedule_metrics("MMSK", [1.0, 2.0], 1.0, 5, s_schedule=[2])
@@ -0,0 +1,61 @@
+import pytest
+
+from models.mcpsi import MCPSI
+from models.mm1k import MM1K
+from models.mmsn import MMSN
+from simulation.engine import simulate
+
+
+def test_mm1_simulation_brackets_the_analytic_mean():
+    result = simulate("MM1", 20_000, warmup=500, seed=7, lamb=0.5, mu=1)
+
+    # M/M/1 com ρ = 0,5: L = 1 e W = 2
+    assert result["metrics"]["L"] == pytest.approx(1.0, rel=0.1)
+    assert result["metrics"]["W"] == pytest.approx(2.0, rel=0.1)
+    assert result["truncated"] is False
+
+
+def test_mm1k_blocking_matches_the_model():
+    result = simulate("MM1K", 20_000, warmup=500, seed=3, lamb=0.9, mu=1, k=3)
+    p3 = MM1K(0.9, 1, 3, 1, 0).calculate_distribution()[3]
+
+    assert result["metrics"]["Pk"] == pytest.approx(p3, abs=0.02)
+
+
+def test_event_cap_is_reported_as_truncation():
+    result = simulate(
+        "MM1", 100_000, seed=1, batches=10, max_events=50_000, lamb=0.5, mu=1
+    )
+
+    assert result["truncated"] is True
+    assert result["events"] == 50_000
+    assert result["time"] < 100_000
+
+
+def test_same_seed_reproduces_the_run():
+    first = simulate("MMS", 2_000, seed=11, lamb=2, mu=1, s=3)
+    second = simulate("MMS", 2_000, seed=11, lamb=2, mu=1, s=3)
+
+    assert first["metrics"] == second["metrics"]
+
+
+def test_finite_population_matches_mmsn():
+    result = simulate("MMSN", 50_000, warmup=500, seed=5, lamb=0.1, mu=1, s=3, N=20)
+    expected = MMSN(0.1, 1, 0, 3, 1, 20).calculate_metrics()
+
+    assert result["metrics"]["L"] == pytest.approx(expected["L"], rel=0.05)
+    assert result["metrics"]["W"] == pytest.approx(expected["W"], rel=0.05)
+
+
+def test_priority_classes_match_the_non_preemptive_model():
+    lamb_list = [0.4, 0.4, 0.4]
+    result = simulate("MCPSI", 50_000, warmup=500, seed=2, mu=1, s=2, lamb_list=lamb_list)
+    expected = MCPSI(0, 1, 0, 2, lamb_list=lamb_list).calculate_metrics()
+
+    for c in (1, 2, 3):
+        simulated = result["metrics"][f"Class {c}"]
+        assert simulated[f"W{c}"] == pytest.approx(expected[f"Class {c}"][f"W{c}"], rel=0.05)
+        # L pela lei de Little com a vazão observada da classe
+        assert simulated[f"L{c}"] == pytest.approx(
+            lamb_list[c - 1] * simulated[f"W{c}"], rel=0.05
+        )
@@ -0,0 +1,72 @@
+import threading
+import time
+
+import pytest
+
+from asgi import _flight_key
+from services.singleflight import SingleFlight
+
+
+def test_concurrent_callers_share_one_computation():
+    flights = SingleFlight()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        time.sleep(0.05)
+        return {"L": 1.0}
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(flights.do("key", compute)))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert results == [{"L": 1.0}] * 8
+    assert len({id(result) for result in results}) == 8  # Cada um recebe uma cópia
+    assert flights.stats()["shared"] == 7
+
+
+def test_waiters_receive_the_leader_error():
+    flights = SingleFlight()
+    started = threading.Event()
+    errors = []
+
+    def compute():
+        started.set()
+        time.sleep(0.05)
+        raise ValueError("falhou")
+
+    def call():
+        try:
+            flights.do("key", compute)
+        except ValueError as e:
+            errors.append(str(e))
+
+    leader = threading.Thread(target=call)
+    leader.start()
+    started.wait()
+    waiter = threading.Thread(target=call)
+    waiter.start()
+    leader.join()
+    waiter.join()
+
+    assert errors == ["falhou", "falhou"]
+
+
+def test_flight_key_uses_the_coerced_parameters():
+    raw = _flight_key("MM1", {"model_type": "MM1", "lamb": "1", "mu": 2, "junk": 1})
+    typed = _flight_key("MM1", {"lamb": 1.0, "mu": 2.0, "k": 0, "s": 1})
+
+    assert raw == typed
+    assert _flight_key("MM1", {"lamb": 1, "mu": 2, "distribution": True}) != typed
+
+
+def test_flight_key_rejects_invalid_parameters():
+    with pytest.raises(ValueError):
+        _flight_key("MM1", {"lamb": "abc", "mu": 2})
@@ -0,0 +1,56 @@
+import warnings
+
+import numpy as np
+import pytest
+
+from models.optimizer import MIN_SERVERS, minimum_servers
+from models.staffing import _erlang_tail, staffing_schedule
+
+DEMAND = [2.0, 8.0, 15.0, 5.0]
+
+
+def test_each_interval_gets_the_minimum_mms_staffing():
+    result = staffing_schedule("MMS", DEMAND, 1.0, target_wq=0.1)
+
+    for lamb, s in zip(DEMAND, result["s"]):
+        assert s == minimum_servers("MMS", lamb, 1.0, target_wq=0.1)["s"]
+
+
+def test_mmsk_matches_the_finite_optimizer():
+    result = staffing_schedule("MMSK", DEMAND, 1.0, target_pwq=0.2, t=0.5, k=40)
+
+    for lamb, s, pwq in zip(DEMAND, result["s"], result["pwq"]):
+        expected = minimum_servers("MMSK", lamb, 1.0, target_pwq=0.2, t=0.5, k=40)
+        assert s == expected["s"]
+        assert pwq == pytest.approx(expected["pwq"])
+
+
+@pytest.mark.parametrize("model_type,extra", [("MMS", {}), ("MMSK", {"k": 30})])
+def test_low_demand_still_gets_the_minimum_number_of_servers(model_type, extra):
+    result = staffing_schedule(model_type, [0.1, 0.5], 1.0, target_wq=0.5, **extra)
+
+    assert result["s"] == [MIN_SERVERS, MIN_SERVERS]
+
+
+@pytest.mark.parametrize("model_type,extra", [("MMS", {}), ("MMSK", {"k": 30})])
+def test_zero_t_is_the_probability_of_waiting(model_type, extra):
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        result = staffing_schedule(
+            model_type, DEMAND, 1.0, target_pwq=0.3, t=0.0, **extra
+        )
+
+    assert all(0 < pwq <= 0.3 for pwq in result["pwq"])
+
+
+def test_erlang_tail_at_zero_time_is_silent():
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        tail = _erlang_tail(np.array([0, 1, 4]), 0.0)
+
+    assert tail.tolist() == [0.0, 1.0, 1.0]
+
+
+def test_unreachable_target_names_the_interval():
+    with pytest.raises(ValueError, match="intervalos: 2"):
+        staffing_schedule("MMS", DEMAND, 1.0, target_wq=0.01, s_max=16)
@@ -0,0 +1,44 @@
+import json
+
+import pytest
+
+from services.streaming import NDJSON_MIMETYPE, json_safe, ndjson_lines
+
+
+def _lines(response):
+    return [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+
+
+def test_json_safe_follows_the_route_conventions():
+    row = {"a": float("inf"), "b": [float("nan"), -float("inf")], "c": 1.5}
+
+    assert json_safe(row) == {"a": "infinity", "b": [None, "-infinity"], "c": 1.5}
+    assert list(ndjson_lines([{"x": 1}, {"x": 2}])) == ['{"x": 1}\n', '{"x": 2}\n']
+
+
+def test_batch_stream_matches_the_buffered_response(client):
+    items = [
+        {"model_type": "MM1", "lamb": 1, "mu": 2},
+        {"model_type": "MM1", "lamb": 3, "mu": 2},
+    ]
+    buffered = client.post("/api/calculate/batch", json={"items": items}).get_json()
+    streamed = client.post("/api/calculate/batch", json={"items": items, "stream": True})
+
+    assert streamed.mimetype == NDJSON_MIMETYPE
+    lines = _lines(streamed)
+    assert [line.pop("index") for line in lines] == [0, 1]
+    assert lines == buffered["results"]
+
+
+def test_calculate_streams_the_distribution_after_the_metrics(client):
+    response = client.post(
+        "/api/calculate",
+        json={"model_type": "MM1K", "lamb": 1, "mu": 2, "k": 3, "distribution": True},
+        headers={"Accept": NDJSON_MIMETYPE},
+    )
+
+    lines = _lines(response)
+    assert lines[0]["success"] and "P0" in lines[0]["metrics"]
+    states = lines[1:]
+    assert [line["n"] for line in states] == [0, 1, 2, 3]
+    assert sum(line["p"] for line in states) == pytest.approx(1.0)
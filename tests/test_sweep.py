@@ -0,0 +1,134 @@
+import csv
+import io
+
+import pytest
+
+from models.queue_factory import QueueFactory
+from services.sweep import csv_fieldnames, csv_lines, evaluate_grid
+
+GRID = {"lamb": [1.0, 2.0, 3.0], "mu": 1.0, "s": 5, "n": 2, "t": 0.5}
+
+# Pontos válidos, um por modelo, para conferir as colunas do CSV
+VALID_POINTS = {
+    "MM1": {"lamb": 0.5, "mu": 1.0},
+    "MMS": {"lamb": 1.0, "mu": 1.0, "s": 2},
+    "MM1K": {"lamb": 0.5, "mu": 1.0, "k": 3},
+    "MM1N": {"lamb": 0.1, "mu": 1.0, "N": 5, "n": 1},
+    "MMSK": {"lamb": 1.0, "mu": 1.0, "s": 2, "k": 4},
+    "MMSN": {"lamb": 0.1, "mu": 1.0, "s": 2, "N": 5, "n": 1},
+    "MG1": {"lamb": 0.5, "mu": 1.0, "var": 1.0},
+    "GGS": {"lamb": 1.0, "mu": 2.0},
+    "MCPCI": {"mu": 1.0, "lamb_list": [[0.1, 0.2, 0.3]]},
+    "MCPSI": {"mu": 1.0, "s": 2, "lamb_list": [[0.1, 0.2]]},
+    "MCPCIS": {"mu": 1.0, "s": 2, "lamb_list": [[0.1, 0.2]]},
+}
+
+
+def _csv(model_type, grid):
+    lines = csv_lines(evaluate_grid(model_type, grid), csv_fieldnames(model_type, grid))
+    return list(csv.DictReader(io.StringIO("".join(lines))))
+
+
+def _assert_same_rows(model_type, grid):
+    vectorized = list(evaluate_grid(model_type, grid))
+    scalar = list(evaluate_grid(model_type, grid, vectorized=False))
+
+    assert [list(row) for row in vectorized] == [list(row) for row in scalar]
+    for fast, slow in zip(vectorized, scalar):
+        for key, value in slow.items():
+            if isinstance(value, float):
+                assert fast[key] == pytest.approx(value, abs=0.011), key
+            else:
+                assert fast[key] == value, key
+    return vectorized
+
+
+def test_vectorized_and_scalar_rows_match():
+    _assert_same_rows("MMS", GRID)
+
+
+@pytest.mark.parametrize(
+    "model_type, grid",
+    [
+        ("MM1", {"lamb": 0.5, "mu": 1.0, "s": [1, 2]}),
+        ("MM1", {"lamb": [0.5, 2.0], "mu": 1.0, "k": [0, 3]}),
+        ("MMS", {"lamb": 1.0, "mu": 1.0, "s": [1, 2, 2.5, "3", "x"]}),
+        ("MMS", {"lamb": [1.0, -1.0], "mu": [1.0, 0.0], "s": 2, "n": [-1, 2]}),
+        ("MMSK", {"lamb": 1.0, "mu": 1.0, "s": 2, "k": [1.5, 4, -1]}),
+        ("MG1", {"lamb": [0.5, 2.0], "mu": 1.0, "s": [1, 3], "var": [0.5, None]}),
+    ],
+)
+def test_both_paths_give_the_same_rows_and_errors(model_type, grid):
+    _assert_same_rows(model_type, grid)
+
+
+def test_points_the_vectorized_kernel_ignores_are_not_dropped():
+    rows = _assert_same_rows("MM1", {"lamb": 0.5, "mu": 1.0, "s": [1, 2]})
+
+    assert "error" not in rows[0]
+    assert "s = 1" in rows[1]["error"]
+
+
+def test_non_integer_servers_are_rejected_in_both_paths():
+    rows = _assert_same_rows("MMS", {"lamb": 1.0, "mu": 1.0, "s": [2, 2.5]})
+
+    assert "L" in rows[0]
+    assert "inteiro" in rows[1]["error"]
+
+
+@pytest.mark.parametrize("model_type", list(VALID_POINTS))
+def test_csv_header_matches_the_model_metrics(model_type):
+    grid = VALID_POINTS[model_type]
+    point = {
+        name: value[0] if isinstance(value, list) else value for name, value in grid.items()
+    }
+    params = QueueFactory.build_params(model_type, point)
+    metrics = QueueFactory.create_queue(model_type, **params).calculate_metrics()
+    flat = [
+        f"{group}.{name}" if isinstance(values, dict) else group
+        for group, values in metrics.items()
+        for name in (values if isinstance(values, dict) else [None])
+    ]
+
+    assert csv_fieldnames(model_type, grid) == list(grid) + flat + ["error"]
+
+
+def test_csv_header_is_written_before_any_row_is_evaluated():
+    consumed = []
+
+    def rows():
+        consumed.append(True)
+        yield {"lamb": 0.5, "mu": 1.0, "L": 1.0}
+
+    lines = csv_lines(rows(), ["lamb", "mu", "L", "error"])
+
+    assert next(lines) == "lamb,mu,L,error\r\n"
+    assert not consumed
+    assert next(lines) == "0.5,1.0,1.0,\r\n"
+
+
+def test_csv_header_survives_an_invalid_first_point():
+    rows = _csv("MM1", {"lamb": [2.0, 0.5], "mu": 1.0})
+
+    assert list(rows[0]) == [
+        "lamb", "mu", "Rho", "P0", "Pn", "Pr", "L", "Lq", "W", "Wq", "pw", "pwq",
+        "error",
+    ]
+    assert rows[0]["error"] and rows[0]["L"] == ""
+    assert rows[1]["L"] == "1.0" and rows[1]["error"] == ""
+
+
+def test_csv_with_only_invalid_points_keeps_the_metric_columns():
+    rows = _csv("MM1", {"lamb": [2.0, 3.0], "mu": 1.0})
+
+    assert [row["error"] for row in rows] == ["Sistema instável: ρ deve ser menor que 1."] * 2
+    assert all(row["L"] == "" for row in rows)
+
+
+def test_priority_columns_cover_the_longest_class_list():
+    fields = csv_fieldnames("MCPCI", {"mu": 1.0, "lamb_list": [[0.1], [0.1, 0.2, 0.3]]})
+
+    assert "Class 3.Lq3" in fields and "Class 4.W4" not in fields
+    assert fields[-6:] == [
+        "System.Rho", "System.W", "System.Wq", "System.L", "System.Lq", "error",
+    ]
@@ -0,0 +1,46 @@
+from math import exp
+
+import numpy as np
+import pytest
+
+from models.queue_factory import QueueFactory
+from models.registry import get_schema
+from models.transient import birth_death_rates, propagate, transient_metrics
+
+
+def test_two_state_chain_matches_the_closed_form():
+    lamb, mu = 2.0, 3.0
+    times = [0.1, 0.5, 2.0]
+    result = transient_metrics("MM1K", times, lamb, mu, k=1)
+
+    for t, pk in zip(times, result["Pk"]):
+        assert pk == pytest.approx(lamb / (lamb + mu) * (1 - exp(-(lamb + mu) * t)))
+
+
+@pytest.mark.parametrize(
+    "model_type,params",
+    [("MMSK", {"s": 3, "k": 10}), ("MMSN", {"s": 2, "N": 8})],
+)
+def test_long_horizon_reaches_the_stationary_distribution(model_type, params):
+    result = transient_metrics(
+        model_type, [200.0], 0.8, 1.0, distribution=True, **params
+    )
+    full = get_schema(model_type).coerce({"lamb": 0.8, "mu": 1.0, "n": 1, **params})
+    stationary = QueueFactory.create_queue(model_type, **full).calculate_distribution()
+
+    assert result["distribution"][0] == pytest.approx(stationary, abs=1e-8)
+
+
+def test_time_grid_is_chained_from_the_previous_instant():
+    birth, death = birth_death_rates("MMSK", 4.0, 1.0, s=2, k=6)
+    start = np.zeros(7)
+    start[3] = 1.0
+    direct = propagate(start, birth, death, 1.5)
+    chained = transient_metrics("MMSK", [0.5, 1.5], 4.0, 1.0, s=2, k=6, initial=3)
+
+    assert chained["L"][-1] == pytest.approx(np.arange(7) @ direct)
+
+
+def test_times_must_increase():
+    with pytest.raises(ValueError):
+        transient_metrics("MM1K", [1.0, 0.5], 1.0, 2.0, k=3)
@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+
+from models.queue_factory import QueueFactory
+from models.registry import get_schema
+from models.vectorized import evaluate
+
+CASES = [
+    ("MM1", {"lamb": 0.8, "mu": 1.0}),
+    ("MMS", {"lamb": 3.0, "mu": 1.0, "s": 5}),
+    ("MM1K", {"lamb": 0.8, "mu": 1.0, "k": 10}),
+    ("MMSK", {"lamb": 3.0, "mu": 1.0, "s": 4, "k": 12}),
+    ("MG1", {"lamb": 0.8, "mu": 1.0, "var": 0.5}),
+    ("MMS", {"lamb": 3.0, "mu": 1.0, "s": 4, "n": 6, "r": 2, "t": 1.0}),
+    ("MMSK", {"lamb": 3.0, "mu": 1.0, "s": 2, "k": 5, "n": 4}),
+    ("GGS", {"lamb": 1.0, "mu": 2.0, "s": 2, "ca2": 0.5}),
+]
+
+
+@pytest.mark.parametrize("model_type,params", CASES)
+def test_vectorized_matches_scalar(model_type, params):
+    full = get_schema(model_type).coerce(params)
+    scalar = QueueFactory.create_queue(model_type, **full).calculate_metrics()
+    vector = evaluate(model_type, **{k: np.array([v]) for k, v in params.items()})
+
+    assert list(vector) == list(scalar)
+    for key in scalar:
+        # As classes escalares arredondam em 2 ou 4 casas
+        assert vector[key][0] == pytest.approx(scalar[key], abs=0.006), key
+
+
+def test_vectorized_marks_unstable_points_as_nan():
+    metrics = evaluate("MMS", lamb=np.array([3.0, 6.0]), mu=1.0, s=5)
+
+    assert np.isfinite(metrics["L"][0])
+    assert np.isnan(metrics["L"][1])
+
+
+def test_vectorized_rejects_unknown_model():
+    with pytest.raises(ValueError):
+        evaluate("MM1N", lamb=[1.0], mu=[2.0])
+
+
+@pytest.mark.parametrize(
+    "model_type,grid",
+    [
+        (
+            "MMS",
+            {
+                "lamb": [0.5, 3.0, 40.0],
+                "mu": 1.0,
+                "s": [2, 5, 50],
+                "n": [0, 3, 60],
+                "r": [0, 2, 70],
+            },
+        ),
+        (
+            "MMSK",
+            {
+                "lamb": [0.5, 30.0, 40.0],
+                "mu": 1.0,
+                "s": [2, 5, 50],
+                "k": [1, 12, 60],
+                "n": [0, 3, 55],
+            },
+        ),
+    ],
+)
+def test_mixed_server_counts_match_scalar(model_type, grid):
+    vector = evaluate(model_type, **{k: np.array(v) for k, v in grid.items()})
+
+    for i in range(3):
+        point = {k: v[i] if isinstance(v, list) else v for k, v in grid.items()}
+        full = get_schema(model_type).coerce(point)
+        scalar = QueueFactory.create_queue(model_type, **full).calculate_metrics()
+        for key in scalar:
+            assert vector[key][i] == pytest.approx(scalar[key], abs=0.006), (i, key)